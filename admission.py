@@ -0,0 +1,122 @@
+import contextlib
+import math
+import threading
+import time
+
+# Admission control for document rendering. Each render holds a parsed
+# template tree (several MB of lxml objects), so at most `limit` run at once;
+# up to `max_queue` more wait for a slot for at most `timeout` seconds and the
+# rest are turned away with Overloaded. Only the renders are gated: requests
+# that never build a document (chat, pricing, cache hits) are never held up.
+
+class Overloaded(Exception):
+    def __init__(self, reason, retry_after):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+class RenderGate:
+    def __init__(self, limit, max_queue, timeout):
+        self.limit = limit  # 0 admits everything
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.in_flight = 0
+        self.queued = 0
+        self.peak_in_flight = 0
+        self.peak_queued = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self._render_seconds = None  # moving average, for Retry-After
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        with self._cond:
+            if self.limit and (self.in_flight >= self.limit or self.queued):
+                if self.queued >= self.max_queue:
+                    self.rejected += 1
+                    raise Overloaded("render queue is full", self._retry_after())
+                self.queued += 1
+                self.peak_queued = max(self.peak_queued, self.queued)
+                deadline = time.monotonic() + self.timeout
+                try:
+                    while self.in_flight >= self.limit:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            self.timed_out += 1
+                            # A release may have woken this waiter just as it
+                            # gave up; pass the wakeup on to the next one
+                            self._cond.notify()
+                            raise Overloaded("timed out waiting for a render slot", self._retry_after())
+                        self._cond.wait(remaining)
+                finally:
+                    self.queued -= 1
+            self.in_flight += 1
+            self.admitted += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def release(self, seconds=None):
+        with self._cond:
+            self.in_flight -= 1
+            if seconds is not None:
+                if self._render_seconds is None:
+                    self._render_seconds = seconds
+                else:
+                    self._render_seconds += 0.2 * (seconds - self._render_seconds)
+            self._cond.notify()
+
+    @contextlib.contextmanager
+    def slot(self):
+        self.acquire()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.release(time.perf_counter() - start)
+
+    def hold(self, chunks):
+        # Keeps one slot for a whole streamed response: taken now, so an
+        # overloaded server can still answer 503, and given back when the
+        # response is closed, even if the client left before the first chunk
+        self.acquire()
+        return _Held(self, chunks)
+
+    def _retry_after(self):
+        # Seconds until the queue ahead has likely drained, at least one
+        per_render = self._render_seconds or 1.0
+        return max(1, math.ceil((self.queued + 1) * per_render / max(self.limit, 1)))
+
+    def stats(self):
+        with self._cond:
+            return {
+                "limit": self.limit,
+                "max_queue": self.max_queue,
+                "timeout": self.timeout,
+                "in_flight": self.in_flight,
+                "queued": self.queued,
+                "peak_in_flight": self.peak_in_flight,
+                "peak_queued": self.peak_queued,
+                "admitted": self.admitted,
+                "rejected": self.rejected,
+                "timed_out": self.timed_out,
+                "avg_render_ms": round(self._render_seconds * 1000, 1) if self._render_seconds else None,
+            }
+
+class _Held:
+    def __init__(self, gate, chunks):
+        self._gate = gate
+        self._chunks = chunks
+        self._held = True
+
+    def __iter__(self):
+        try:
+            yield from self._chunks
+        finally:
+            self.close()
+
+    def close(self):
+        if self._held:
+            self._held = False
+            if hasattr(self._chunks, "close"):
+                self._chunks.close()
+            self._gate.release()
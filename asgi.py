@@ -0,0 +1,112 @@
+import asyncio
+import json
+
+from a2wsgi import WSGIMiddleware
+from flask import render_template
+
+from app import app as flask_app, warm_up
+import chat
+
+# Async serving mode: `uvicorn asgi:app --host 0.0.0.0 --port $PORT`.
+# /chat, / and /healthz are answered on the event loop; every other request
+# runs the Flask app in a bounded thread pool, so a few slow renders can't
+# hold up chat. The pool is sized like the gunicorn threads: room for every
+# admitted and queued render plus spare threads for the light routes.
+
+THREADS = int(flask_app.config["MAX_RENDERS"] + flask_app.config["MAX_RENDER_QUEUE"] + 8)
+
+_wsgi = WSGIMiddleware(flask_app, workers=THREADS)
+_index_pages = {}  # root path -> rendered form.html
+
+def _index_page(root_path):
+    page = _index_pages.get(root_path)
+    if page is None:
+        with flask_app.test_request_context("/", base_url=f"http://localhost{root_path}/"):
+            page = _index_pages[root_path] = render_template("form.html").encode("utf-8")
+    return page
+
+async def _respond(send, status, body, content_type, headers=()):
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [(b"content-type", content_type), (b"content-length", str(len(body)).encode()), *headers],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+def _json(payload):
+    return f"{flask_app.json.dumps(payload, separators=(',', ':'))}\n".encode("utf-8")
+
+async def _read_body(receive):
+    chunks = []
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            return None
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body"):
+            return b"".join(chunks)
+
+def _replay(body, receive):
+    # Hands an already-read body on to the WSGI app
+    sent = False
+
+    async def replay():
+        nonlocal sent
+        if sent:
+            return await receive()
+        sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    return replay
+
+def _is_json(scope):
+    for name, value in scope["headers"]:
+        if name == b"content-type":
+            mimetype = value.split(b";")[0].strip().lower()
+            return mimetype == b"application/json" or (mimetype.startswith(b"application/") and mimetype.endswith(b"+json"))
+    return False
+
+async def _chat(scope, receive, send):
+    body = await _read_body(receive)
+    if body is None:
+        return
+    try:
+        data = json.loads(body) if _is_json(scope) else None
+    except ValueError:
+        data = None
+    if not isinstance(data, dict) or not data:
+        # Anything unusual gets Flask's own handling and errors
+        return await _wsgi(scope, _replay(body, receive), send)
+    raw = data.get("message", "")
+    raw = raw if isinstance(raw, str) else str(raw)
+    _, reply, elapsed = chat.answer(raw)
+    await _respond(
+        send, 200, _json({"reply": reply}), b"application/json",
+        [(b"server-timing", chat.server_timing(elapsed).encode())],
+    )
+
+async def _lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            # Before the first connection is accepted
+            await asyncio.get_running_loop().run_in_executor(None, warm_up)
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+async def app(scope, receive, send):
+    if scope["type"] == "lifespan":
+        return await _lifespan(receive, send)
+    if scope["type"] == "http":
+        path, method, root_path = scope["path"], scope["method"], scope.get("root_path", "")
+        if root_path and path.startswith(root_path):
+            path = path[len(root_path):] or "/"
+        if path == "/chat" and method == "POST" and "chat" in flask_app.blueprints:
+            return await _chat(scope, receive, send)
+        if path == "/" and method == "GET" and "quotes" in flask_app.blueprints:
+            return await _respond(send, 200, _index_page(root_path), b"text/html; charset=utf-8")
+        if path == "/healthz" and method == "GET":
+            return await _respond(send, 200, _json({"status": "ok"}), b"application/json")
+    await _wsgi(scope, receive, send)
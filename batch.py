@@ -0,0 +1,98 @@
+import csv
+import io
+import json
+import logging
+import os
+
+import docx_package
+import pricing
+import quotation
+
+# Many quotes in one go: form values from JSON or CSV, each rendered exactly
+# like /generate. stream_zip() yields the archive member by member, so only
+# the quote being rendered is held in memory; per-item errors go into
+# manifest.json at the end of the archive instead of failing the batch.
+
+log = logging.getLogger(__name__)
+
+FIELDS = ["storage_type", "volume", "days", "wms", "commodity"]
+
+def read_csv(text):
+    return list(csv.DictReader(io.StringIO(text.lstrip("\ufeff"))))
+
+def read_jsonl(text):
+    return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+def price_item(values):
+    # (quote, commodity) for one set of form values
+    if not hasattr(values, "get"):
+        raise ValueError("expected an object with the form fields")
+    storage_type, volume, days, include_wms = pricing.parse(values)
+    commodity = values.get("commodity") or ""
+    if not isinstance(commodity, str):
+        raise ValueError("commodity must be a string")
+    return pricing.compute(storage_type, volume, days, include_wms), commodity.strip()
+
+def render_quote(quote, commodity, today_str, engine="docx", passthrough=True):
+    buffer = io.BytesIO()
+    quotation.render(
+        quote["storage_type"], quotation.placeholders(quote, commodity, today_str), buffer,
+        engine=engine, passthrough=passthrough,
+    )
+    blob = buffer.getvalue()
+    # A document with a placeholder left in it is not a quotation
+    unfilled = quotation.unfilled_placeholders(blob)
+    if unfilled:
+        raise ValueError(f"placeholders left unfilled: {', '.join(unfilled)}")
+    return blob
+
+def render_item(values, today_str, engine="docx", passthrough=True):
+    # (download name, .docx bytes, quote) for one set of form values
+    quote, commodity = price_item(values)
+    blob = render_quote(quote, commodity, today_str, engine, passthrough)
+    return quotation.download_name(commodity), blob, quote
+
+def member_name(filename, seen):
+    # Flat, unique names: one commodity quoted twice gets Quotation_x_2.docx
+    name = filename.replace("/", "_").replace("\\", "_")
+    stem, ext = os.path.splitext(name)
+    n = 1
+    while name.lower() in seen:
+        n += 1
+        name = f"{stem}_{n}{ext}"
+    seen.add(name.lower())
+    return name
+
+def stream_zip(items, today_str, engine="docx", passthrough=True):
+    def entries():
+        seen = {"manifest.json"}
+        manifest = []
+        for index, values in enumerate(items):
+            record = {"index": index}
+            try:
+                filename, blob, quote = render_item(values, today_str, engine, passthrough)
+            except (TypeError, ValueError) as e:
+                record["error"] = str(e)
+            except Exception as e:
+                log.exception("Batch item %d failed to render", index)
+                record["error"] = f"render failed: {e}"
+            else:
+                record.update(
+                    file=member_name(filename, seen),
+                    storage_type=quote["storage_type"],
+                    total_fee=quote["total_fee"],
+                    currency=quote["currency"],
+                )
+                yield record["file"], docx_package.stored(blob)
+            manifest.append(record)
+        failed = sum("error" in record for record in manifest)
+        yield "manifest.json", docx_package.deflate(json.dumps({
+            "date": today_str,
+            "engine": engine,
+            "count": len(manifest),
+            "rendered": len(manifest) - failed,
+            "failed": failed,
+            "items": manifest,
+        }, ensure_ascii=False, indent=2).encode("utf-8"))
+
+    return docx_package.stream_entries(entries())
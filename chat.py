@@ -0,0 +1,1678 @@
+from flask import Blueprint, current_app, jsonify, request
+import atexit
+import click
+import hashlib
+import random
+import re
+import threading
+import time
+try:
+    from re import _constants as _sre, _parser as _sre_parse
+except ImportError:  # Python < 3.11
+    import sre_constants as _sre, sre_parse as _sre_parse
+
+import rates
+from reply_cache import ReplyCache
+
+# The chat assistant behind /chat: an ordered table of intents, each a list
+# of patterns and a reply, compiled once at import. A message is normalised
+# and the first rule that matches it answers. Nothing here imports the
+# quotation side, so a chat-only deployment (APP_PROFILE=chat) never loads
+# python-docx.
+
+bp = Blueprint("chat", __name__, cli_group=None)
+
+reply_cache = None
+
+@bp.record_once
+def _setup(state):
+    global reply_cache
+    config = state.app.config
+    if config["CHAT_CACHE_MAX_ENTRIES"] <= 0:
+        return
+    reply_cache = ReplyCache(config["CHAT_CACHE_MAX_ENTRIES"], _replies_version())
+    if config["CHAT_CACHE_SNAPSHOT"]:
+        reply_cache.load(config["CHAT_CACHE_SNAPSHOT"])
+        atexit.register(_save_snapshot, config["CHAT_CACHE_SNAPSHOT"], config["CHAT_CACHE_SNAPSHOT_ENTRIES"])
+
+_compile_start = time.perf_counter()
+
+# --- Normalisation ---
+
+# A short greeting on the first line is answered before anything else
+_GREETING_RE = re.compile(r"^(hi|hello|hey|good (morning|evening))\b", re.I)
+GREETING = "Hello! I'm here to help with anything related to DSV logistics, transport, or warehousing."
+
+# Applied in order to the lowercased message (see normalize() below)
+_REWRITES = [(re.compile(pattern), replacement) for pattern, replacement in [
+    # Common chat language
+    (r"\bu\b", "you"),
+    (r"\bur\b", "your"),
+    (r"\br\b", "are"),
+    (r"how\s*r\s*u", "how are you"),
+    (r"\bpls\b", "please"),
+    (r"\bplz\b", "please"),
+    (r"\bthx\b", "thanks"),
+    (r"\binfo\b", "information"),
+    (r"\bassist\b", "help"),
+    (r"\bhru\b", "how are you"),
+    (r"\bh\s*r\s*u\b", "how are you"),
+    (r"how\s*u\s*doing", "how are you"),
+    (r"\bhw\b", "how"),
+    (r"\bwht\b", "what"),
+    (r"\bcn\b", "can"),
+    (r"\bwhats up\b", "how are you"),
+    (r"\bwho r u\b", "who are you"),
+
+    # Logistics & warehouse short forms
+    (r"\bwh\b", "warehouse"),
+    (r"\bw/w\b", "warehouse"),
+    (r"\bw\/h\b", "warehouse"),
+    (r"\binv\b", "inventory"),
+    (r"\btemp zone\b", "temperature zone"),
+    (r"\btemp\b", "temperature"),
+    (r"\bwms system\b", "wms"),
+    (r"\bwms\b", "warehouse management system"),
+
+    # Transportation & locations
+    (r"\brak\b", "ras al khaimah"),
+    (r"\babudhabi\b", "abu dhabi"),
+    (r"\bdxb\b", "dubai"),
+    (r"\bdubaii\b", "dubai"),
+    (r"\bdubal\b", "dubai"),
+    (r"\bdubia\b", "dubai"),
+    (r"\babu dabi\b", "abu dhabi"),
+    (r"\bt&c\b", "terms and conditions"),
+    (r"\bt and c\b", "terms and conditions"),
+
+    # Industry abbreviations
+    (r"\bo&g\b", "oil and gas"),
+    (r"\bdg\b", "dangerous goods"),
+    (r"\bfmcg\b", "fast moving consumer goods"),
+
+    # Quotation & VAS
+    (r"\bdoc\b", "documentation"),
+    (r"\bdocs\b", "documentation"),
+    (r"\bmsds\b", "material safety data sheet"),
+    (r"\bvas\b", "value added services"),
+    (r"\bquote\b", "quotation"),
+    (r"\bquation\b", "quotation"),
+    (r"\bquotatoin\b", "quotation"),
+    (r"\boffer\b", "quotation"),
+    (r"\bproposal\b", "quotation"),
+    (r"\bproposl\b", "quotation"),
+    (r"\bvases\b", "value added services"),
+    (r"\bvalus added services\b", "value added services"),
+
+    # E-commerce variations
+    (r"\be[\s\-]?commerce\b", "ecommerce"),
+    (r"\bshop logistics\b", "ecommerce"),
+
+    # Logistics models
+    (r"\b3\.5pl\b", "three and half pl"),
+    (r"\b2pl\b", "second party logistics"),
+    (r"\b3pl\b", "third party logistics"),
+    (r"\b4pl\b", "fourth party logistics"),
+    (r"\b5pl\b", "fifth party logistics"),
+    (r"\b6pl\b", "sixth party logistics"),
+
+    # Fleet & vehicle types
+    (r"\breefer truck\b|\bchiller truck\b|\bcold truck\b", "refrigerated truck"),
+    (r"\bchiller\b", "refrigerated truck"),
+    (r"\bcity truck\b", "small truck"),
+    (r"\bev truck\b", "electric truck"),
+    (r"\bcity delivery\b", "last mile"),
+    (r"\btransprt\b", "transport"),
+    (r"\btrnasport\b", "transport"),
+    (r"\bmachineries\b", "machinery"),
+    (r"\bmhe\b", "material handling equipment"),
+    (r"\breefer\s+tr+ucks?\b", "reefer truck"),
+    (r"\breefer truck\b", "reefer truck"),
+
+    # Container unit typos & variants
+    (r"\b20feet\b", "20 ft"),
+    (r"\b20foot\b", "20 ft"),
+    (r"\b20feet container\b", "20 ft container"),
+    (r"\b20ft\b", "20 ft"),
+    (r"\brefeer\b", "reefer"),
+    (r"\bchilled container\b", "reefer container"),
+    (r"\b40feet\b", "40 ft"),
+    (r"\b40foot\b", "40 ft"),
+    (r"\b40feet container\b", "40 ft container"),
+    (r"\b40ft\b", "40 ft"),
+
+    # Fire system
+    (r"\bfm200\b", "fm 200"),
+
+    # Misc business terms
+    (r"\bkitting\b", "kitting and assembly"),
+    (r"\btagging\b", "labeling"),
+    (r"\basset tagging\b", "asset labeling"),
+    (r"\btransit store\b", "transit warehouse"),
+    (r"\basset mgmt\b", "asset management"),
+    (r"\bmidday break\b", "summer break"),
+    (r"\bwharehouse\b", "warehouse"),
+    (r"\bwmsytem\b", "wms"),
+    (r"\bopen yrd\b", "open yard"),
+    (r"\bstorge\b", "storage"),
+    (r"\bstorag\b", "storage"),
+    (r"\bchecmical\b", "chemical"),
+    (r"\bstandrad\b", "standard"),
+    (r"\blabelling\b", "labeling"),
+
+    # Strip non-alphanumeric except spaces and periods
+    (r"[^a-z0-9\s\.]", ""),
+]]
+
+def _rewrite(s):
+    for pattern, replacement in _REWRITES:
+        s = pattern.sub(replacement, s)
+    return s
+
+def normalize_sequential(s):
+    # The rewrites one after another, as listed: the reference normalize()
+    # is checked against (`flask compare-normalizers`)
+    return _rewrite(s.lower().strip())
+
+def _literal_words(pattern):
+    # r"\bw\/h\b|\bwh\b" -> ["w/h", "wh"]; None for anything more regex-like
+    words = []
+    for part in pattern.split("|"):
+        m = re.fullmatch(r"\\b((?:[a-z0-9 &/]|\\[./&-])+)\\b", part)
+        if not m:
+            return None
+        words.append(re.sub(r"\\(.)", r"\1", m.group(1)))
+    return words
+
+def _trie_pattern(words):
+    # One alternation shaped like a prefix tree, so matching at a position
+    # follows the characters instead of trying every word in turn. Longer
+    # words are tried first; the closing \b backs off to a shorter one.
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def branch(node):
+        alternatives = [re.escape(char) + branch(child) for char, child in sorted(node.items()) if char]
+        if not alternatives:
+            return ""
+        body = "(?:" + "|".join(alternatives) + ")" if len(alternatives) > 1 else alternatives[0]
+        return f"(?:{body})?" if "" in node else body
+
+    return branch(trie)
+
+def _word_boundary(text, i):
+    # Whether \b matches at index i of text
+    before = i > 0 and (text[i - 1].isalnum() or text[i - 1] == "_")
+    after = i < len(text) and (text[i].isalnum() or text[i] == "_")
+    return before != after
+
+def _overlaps(words):
+    # Text in which two rewrites overlap ("w/w/h"), or in which what one
+    # writes runs into another ("refeer truck" -> "reefer truck"). Which one
+    # wins there depends on their order in the list, not their position.
+    found = set()
+    for a in words:
+        for text in {a, _rewrite(a)}:
+            # A rewrite of a word inside another is part of the outer one's
+            # replacement, not an overlap
+            longest = len(text) if text != a else len(a) - 1
+            for b in words:
+                for k in range(1, min(longest, len(b) - 1) + 1):
+                    if text.endswith(b[:k]) and _word_boundary(text, len(text) - k):
+                        found.add(a + b[k:])
+                    if text.startswith(b[-k:]) and _word_boundary(text, k):
+                        found.add(b[:-k] + a)
+    return found
+
+# normalize() scans a message once with all the rewrites combined: the
+# literal ones (nearly all) as one prefix tree, next to the final clean-up.
+# Each matched fragment is replaced by what the whole ordered list turns it
+# into on its own, so chains like "wms system" -> "wms" -> "warehouse
+# management system" and precedence like "temp zone" before "temp" come out
+# exactly as listed, from a lookup table built here.
+#
+# That only holds where fragments don't interact. A message with a regex
+# rewrite in it (how\s*r\s*u would take the "u" of "units"), or with text
+# where two rewrites overlap, goes through the list in order instead; those
+# are rare, so the single pass covers nearly all messages.
+_REWRITE_WORDS = []
+_REWRITE_PATTERNS = []  # single characters, matched the same in any context
+_CONTEXT_PATTERNS = []
+for _pattern, _ in _REWRITES:
+    _words = _literal_words(_pattern.pattern)
+    if _words is not None:
+        _REWRITE_WORDS += _words
+    elif re.fullmatch(r"\[[^\]]*\]", _pattern.pattern):
+        _REWRITE_PATTERNS.append(_pattern.pattern)
+    else:
+        _CONTEXT_PATTERNS.append(_pattern.pattern)
+_OVERLAPS = sorted(_overlaps(_REWRITE_WORDS))
+_COMBINED_RE = re.compile("|".join(_REWRITE_PATTERNS + [r"\b(?:" + _trie_pattern(_REWRITE_WORDS) + r")\b"]))
+_CONTEXT_RE = re.compile("|".join(
+    _CONTEXT_PATTERNS + ([r"\b(?:" + _trie_pattern(_OVERLAPS) + r")\b"] if _OVERLAPS else [])
+))
+_FRAGMENTS = {word: _rewrite(word) for word in _REWRITE_WORDS}
+_MAX_FRAGMENTS = len(_FRAGMENTS) + 4096
+
+def _replace(m):
+    text = m.group()
+    replacement = _FRAGMENTS.get(text)
+    if replacement is None:
+        replacement = _rewrite(text)
+        if len(_FRAGMENTS) < _MAX_FRAGMENTS:
+            _FRAGMENTS[text] = replacement
+    return replacement
+
+def normalize(s):
+    s = s.lower().strip()
+    if _CONTEXT_RE.search(s):
+        return _rewrite(s)
+    return _COMBINED_RE.sub(_replace, s)
+
+def normalizer_samples(fuzz, seed=0):
+    # Messages to check normalize() against normalize_sequential() with:
+    # every rewrite on its own and next to every other one, then `fuzz`
+    # random strings of rewrite words, pieces of them and separators
+    separators = [" ", "", "  ", "\t", "-", "&", "/", ".", "?", " ", " "]
+    samples = list(_REWRITE_WORDS)
+    for a in _REWRITE_WORDS:
+        for b in _REWRITE_WORDS:
+            samples += [a + separator + b for separator in separators[:3]]
+    # The words the regex rewrites are made of ("how", "r", "u", "doing")
+    # are few, so they get a pool of their own
+    regex_words = sorted(set().union(*(
+        re.findall(r"[a-z]+", re.sub(r"\\.", " ", pattern)) for pattern in _REWRITE_PATTERNS + _CONTEXT_PATTERNS
+    )))
+    pieces = sorted({
+        word[i:j] for word in _REWRITE_WORDS + regex_words
+        for i in range(len(word)) for j in range(i + 1, len(word) + 1)
+    })
+    pools = [regex_words, regex_words, _REWRITE_WORDS, pieces]
+    rng = random.Random(seed)
+    for _ in range(fuzz):
+        samples.append("".join(
+            rng.choice(rng.choice(pools)) + rng.choice(separators)
+            for _ in range(rng.randint(1, 8))
+        ))
+    return samples
+
+# --- Rules ---
+
+class Rule:
+    __slots__ = ("intent", "patterns", "unless", "reply")
+
+    def __init__(self, intent, patterns, reply, unless=None):
+        self.intent = intent
+        self.patterns = [re.compile(pattern) for pattern in patterns]
+        self.unless = re.compile(unless) if unless else None
+        # Text, or a function of the message returning text (None: no answer)
+        self.reply = reply
+
+    def answer(self, message):
+        if not any(pattern.search(message) for pattern in self.patterns):
+            return None
+        if self.unless is not None and self.unless.search(message):
+            return None
+        return self.reply(message) if callable(self.reply) else self.reply
+
+def _catalogue(name, *args):
+    # Rendered from the rate catalogue when asked, so rate edits show at once
+    return lambda message: rates.reply(name, *args)
+
+_CHAMBER_RE = re.compile(r"ch(?:amber)?\s*(\d+)")
+_CHAMBER_CLIENTS = {
+    1: "Khalifa University",
+    2: "PSN (Federal Authority of Protocol and Strategic Narrative)",
+    3: "Food clients & fast-moving items",
+    4: "MCC, TR, and ADNOC",
+    5: "PSN",
+    6: "ZARA & TR",
+    7: "Civil Defense and the RMS",
+}
+
+def _chamber_client(message):
+    ch_num = _CHAMBER_RE.search(message)
+    if not ch_num:
+        return None
+    chamber = int(ch_num.group(1))
+    if chamber in _CHAMBER_CLIENTS:
+        return f"Chamber {chamber} is occupied by {_CHAMBER_CLIENTS[chamber]}."
+    return f"I don't have data for Chamber {chamber}."
+
+# ===== Compare only requested PLs (1PL/2PL/3PL/3.5PL/4PL/5PL/6PL) =====
+_PL_ALIASES = {
+    code: [re.compile(pattern) for pattern in patterns]
+    for code, patterns in {
+        "1PL": [r"\b1pl\b", r"\bfirst party logistics\b"],
+        "2PL": [r"\b2pl\b", r"\bsecond party logistics\b"],
+        "3PL": [r"\b3pl\b", r"\bthird party logistics\b"],
+        "3.5PL": [r"\b3\.?5pl\b", r"\bthree and half pl\b", r"\b3pl plus\b", r"\bmiddle of 3pl and 4pl\b"],
+        "4PL": [r"\b4pl\b", r"\bfourth party logistics\b"],
+        "5PL": [r"\b5pl\b", r"\bfifth party logistics\b"],
+        "6PL": [r"\b6pl\b", r"\bsixth party logistics\b"],
+    }.items()
+}
+
+def _extract_pl_mentions(msg):
+    found = []
+    for code, pats in _PL_ALIASES.items():
+        pos = None
+        for p in pats:
+            m = p.search(msg)
+            if m:
+                pos = m.start() if pos is None else min(pos, m.start())
+        if pos is not None:
+            found.append((code, pos))
+    found.sort(key=lambda x: x[1])
+    ordered = []
+    for code, _ in found:
+        if code not in ordered:
+            ordered.append(code)
+    return ordered
+
+_PL_DEF = {
+    "1PL": {"title": "1PL — First-Party Logistics", "bullets": [
+        "Owner of goods does everything in-house (warehouse, trucks, staff, systems).",
+        "Max control, but higher CAPEX/OPEX and expertise needed."
+    ]},
+    "2PL": {"title": "2PL — Second-Party Logistics", "bullets": [
+        "Asset/capacity provider (trucks, space, vessels). Client still runs operations.",
+        "You rent capacity; processes and planning stay with you."
+    ]},
+    "3PL": {"title": "3PL — Third-Party Logistics", "bullets": [
+        "Outsourced execution: warehousing, transport, order fulfillment, VAS.",
+        "Provider runs ops under your strategy/KPIs; WMS/TMS operated by provider."
+    ]},
+    "3.5PL": {"title": "3.5PL — Hybrid (between 3PL & 4PL)", "bullets": [
+        "Provider handles operations + some planning/analytics/CI.",
+        "More orchestration than 3PL, not a full lead-logistics role."
+    ]},
+    "4PL": {"title": "4PL — Fourth-Party Logistics", "bullets": [
+        "Lead logistics integrator managing multiple 3PLs/carriers, network design, and strategy.",
+        "Single point of contact; end-to-end governance and optimization."
+    ]},
+    "5PL": {"title": "5PL — Fifth-Party Logistics", "bullets": [
+        "Orchestrates networks-of-networks via platforms; heavy data & automation.",
+        "Outcome-based management across several 3PL/4PL providers."
+    ]},
+    "6PL": {"title": "6PL — Sixth-Party Logistics (emerging)", "bullets": [
+        "AI-driven/autonomous orchestration (digital twins, predictive planning, autonomous assets).",
+        "Vision/early adoption rather than a widely standardised operating model."
+    ]},
+}
+
+def _short_contrast(pls):
+    order = ["1PL","2PL","3PL","3.5PL","4PL","5PL","6PL"]
+    rank = {k:i for i,k in enumerate(order)}
+    pls_sorted = sorted(pls, key=lambda k: rank.get(k, 99))
+    parts = []
+    for k in pls_sorted:
+        if k == "1PL": parts.append("client in-house")
+        elif k == "2PL": parts.append("provider assets only")
+        elif k == "3PL": parts.append("provider runs execution")
+        elif k == "3.5PL": parts.append("exec + some strategy")
+        elif k == "4PL": parts.append("lead-logistics orchestration")
+        elif k == "5PL": parts.append("platform multi-network")
+        elif k == "6PL": parts.append("autonomous/AI orchestration")
+    return " → ".join(parts)
+
+def _compare_pls(message):
+    # Only the PLs asked about, in the order they were mentioned
+    asked = _extract_pl_mentions(message)
+    if len(asked) < 2:
+        return None
+    lines = ["**Comparison — " + " vs ".join(asked) + "**\n"]
+    for code in asked:
+        d = _PL_DEF.get(code)
+        if not d:
+            continue
+        lines.append(f"🔹 **{d['title']}**")
+        for b in d["bullets"]:
+            lines.append(f"- {b}")
+        lines.append("")
+    lines.append(f"**In short:** {_short_contrast(asked)}.")
+    return "\n".join(lines)
+
+# First match wins, so the order matters
+RULES = [
+    # --- Containers (All Types + Flexible Unit Recognition) ---
+    Rule("container_20ft", [
+        r"\b20\s*(ft|feet|foot)\b", r"\btwenty\s*(ft|feet|foot)?\b",
+        r"\b20 ft\b.*", r".*20.*container.*", r"container.*20 ft", r"^20 ft$", r"^20 feet$", r"20ft spec"
+    ], (
+        "📦 **20ft Container Specs**:\n"
+        "- Length: 6.1m\n"
+        "- Width: 2.44m\n"
+        "- Height: 2.59m\n"
+        "- Capacity: ~33 CBM\n"
+        "- Max Payload: ~28,000 kg\n\n"
+        "Ideal for compact or heavy cargo like pallets, boxes, or general freight."
+    )),
+    Rule("container_40ft", [
+        r"\b40\s*(ft|feet|foot)\b", r"\bforty\s*(ft|feet|foot)?\b",
+        r"\b40 ft\b.*", r".*40.*container.*", r"container.*40 ft", r"^40 ft$", r"^40 feet$", r"40ft spec"
+    ], (
+        "📦 **40ft Container Specs**:\n"
+        "- Length: 12.2m\n"
+        "- Width: 2.44m\n"
+        "- Height: 2.59m\n"
+        "- Capacity: ~67 CBM\n"
+        "- Max Payload: ~30,400 kg\n\n"
+        "Perfect for palletized or high-volume cargo. Widely used for full truckload and global sea freight."
+    )),
+    Rule("container_high_cube", [
+        r"\bhighcube\b", r"high cube", r"40\s*(ft|feet|foot)\s*high cube",
+        r"high cube container", r"40ft.*high cube", r"high cube spec", r"taller container"
+    ], (
+        "⬆️ **40ft High Cube Container Specs**:\n\n"
+        "- Same length/width as standard 40ft:\n"
+        "  • Length: 12.2m\n"
+        "  • Width: 2.44m\n"
+        "- **Height: 2.9m** (vs 2.59m standard)\n"
+        "- Capacity: ~76 CBM\n\n"
+        "**Ideal for voluminous cargo** where height matters — such as light bulk goods, furniture, or machines requiring upright transport."
+    )),
+    Rule("container_reefer", [
+        r"\breefer\b", r"reefer container", r"refrigerated container", r"chiller container",
+        r"cold storage container", r"reefer.*(20|40)ft", r"reefer specs", r"reefer box"
+    ], (
+        "❄️ **Reefer (Refrigerated) Containers**:\n\n"
+        "- Available in **20ft** and **40ft** sizes\n"
+        "- Insulated with temperature control: **+2°C to –25°C**\n"
+        "- Used for: food, pharmaceuticals, perishables\n"
+        "- Plug-in units with cooling system (electric or diesel)\n\n"
+        "**Specs Example (40ft Reefer):**\n"
+        "- Length: 12.2m, Width: 2.44m, Height: 2.59m\n"
+        "- Capacity: ~67 CBM\n\n"
+        "Let me know if you want 20ft specs or details for sea/road use!"
+    )),
+    Rule("container_open_top", [
+        r"open top container", r"open top", r"top open", r"open roof", r"no roof container",
+        r"container.*open top", r"container.*no roof", r"crane loaded container", r"top loading container"
+    ], (
+        "🏗 **Open Top Container Specs**:\n\n"
+        "- Length: 20ft or 40ft\n"
+        "- No solid roof — uses removable tarpaulin cover\n"
+        "- Same base dimensions as standard container\n"
+        "- Allows top loading via crane or forklift\n\n"
+        "**Used for:**\n"
+        "- Tall cargo (e.g., pipes, steel coils, machinery)\n"
+        "- Oversized height loads\n"
+        "- Construction or industrial freight requiring vertical access"
+    )),
+    Rule("container_flat_rack", [r"flat rack", r"no sides container", r"flat rack container"], "Flat Rack containers have no sides or roof, perfect for oversized cargo such as vehicles, generators, or heavy equipment."),
+    Rule("container_sme", [r"\bsme\b", r"sme container", r"what is sme", r"sme size", r"sme container size"], "In logistics, **SME** usually refers to Small and Medium Enterprises, but in UAE context, 'SME container' can also mean modular containers customized for SME use — often used for short-term cargo storage or small-scale import/export."),
+    Rule("containers", [
+        r"\bcontainers?\b", r"container types", r"types of containers",
+        r"container sizes", r"container overview", r"container specs", r"container info"
+    ], "📦 Here are the main container types and their specs: 20ft, 40ft, High Cube, Reefer, Flat Rack, Open Top, SME... Let me know which you'd like in detail."),
+
+    # --- Pallet Types, Sizes, and Positions ---
+    Rule("pallets", [
+        r"\bpallets\b", r"pallet types", r"types of pallets", r"pallet size", r"pallet sizes", r"pallet dimensions",
+        r"standard pallet", r"euro pallet", r"pallet specs", r"tell me about pallets",
+        r"what.*pallet.*used", r"pallet info", r"pallet.*per bay"
+    ], (
+        "DSV uses two main pallet types in its 21K warehouse:\n\n"
+        "🟦 **Standard Pallet**:\n- Size: 1.2m × 1.0m\n- Load capacity: ~1,000 kg\n- Fits **14 pallets per bay**\n\n"
+        "🟨 **Euro Pallet**:\n- Size: 1.2m × 0.8m\n- Load capacity: ~800 kg\n- Fits **21 pallets per bay**\n\n"
+        "Pallets are used for racking, picking, and transport. DSV also offers VAS like pallet loading, shrink wrapping, labeling, and stretch film wrapping for safe handling."
+    )),
+
+    # --- All Storage Rates at Once (catch "all rates") ---
+    Rule("storage_rates_all", [
+        r"^all\s+rates?$",
+        r"^all\s+storage\s+rates?$",
+        r"^full\s+rates?$",
+        r"^complete\s+rates?$",
+        r"^show\s*all\s*rates$",
+        r"all.*storage.*rates?",
+        r"complete.*storage.*rates?",
+        r"all.*rates?",
+        r"list.*storage.*fees",
+        r"storage.*rate.*overview",
+        r"summary.*storage.*rates?",
+        r"show.*all.*storage.*charges",
+        r"storage.*rates?.*all",
+        r"rates?\s*for\s*all\s*storage"
+    ], _catalogue("storage_overview")),
+
+    # --- Storage Rate Initial Question ---
+    Rule("storage_rates", [
+        r"storage rate[s]?$", r"\brates\b", r"storage", r"storage cost",
+        r"how much.*storage", r"quotation.*storage only", r"rates", r"rate",
+        r"pricing of storage", r"cost of storage", r"rate for storage", r"all storage rates"
+    ], "Which type of storage are you asking about? Standard, Chemicals, or Open Yard?", unless=r"(vas|value added|reefer|refrigerated truck|truck|trailer|lowbed|flatbed|tipper|box truck)"),
+
+    # --- Standard Storage Follow-ups ---
+    Rule("standard_storage", [r"^standard$", r"standard storage"], "Do you mean Standard AC, Standard Non-AC, or Open Shed?"),
+    Rule("standard_ac_rate", [r"standard ac", r"ac standard", r"standard ac storage"], _catalogue("storage", "AC")),
+    Rule("standard_non_ac_rate", [r"standard non ac", r"non ac standard", r"standard non ac storage"], _catalogue("storage", "Non-AC")),
+    Rule("ac_rate", [r"^ac$", r"\bstandard ac\b", r"ac storage", r"ac only"], _catalogue("storage", "AC")),
+    Rule("non_ac_rate", [r"^non ac$", r"\bstandard non ac\b", r"non-ac storage", r"non ac only"], _catalogue("storage", "Non-AC")),
+    Rule("open_shed_rate", [r"^shed$", r"open shed", r"shed storage", r"open shed only", r"standard open shed", r"open shed storage rate"], _catalogue("storage", "Open Shed")),
+
+    # --- Chemical Storage Follow-ups ---
+    Rule("chemical_storage", [r"^chemical$", r"^chemicals$", r"chemicals storage only", r"chemical storage only"], "Do you mean Chemical AC or Chemical Non-AC?"),
+    Rule("chemical_ac_rate", [r"chemical ac", r"ac chemical", r"chemical ac storage", r"chemical ac storage rate", r"^chemical ac$"], _catalogue("storage", "Chemicals AC")),
+    Rule("chemical_non_ac_rate", [r"chemical non ac", r"non ac chemical", r"chemical non ac storage", r"chemical non ac rate", r"^chemical non ac$"], _catalogue("storage", "Chemicals Non-AC")),
+
+    # --- Open Yard Overview ---
+    Rule("open_yard_overview", [
+        r"tell me about open yard", r"open yard info", r"open yard overview", r"what is open yard",
+        r"open yard introduction", r"open yard facility", r"describe open yard"
+    ], lambda message: (
+        "🏗️ **DSV Open Yard Overview:**\n\n"
+        + rates.reply("open_yard_site", "Open Yard – Mussafah")
+        + rates.reply("open_yard_site", "Open Yard – KIZAD")
+        + "- 🔲 Total Area: **360,000 SQM** across both sites\n"
+          "- ✅ Ideal for containers, equipment, heavy goods\n"
+          "- 🔧 VAS includes forklifts, cranes, and lifting services\n\n"
+          "📧 For availability, contact Antony Jeyaraj at **antony.jeyaraj@dsv.com**"
+    )),
+
+    # --- Open Yard Storage ---
+    Rule("open_yard_storage", [r"^open yard$", r"open yard storage", r"open yard rate", r"open yard storage rate"], "Do you mean Open Yard in Mussafah or KIZAD?"),
+    Rule("open_yard_mussafah_rate", [r"open yard mussafah", r"mussafah open yard", r"rate.*mussafah open yard", r"^mussafah$"], lambda message: rates.reply("storage", "Open Yard – Mussafah") + " For availability, contact Antony Jeyaraj at antony.jeyaraj@dsv.com."),
+    Rule("open_yard_kizad_rate", [r"open yard kizad", r"kizad open yard", r"rate.*kizad open yard", r"^kizad$"], lambda message: rates.reply("storage", "Open Yard – KIZAD") + " For availability, contact Antony Jeyaraj at antony.jeyaraj@dsv.com."),
+
+    # General VAS prompt if user just says 'vas' / 'vas rates'
+    Rule("vas_prompt", [
+        r"^vas$",
+        r"^vas\s*rates?$",
+        r"^value\s*added\s*services$",
+        r"^value\s*added\s*service$",
+        r"^vas\s*details$"
+    ], (
+        "Which VAS do you need?\n\n"
+        "🟦 Type **Standard VAS** for AC/Non-AC/Open Shed\n"
+        "🧪 Type **Chemical VAS** for hazmat/chemicals\n"
+        "🏗 Type **Open Yard VAS** for forklifts/cranes"
+    )),
+
+    # --- VAS: Aggregate / Prompt ---
+    Rule("vas_all", [
+        r"^all\s*vas(?:es)?\s*(rates|list)?$",
+        r"^give\s*me\s*all\s*vas(?:es)?\s*(rates|list)?$",
+        r"^show\s*all\s*vas(?:es)?",
+        r"^complete\s*vas\s*(rates|list)?$",
+        r"^full\s*vas\s*(rates|list)?$",
+        r"all.*value\s*added\s*services",
+        r"vas.*(full|all|complete).*"
+    ], _catalogue("vas_overview")),
+
+    # --- All Storage Rates at Once ---
+    Rule("storage_rates_summary", [
+        r"\ball\s+storage\s+rates?\b",
+        r"\b(all|complete|full)\b.*\bstorage\b.*\brates?\b",
+        r"\bsummary\b.*\bstorage\b.*\brates?\b",
+        r"\blist\b.*\bstorage\b.*\b(fees|rates?)\b",
+        r"\bshow\b.*\ball\b.*\bstorage\b.*\b(charges|rates?)\b",
+    ], _catalogue("storage_overview"), unless="value added services"),
+
+    # --- VAS rates ---
+    Rule("vas_standard", [
+        r"standard vas", r"standard", r"standard value added services", r"normal vas", r"normal value added services",
+        r"handling charges", r"pallet charges", r"vas for ac", r"value added services for ac",
+        r"vas for non ac", r"value added services for non ac",
+        r"vas for open shed", r"value added services for open shed"
+    ], _catalogue("vas", "standard")),
+    Rule("vas_chemical", [
+        r"chemical vas", r"chemical value added services",
+        r"vas for chemical", r"value added services for chemical",
+        r"hazmat vas", r"hazmat value added services",
+        r"dangerous goods vas", r"dangerous goods value added services"
+    ], _catalogue("vas", "chemical")),
+    Rule("vas_open_yard", [
+        r"open yard vas", r"open yard", r"open yard value added services", r"yard equipment",
+        r"forklift rate", r"crane rate", r"container lifting", r"yard charges"
+    ], _catalogue("vas", "open_yard")),
+    Rule("vas_standard_short", [r"^standard$", r"standard vas", r"standard value added services", r"standard service"], _catalogue("vas", "standard", True)),
+    Rule("vas_chemical_short", [r"^chemical$", r"chemical vas", r"chemical value added services", r"chemical service"], _catalogue("vas", "chemical", True)),
+    Rule("vas_open_yard_short", [r"^open yard$", r"open yard vas", r"open yard value added services", r"yard vas"], _catalogue("vas", "open_yard", True)),
+
+    # --- 21K Warehouse ---
+    Rule("rack_height", [r"rack height|rack levels|pallets per bay|racking"], "21K warehouse racks are 12m tall with 6 pallet levels. Each bay holds 14 Standard pallets or 21 Euro pallets."),
+    Rule("warehouse_21k", [r"\b21k\b", r"tell me about 21k", r"what is 21k", r"21k warehouse", r"21k dsv", r"main warehouse", r"mussafah.*21k"], (
+        "21K is DSV’s main warehouse in Mussafah, Abu Dhabi. It is 21,000 sqm with a clear height of 15 meters. The facility features:\n"
+        "- 3 rack types: Selective, VNA, and Drive-in\n"
+        "- Rack height: 12m with 6 pallet levels\n"
+        "- Aisle widths: Selective (2.95–3.3m), VNA (1.95m), Drive-in (2.0m)\n"
+        "- 7 chambers used by clients like ADNOC, ZARA, PSN, and Civil Defense\n"
+        "- Fully equipped with fire systems, access control, and RMS for document storage\n"
+        "Chambers range from **1,000–5,000 sqm** and together can accommodate **~35,000 CBM**."
+    )),
+    Rule("gdsp", [r"\bgdsp\b", r"what is gdsp", r"gdsp certified", r"gdsp warehouse", r"gdsp compliance"], "GDSP stands for Good Distribution and Storage Practices. It ensures that warehouse operations comply with global standards for the safe handling, storage, and distribution of goods, especially pharmaceuticals and sensitive materials. DSV’s warehouses in Abu Dhabi are GDSP certified."),
+    Rule("iso", [r"\biso\b", r"what iso", r"iso certified", r"tell me about iso", r"dsv iso", r"which iso standards"], "DSV facilities in Abu Dhabi are certified with multiple ISO standards:\n- **ISO 9001**: Quality Management\n- **ISO 14001**: Environmental Management\n- **ISO 45001**: Occupational Health & Safety\nThese certifications ensure that DSV operates to the highest international standards in safety, service quality, and environmental responsibility."),
+    Rule("gdp", [r"\bgdp\b", r"what is gdp", r"gdp warehouse", r"gdp compliant", r"gdp certified"], "GDP stands for **Good Distribution Practice**, a quality standard for warehouse and transport operations of pharmaceutical products. DSV’s healthcare storage facilities in Abu Dhabi, including the Airport Freezone warehouse, are GDP-compliant, ensuring cold chain integrity, traceability, and regulatory compliance."),
+    Rule("cold_chain", [r"cold chain", r"what.*cold chain", r"cold storage", r"temperature zones", r"what.*chains.*temperature", r"freezer room", r"cold room", r"ambient storage"], (
+        "DSV offers full temperature-controlled logistics including:\n\n"
+        "🟢 **Ambient Storage**: +18°C to +25°C (for general FMCG, electronics, and dry goods)\n"
+        "🔵 **Cold Room**: +2°C to +8°C (for pharmaceuticals, healthcare, and food products)\n"
+        "🔴 **Freezer Room**: –22°C (for frozen goods and sensitive biological materials)\n\n"
+        "Our warehouses in Abu Dhabi are equipped with temperature monitoring, backup power, and GDP-compliant systems to maintain cold chain integrity."
+    )),
+    Rule("rms", [r"\brms\b", r"record management system", r"document storage", r"storage of files", r"paper storage"], (
+        "RMS (Record Management System) at DSV is located inside the 21K warehouse in Mussafah. It is used to store and manage physical documents, archives, and secure records for clients like Civil Defense.\n\n"
+        "The RMS area is equipped with an **FM 200 fire suppression system** for safe document protection. Note: RMS is not used for storing Return Material."
+    )),
+    Rule("asset_management_quotation", [r"quote.*asset", r"quotation.*asset management", r"what.*collect.*client.*asset", r"info.*for.*asset.*quotation"], (
+        "To prepare an **Asset Management** quotation, collect the following from the client:\n"
+        "1️⃣ Type of assets (IT, furniture, tools, etc.)\n"
+        "2️⃣ Quantity and tagging type (barcode or RFID)\n"
+        "3️⃣ Duration of storage or tracking\n"
+        "4️⃣ Reporting/system integration needs\n"
+        "5️⃣ Any relocation, retrieval, or disposal cycles"
+    )),
+    Rule("rfid", [r"^rfid$", r"what is rfid", r"rfid meaning", r"rfid technology"], (
+        "**RFID** stands for *Radio Frequency Identification*. It’s a technology that uses radio waves to automatically identify and track tags attached to objects.\n\n"
+        "At **DSV Abu Dhabi**, RFID is used for:\n"
+        "- Asset tracking and management\n"
+        "- Warehouse inventory visibility\n"
+        "- Automated gate control and access logging\n\n"
+        "RFID tags can be passive (no battery) or active (battery-powered) and can be scanned without direct line of sight."
+    )),
+    Rule("asset_management", [r"asset management", r"what is asset management", r"tracking of assets", r"rfid.*asset"], "DSV offers complete **Asset Management** solutions including:\n- Barcode or RFID tracking\n- Asset labeling\n- Storage and life-cycle monitoring\n- Secure location control\n\nIdeal for IT equipment, tools, calibration items, and government assets."),
+    Rule("asset_labeling", [
+        r"asset labeling", r"asset labelling", r"label assets", r"tagging assets",
+        r"rfid tagging", r"barcode tagging", r"labeling", r"labelling",
+        r"what is labeling", r"labeling service", r"labeling support",
+        r"label.*asset", r"asset.*tag"
+    ], (
+        "DSV provides **Asset Labeling** services using RFID or barcode tags. Labels include:\n"
+        "- Unique ID numbers\n"
+        "- Ownership info\n"
+        "- Scannable codes for inventory and asset tracking\n\n"
+        "These labels are applied during intake or on-site at the client’s location upon request."
+    )),
+    Rule("racks", [
+        r"\brack\b", r"\bracks\b", r"warehouse rack", r"warehouse racks", r"rack types",
+        r"types of racks", r"racking system", r"rack system", r"racking layout", r"rack height",
+        r"rack.*info", r"rack.*design", r"21k.*rack", r"rack.*21k", r"pallet levels"
+    ], (
+        "The 21K warehouse in Mussafah uses 3 racking systems:\n\n"
+        "🔷 **Selective Racking**:\n- Aisle width: 2.95m–3.3m\n- Standard access to all pallets\n\n"
+        "🔷 **VNA (Very Narrow Aisle)**:\n- Aisle width: 1.95m\n- High-density storage with specialized forklifts\n\n"
+        "🔷 **Drive-in Racking**:\n- Aisle width: 2.0m\n- Deep storage for uniform SKUs\n\n"
+        "All racks are **12 meters tall** with **6 pallet levels plus ground**.\n"
+        "Each bay holds:\n- **14 Standard pallets** (1.2m × 1.0m)\n"
+        "- **21 Euro pallets** (1.2m × 0.8m)"
+    )),
+    Rule("pallet_positions", [
+        r"pallet positions", r"pallet position", r"how many.*pallet.*position", r"pallet slots",
+        r"positions per bay", r"rack.*pallet.*position", r"warehouse pallet capacity"
+    ], (
+        "Each rack bay in the 21K warehouse has:\n"
+        "- **6 pallet levels** plus ground\n"
+        "- Fits **14 Standard pallets** or **21 Euro pallets** per bay\n\n"
+        "Across the facility, DSV offers thousands of pallet positions for ambient, VNA, and selective racking layouts. The exact total depends on rack type and client configuration."
+    )),
+    Rule("aisle_width", [
+        r"\baisle\b", r"aisle width", r"width of aisle", r"aisles", r"warehouse aisle",
+        r"vna aisle", r"how wide.*aisle", r"rack aisle width"
+    ], (
+        "Here are the aisle widths used in DSV’s 21K warehouse:\n\n"
+        "🔹 **Selective Racking**: 2.95m – 3.3m\n"
+        "🔹 **VNA (Very Narrow Aisle)**: 1.95m\n"
+        "🔹 **Drive-in Racking**: 2.0m\n\n"
+        "These widths are optimized for reach trucks, VNA machines, and efficient space utilization."
+    )),
+
+    # Short follow-ups like "size", "area", "sqm"
+    Rule("warehouse_sizes_short", [r"^size$", r"^area$", r"^sqm$", r"^m2$", r"^capacity$"], (
+        "📏 **DSV Abu Dhabi warehouse sizes**\n"
+        "- 21K (Mussafah): **21,000 sqm** (main site, 7 chambers)\n"
+        "- M44: **5,760 sqm**\n"
+        "- M45: **5,000 sqm**\n"
+        "- Al Markaz: **12,000 sqm**\n"
+        "- **Total warehouse space** (Abu Dhabi): ~**44,000 sqm**\n"
+        "- **Open yard**: **360,000 sqm**"
+    )),
+    Rule("warehouse_area", [
+        r"\barea\b", r"warehouse area", r"warehouses area", r"warehouse size", r"warehouses size",
+        r"how big.*warehouse", r"storage area", r"facilities", r"facility", r"warehouses", r"warehouse total sqm", r"warehouse.*dimensions"
+    ], (
+        "DSV Abu Dhabi has approximately **44,000 sqm** of total warehouse space, distributed as follows:\n"
+        "- **21K Warehouse (Mussafah)**: 21,000 sqm\n"
+        "- **M44**: 5,760 sqm\n"
+        "- **M45**: 5,000 sqm\n"
+        "- **Al Markaz (Hameem)**: 12,000 sqm\n\n"
+        "Additionally, we have **360,000 sqm** of open yard space, and a total logistics site of **481,000 sqm** including service roads and utilities."
+    )),
+    Rule("warehouse_space", [
+        r"warehouse.*space.*available", r"do you have.*warehouse.*space", r"space in warehouse",
+        r"any warehouse space", r"warehouse availability", r"available.*storage",
+        r"available.*warehouse", r"wh space.*available", r"vacant.*warehouse"
+    ], "For warehouse occupancy, please contact Biju Krishnan at **biju.krishnan@dsv.com**. He’ll assist with availability, allocation, and scheduling a site visit if needed."),
+    Rule("temperature_zones", [
+        r"\btemp\b", r"temperture", r"temperature", r"temperature zones", r"warehouse temp",
+        r"warehouse temperature", r"cold room", r"freezer room", r"ambient temperature",
+        r"temp.*zones", r"how cold", r"cold storage", r"temperature range"
+    ], (
+        "DSV warehouses support three temperature zones:\n\n"
+        "🟢 **Ambient Storage**: +18°C to +25°C — for general cargo and FMCG\n"
+        "🔵 **Cold Room**: +2°C to +8°C — for food and pharmaceuticals\n"
+        "🔴 **Freezer Room**: –22°C — for frozen goods and sensitive materials\n\n"
+        "All temperature-controlled areas are monitored 24/7 and GDP-compliant."
+    )),
+    Rule("chambers", [r"chambers.*21k", r"how many.*chambers", r"warehouse.*layout", r"wh.*layout", r"warehouse.*structure", r"\bchambers\b"], "There are 7 chambers in the 21K warehouse with different sizes and rack types. Chambers range from 1,000–5,000 sqm and together can accommodate ~35,000 CBM."),
+    Rule("packing_material", [r"packing material", r"what packing material", r"materials used for packing"], "DSV uses high-grade packing materials:\n- Shrink wrap (6 rolls per box, 1 roll = 20 pallets)\n- Strapping rolls + buckle kits (1 roll = 20 pallets)\n- Bubble wrap, carton boxes, foam sheets\n- Heavy-duty pallets (wooden/plastic)\nUsed for relocation, storage, and export."),
+    Rule("warehouse_processes", [
+        r"warehouse activities", r"inbound process", r"outbound process", r"wh process",
+        r"warehouse process", r"SOP", r"operation process", r"putaway", r"replenishment",
+        r"picking", r"packing", r"cycle count", r"warehouse operations", r"warehouse workflow",
+        r"\bwh\b.*operation", r"warehouse tasks", r"warehouse flow"
+    ], (
+        "Typical warehouse processes at DSV include:\n\n"
+        "1️⃣ **Inbound**: receiving, inspection, put-away\n"
+        "2️⃣ **Storage**: in racks or bulk zones\n"
+        "3️⃣ **Order Processing**: picking, packing, labeling\n"
+        "4️⃣ **Outbound**: staging, dispatch, transport coordination\n"
+        "5️⃣ **Inventory Control**: cycle counting, stock checks, and returns\n\n"
+        "Additional activities include VAS (Value Added Services), replenishment, and returns management.\n\n"
+        "All operations are fully managed through our INFOR WMS system for visibility, traceability, and efficiency."
+    )),
+    Rule("mhe", [
+        r"\bmhe\b", r"mhe equipment", r"material handling equipment",
+        r"\bmachineries\b", r"\bmachinery\b", r"machines used",
+        r"equipment", r"equipment used", r"warehouse equipment"
+    ], (
+        "DSV uses a wide range of **Material Handling Equipment (MHE)** for efficient warehouse and yard operations, including:\n\n"
+        "- 🚜 Forklifts (3–15T)\n"
+        "- 🎯 VNA (Very Narrow Aisle) machines\n"
+        "- 🤏 Reach Trucks\n"
+        "- 🎯 Pallet Jacks / Hand Pallets\n"
+        "- 🏗️ Cranes for heavy lift\n"
+        "- 📦 Container Lifters / Strippers\n\n"
+        "This equipment supports storage, picking, loading, and transport operations across all DSV Abu Dhabi facilities."
+    )),
+    Rule("dsv_warehouses", [r"dsv warehouse", r"abu dhabi warehouse", r"warehouse facilities"], "DSV Abu Dhabi has 44,000 sqm of warehouse space across 21K, M44, M45, and Al Markaz. Main site is 21K in Mussafah (21,000 sqm, 7 chambers)."),
+
+    # --- What is WMS ---
+    Rule("wms", [r"what is wms|wms meaning|warehouse management system"], "WMS stands for Warehouse Management System. DSV uses INFOR WMS for inventory control, inbound/outbound, and full visibility."),
+    Rule("inventory", [r"\binventory\b", r"inventory management", r"what wms system dsv use", r"inventory control", r"inventory system", r"stock tracking"], "DSV uses INFOR WMS to manage all inventory activities. It provides:\n- Real-time stock visibility\n- Bin-level tracking\n- Batch/serial number control\n- Expiry tracking (for pharma/FMCG)\n- Integration with your ERP system"),
+    Rule("infor", [r"\binfor\b", r"what is infor", r"infor wms", r"who makes wms", r"infor system", r"infor software"], (
+        "INFOR is the software provider of the Warehouse Management System (WMS) used by DSV. "
+        "It supports real-time inventory tracking, barcode scanning, inbound/outbound flow, and integration with ERP systems. "
+        "INFOR WMS is known for its scalability, accuracy, and user-friendly interface for warehouse operations."
+    )),
+    Rule("warehouse_clarify", [
+        r"\bwarehouse\b", r"\bwarehousing\b", r"warehouse info",
+        r"tell me about warehouse", r"warehouse\?"
+    ], "Can you clarify what aspect of the warehouse you're asking about? Size, temp zones, racking, chambers, or something else?", unless=r"(area|size|space|temperature|temp|cold|freezer|wms|dsv|location|rack|21k|chamber|operations|facility|facilities)"),
+
+    # --- Open Yard Space Availability ---
+    Rule("open_yard_space", [
+        r"open yard.*occupancy", r"space.*open yard", r"open yard.*available",
+        r"do we have.*open yard", r"open yard availability", r"open yard.*space",
+        r"yard capacity", r"yard.*vacancy", r"any.*open yard.*space"
+    ], "For open yard occupancy, please contact Antony Jeyaraj at **antony.jeyaraj@dsv.com**. He can confirm available space and assist with pricing or scheduling a visit."),
+    Rule("tapa", [r"\btapa\b", r"tapa certified", r"tapa standard", r"tapa compliance"], "TAPA stands for Transported Asset Protection Association. It’s a global security standard for the safe handling, warehousing, and transportation of high-value goods. DSV follows TAPA-aligned practices for secure transport and facility operations, including access control, CCTV, sealed trailer loading, and secured parking."),
+    Rule("freezone", [r"freezone", r"free zone", r"abu dhabi freezone", r"airport freezone", r"freezone warehouse"], (
+        "DSV operates a GDP-compliant warehouse in the **Abu Dhabi Airport Freezone**, specialized in pharmaceutical and healthcare logistics. It offers:\n"
+        "- Temperature-controlled and cold chain storage\n"
+        "- Customs-cleared import/export operations\n"
+        "- Proximity to air cargo terminals\n"
+        "- Full WMS and track-and-trace integration\n"
+        "This setup supports fast, regulated distribution across the UAE and GCC."
+    )),
+    Rule("qhse", [r"\bqhse\b", r"quality health safety environment", r"qhse policy", r"qhse standards", r"dsv qhse"], (
+        "DSV follows strict QHSE standards across all operations. This includes:\n"
+        "- Quality checks (ISO 9001)\n"
+        "- Health & safety compliance (ISO 45001)\n"
+        "- Environmental management (ISO 14001)\n"
+        "All staff undergo QHSE training, and warehouses are equipped with emergency protocols, access control, firefighting systems, and first-aid kits."
+    )),
+    Rule("hse", [r"\bhse\b", r"health safety environment", r"dsv hse", r"hse policy", r"hse training"], (
+        "DSV places strong emphasis on HSE compliance. We implement:\n"
+        "- Safety inductions and daily toolbox talks\n"
+        "- Fire drills and emergency response training\n"
+        "- PPE usage and incident reporting procedures\n"
+        "- Certified HSE officers across sites\n"
+        "We’re committed to zero harm in the workplace."
+    )),
+    Rule("training", [r"training", r"staff training", r"employee training", r"warehouse training", r"qhse training"], (
+        "All DSV warehouse and transport staff undergo structured training programs, including:\n"
+        "- QHSE training (Safety, Fire, First Aid)\n"
+        "- Equipment handling (Forklifts, Cranes, VNA)\n"
+        "- WMS and inventory systems\n"
+        "- Customer service and operational SOPs\n"
+        "Regular refresher courses are also conducted."
+    )),
+    Rule("dangerous_goods", [r"\bdg\b", r"dangerous goods", r"hazardous material", r"hazmat", r"hazard class", r"dg storage"], (
+        "Yes, DSV handles **DG (Dangerous Goods)** and hazardous materials in specialized chemical storage areas. We comply with all safety and documentation requirements including:\n"
+        "- Hazard classification and labeling\n"
+        "- MSDS (Material Safety Data Sheet) submission\n"
+        "- Trained staff for chemical handling\n"
+        "- Temperature-controlled and fire-protected zones\n"
+        "- Secure access and emergency systems\n\n"
+        "Please note: For a DG quotation, we require the **material name, hazard class, CBM, period, and MSDS**."
+    )),
+
+    # --- Chamber Mapping ---
+    Rule("chamber_2", [r"ch2|chamber 2"], "Chamber 2 is used by PSN (Federal Authority of Protocol and Strategic Narrative)."),
+    Rule("chamber_3", [r"ch3|chamber 3"], "Chamber 3 is used by food clients and fast-moving items."),
+
+    # --- Chamber Mapping (Unified) ---
+    Rule("chamber_clients", [r"\bch\d+\b", r"chamber\s*\d+", r"who.*in.*ch\d+", r"who.*in.*chamber\s*\d+"], _chamber_client),
+
+    # --- Warehouse Occupancy (short) ---
+    Rule("warehouse_occupancy", [r"warehouse occupancy|occupancy|space available|any space in warehouse|availability.*storage"], "For warehouse occupancy, contact Biju Krishnan at biju.krishnan@dsv.com."),
+    Rule("open_yard_occupancy", [r"open yard.*occupancy|yard space.*available|yard capacity|yard.*availability"], "For open yard occupancy, contact Antony Jeyaraj at antony.jeyaraj@dsv.com."),
+
+    # --- Industry: Retail & Fashion ---
+    Rule("industry_retail", [r"\bretail\b", r"fashion and retail", r"fashion logistics", r"retail supply chain"], "DSV provides tailored logistics solutions for the **retail and fashion industry**, including:\n- Warehousing (racked, ambient, VNA)\n- Inbound & outbound transport\n- Value Added Services (labeling, repacking, tagging)\n- Last-mile delivery to malls and retail stores\n- WMS integration for real-time visibility"),
+
+    # --- Industry: Oil & Gas ---
+    Rule("industry_oil_gas", [r"oil and gas", r"oil & gas", r"\bo&g\b", r"energy sector", r"oil logistics"], (
+        "DSV supports the **Oil & Gas industry** across Abu Dhabi and the GCC through:\n"
+        "- Storage of chemicals and DG\n"
+        "- Heavy equipment transport\n"
+        "- 3PL/4PL project logistics\n"
+        "- ADNOC-compliant warehousing and safety\n"
+        "- Support for offshore & EPC contractors with specialized fleet"
+    )),
+    Rule("heavy_lift", [
+        r"heavy lift", r"heavy lift logistics", r"heavy cargo project", r"oversized transport", r"lifting heavy cargo",
+        r"heavy project cargo", r"lift.*heavy", r"project transport.*heavy", r"transport.*heavy equipment"
+    ], (
+        "Yes, DSV handles **heavy lift logistics** across the UAE and GCC. We provide:\n\n"
+        "- 🏗 Mobile cranes (up to 80T)\n"
+        "- 🚛 Lowbed trailers for oversized cargo\n"
+        "- 📦 Rigging, lifting, and permit coordination\n"
+        "- 🛣 Route planning for abnormal loads\n"
+        "- 📋 QHSE-compliant execution\n\n"
+        "Examples include transformer lifts, construction machinery, and ADNOC EPC project deliveries."
+    )),
+    Rule("breakbulk", [r"breakbulk", r"break bulk", r"heavy cargo", r"non-containerized cargo"], "DSV handles **breakbulk and heavy logistics** including:\n- Oversized cargo (machinery, steel, transformers)\n- Lowbed trailer and crane support\n- Project logistics & site delivery\n- DG compliance and route planning\n- Full UAE & GCC transport coordination"),
+    Rule("last_mile", [r"last mile", r"last mile delivery", r"final mile", r"city delivery"], "DSV offers **last-mile delivery** services across the UAE using small city trucks and vans. These are ideal for e-commerce, retail, and healthcare shipments requiring fast and secure delivery to final destinations. Deliveries are WMS-tracked and coordinated by our OCC team for full visibility."),
+    Rule("cross_docking", [r"cross dock", r"cross docking", r"cross-dock", r"crossdock facility"], "Yes, DSV supports **cross-docking** for fast-moving cargo:\n- Receive → Sort → Dispatch (no storage)\n- Ideal for FMCG, e-commerce, and retail\n- Reduces lead time and handling\n- Available at Mussafah and KIZAD hubs"),
+    Rule("transit_storage", [
+        r"transit\b", r"transit store", r"transit warehouse", r"transit storage",
+        r"temporary storage", r"short term storage"], (
+        "DSV offers **transit storage** for short-term cargo holding. Ideal for:\n"
+        "- Customs-cleared goods awaiting dispatch\n"
+        "- Re-export shipments\n"
+        "- Short-duration contracts\n"
+        "Options available in Mussafah, Airport Freezone, and KIZAD."
+    )),
+
+    # --- EV trucks ---
+    Rule("ev_trucks", [r"ev truck|electric vehicle|zero emission|sustainable transport"], "DSV Abu Dhabi operates EV trucks hauling 40ft containers. Each has ~250–300 km range and supports port shuttles & green logistics."),
+
+    # --- DSV Managing Director (MD) ---
+    Rule("managing_director", [r"\bmd\b|managing director|head of dsv|ceo|boss of dsv|hossam mahmoud"], "Mr. Hossam Mahmoud is the Managing Director, Road & Solutions and CEO Abu Dhabi. He oversees all logistics, warehousing, and transport operations in the region."),
+
+    # --- Services DSV Provides ---
+    Rule("dsv_services", [
+        r"what.*service[s]?.*dsv.*provide",
+        r"what (do|does).*dsv.*do",
+        r"what.*they.*do",
+        r"what.*they.*provide",
+        r"what (do|does).*they.*do",
+        r"what (do|does).*they.*offer",
+        r"what.*service[s]?.*they.*provide",
+        r"dsv.*offer",
+        r"dsv.*specialize",
+        r"dsv.*work",
+        r"dsv.*services",
+        r"what.*type.*service",
+        r"type.*of.*logistics",
+        r"services.*dsv",
+        r"what.*dsv.*do",
+        r"dsv.*offerings"
+    ], (
+        "**DSV Abu Dhabi** provides full logistics and supply chain services, including:\n\n"
+        "🚚 **2PL** – Road transport, containers, last-mile delivery\n"
+        "🏢 **3PL** – Warehousing, inventory, VAS, WMS\n"
+        "🔗 **3.5PL** – Hybrid logistics (execution + partial strategy)\n"
+        "🧠 **4PL** – Fully managed supply chain operations\n\n"
+        "**Main Facilities:**\n"
+        "- 📍 **21K Warehouse (Mussafah)** – 21,000 sqm, 7 chambers\n"
+        "- 📍 **M44 / M45** – Sub-warehouses in Mussafah\n"
+        "- 📍 **Al Markaz (Hameem)** – 12,000 sqm\n"
+        "- 📍 **KIZAD** – 360,000 sqm open yard\n"
+        "- 📍 **Airport Freezone** – GDP-compliant storage for healthcare\n\n"
+        "📞 +971 2 555 2900 | 🌐 dsv.com"
+    )),
+    Rule("dsv_abu_dhabi", [r"dsv abu dhabi", r"about dsv abu dhabi", r"who is dsv abu dhabi", r"what is dsv abu dhabi", r"dsv in abu dhabi"], (
+        "DSV Abu Dhabi offers full logistics, warehousing, and transport services. Our main operations include:\n\n"
+        "📍 **21K Warehouse (Mussafah)** – 21,000 sqm, 15m height, 7 chambers\n"
+        "📍 **M44 & M45 Sub-warehouses** – 5,760 sqm & 5,000 sqm\n"
+        "📍 **Al Markaz (Hameem)** – 12,000 sqm\n"
+        "📍 **KIZAD Open Yard** – 360,000 sqm\n"
+        "📍 **Airport Freezone** – Pharma & healthcare storage\n\n"
+        "We handle 2PL, 3PL, 4PL logistics, WMS, VAS, and temperature-controlled storage. Contact +971 2 555 2900 or visit dsv.com."
+    )),
+
+    # --- General Logistics Overview ---
+    Rule("logistics", [
+        r"\blogistics\b",
+        r"what.*is.*logistics",
+        r"about logistics",
+        r"logistics info",
+        r"tell me about logistics",
+        r"explain logistics",
+        r"what do you know about logistics",
+        r"logistics overview",
+        r"define logistics",
+        r"logistics meaning"
+    ], """**Logistics** refers to the planning, execution, and management of the movement and storage of goods, services, and information from origin to destination.
+At **DSV Abu Dhabi**, logistics includes:
+- 📦 **Warehousing** – AC, Non-AC, Open Yard, and temperature-controlled facilities
+- 🚛 **Transportation** – Local & GCC trucking (flatbeds, reefers, lowbeds, box trucks, double trailers, etc.)
+- 🧾 **Value Added Services** – Packing, labeling, inventory counts, kitting & assembly
+- 🌍 **Global Freight Forwarding** – Air, sea, and multimodal shipments
+- 🧠 **4PL & Supply Chain Solutions** – End-to-end management, optimization, and consulting
+We manage everything from port-to-door, ensuring safety, compliance, and cost efficiency.""", unless=r"\b(1|2|3|3\.5|4|5|6)pl\b|\b(first|second|third|fourth|fifth|sixth)\s+party\s+logistics\b"),
+
+    # --- DSV Vision / Mission ---
+    Rule("vision_mission", [
+        r"dsv vision", r"what is dsv vision", r"dsv mission", r"dsv mission and vision",
+        r"company vision", r"company mission", r"mission statement", r"vision statement", r"vision of dsv"
+    ], (
+        "**DSV’s Vision & Mission:**\n\n"
+        "🌍 **Vision:** To be a leading global supplier of transport and logistics services, meeting our customers’ needs for quality, service, and reliability.\n\n"
+        "🚀 **Mission:** We aim to deliver superior customer experiences by providing integrated logistics solutions that add value and efficiency across the supply chain.\n\n"
+        "♻️ **Sustainability Vision:** DSV is committed to reducing CO₂ emissions and achieving net-zero by 2050 through:\n"
+        "- Electric vehicle transport\n"
+        "- Solar-powered warehouses\n"
+        "- Route optimization & consolidation\n"
+        "- Environmental compliance (ISO 14001)\n\n"
+        "Visit dsv.com to learn more about our global goals and ESG initiatives."
+    )),
+    Rule("dsv_name", [
+        r"\bdsv\b", r"about dsv", r"who is dsv", r"what is dsv",
+        r"dsv info", r"tell me about dsv", r"dsv overview",
+        r"dsv abbreviation", r"dsv stands for", r"what does dsv mean"
+    ], (
+        "DSV stands for **'De Sammensluttede Vognmænd'**, meaning **'The Consolidated Hauliers'** in Danish. "
+        "Founded in 1976, DSV is a global logistics leader operating in over 80 countries."
+    ), unless=r"(wms|warehouse management|abu dhabi|fleet|transport|vision|mission|location|address|site|service)"),
+    Rule("sustainability", [
+        r"sustainability", r"green logistics", r"sustainable practices", r"environmental policy",
+        r"carbon footprint", r"eco friendly", r"zero emission goal", r"environment commitment"
+    ], (
+        "DSV is committed to **sustainability and reducing its environmental footprint** across all operations. Initiatives include:\n"
+        "- Transition to **electric vehicles (EV)** for last-mile and container transport\n"
+        "- Use of **solar energy** and energy-efficient warehouse lighting\n"
+        "- Consolidated shipments to reduce CO₂ emissions\n"
+        "- Compliance with **ISO 14001** (Environmental Management)\n"
+        "- Green initiatives in packaging, recycling, and process optimization\n\n"
+        "DSV’s global strategy aligns with the UN Sustainable Development Goals and aims for net-zero emissions by 2050."
+    )),
+
+    # --- Industry Tags ---
+    Rule("fmcg", [r"\bfmcg\b|fast moving|consumer goods"], "FMCG stands for (Fast-Moving Consumer Goods) DSV provides fast turnaround warehousing for FMCG clients including dedicated racking, SKU control, and high-frequency dispatch."),
+    Rule("insurance", [r"insurance|is insurance included|cargo insurance"], "Insurance is not included by default in quotations. It can be arranged separately upon request."),
+
+    # --- Lean Six Sigma ---
+    Rule("lean_six_sigma", [r"lean six sigma|warehouse improvement|continuous improvement|kaizen|process efficiency|6 sigma|warehouse process improvement|lean method"], "DSV applies Lean Six Sigma principles in warehouse design and process flow to reduce waste, improve accuracy, and maximize efficiency. We implement 5S, KPI dashboards, and root-cause analysis for continuous improvement."),
+
+    # --- Warehouse Activities (alt paths) ---
+    Rule("warehouse_temperature", [r"warehouse temp|temperature.*zone|storage temperature|cold room|freezer|ambient temp|warehouse temperature"], "DSV provides 3 temperature zones:\n- **Ambient**: +18°C to +25°C\n- **Cold Room**: +2°C to +8°C\n- **Freezer**: –22°C\nThese zones are used for FMCG, pharmaceuticals, and temperature-sensitive products."),
+    Rule("warehouse_size", [r"size of our warehouse|total warehouse area|total sqm|warehouse size|how big.*warehouse"], "DSV Abu Dhabi has approx. **44,000 sqm** of warehouse space:\n- 21K in Mussafah (21,000 sqm)\n- M44 (5,760 sqm)\n- M45 (5,000 sqm)\n- Al Markaz in Hameem (12,000 sqm)\nPlus 360,000 sqm of open yard."),
+    Rule("kitting", [r"kitting", r"assembly", r"kitting and assembly", r"value added kitting"], "DSV provides **kitting and assembly** as a Value Added Service:\n- Combine multiple SKUs into kits\n- Light assembly of components\n- Repacking and labeling\n- Ideal for retail, pharma, and project logistics"),
+    Rule("relocation", [r"\brelocation\b", r"move warehouse", r"shift cargo", r"site relocation"], "Yes, DSV provides full **relocation services**:\n- Machinery shifting\n- Office and warehouse relocations\n- Packing, transport, offloading\n- Insurance and dismantling available\nHandled by our trained team with all safety measures."),
+    Rule("machinery", [r"machinery|machineries|machines used|equipment|equipment used"], "DSV uses forklifts (3–15T), VNA, reach trucks, pallet jacks, cranes, and container lifters in warehouse and yard operations."),
+    Rule("pallets_per_bay", [r"pallet.*bay|how many.*bay.*pallet", r"bay.*standard pallet", r"bay.*euro pallet"], "Each bay in 21K can accommodate 14 Standard pallets or 21 Euro pallets. This layout maximizes efficiency for various cargo sizes."),
+
+    # --- Ecom / Insurance / WMS (alt) ---
+    Rule("ecommerce", [r"ecommerce|e-commerce|online retail|ecom|dsv online|shop logistics|online order|fulfillment center"], "DSV provides end-to-end e-commerce logistics including warehousing, order fulfillment, pick & pack, returns handling, last-mile delivery, and integration with Shopify, Magento, and custom APIs. Our Autostore and WMS systems enable fast, accurate processing of online orders from our UAE hubs including KIZAD and Airport Freezone."),
+    Rule("storage_insurance", [r"insurance|cargo insurance|storage insurance|are items insured"], "Insurance is not included by default in DSV storage or transport quotes. It can be arranged upon client request, and is subject to cargo value, category, and terms agreed."),
+    Rule("wms_system", [
+        r"\bwms\b",
+        r"what.*wms.*system.*dsv.*use",
+        r"what wms system dsv use",
+        r"what wms system",
+        r"dsv.*wms.*system",
+        r"which.*wms.*system",
+        r"wms.*used.*by.*dsv",
+        r"wms.*software.*dsv",
+        r"inventory.*tracking.*system",
+        r"dsv.*inventory.*system",
+        r"what is wms"
+    ], "DSV uses the **INFOR Warehouse Management System (WMS)** to manage inventory, inbound/outbound flows, and order tracking. It supports real-time dashboards, barcode scanning, and integrates with client ERP systems."),
+    Rule("warehouse_activities", [r"warehouse activities|warehouse tasks|daily warehouse work"], "DSV warehouse activities include receiving (inbound), put-away, storage, replenishment, order picking, packing, staging, and outbound dispatch. We also handle inventory audits, cycle counts, and VAS."),
+    Rule("sop", [r"\bsop\b", r"standard operating procedure", r"standard operation process"], (
+        "SOP stands for **Standard Operating Procedure**. It refers to detailed, written instructions to achieve uniformity in operations. "
+        "DSV maintains SOPs for all warehouse, transport, and VAS processes to ensure safety, compliance, and efficiency."
+    )),
+
+    # --- Air & Sea Services ---
+    Rule("air_sea", [
+        r"air and sea", r"sea and air", r"air & sea", r"air freight and sea freight",
+        r"dsv air and sea", r"dsv sea and air", r"dsv air & sea", r"air ocean", r"air & ocean"
+    ], (
+        "DSV provides comprehensive **Air & Sea freight forwarding** services globally and in the UAE:\n\n"
+        "✈️ **Air Freight**:\n"
+        "- Express, standard, and consolidated options\n"
+        "- Charter solutions for urgent cargo\n"
+        "- Abu Dhabi Airport Freezone warehouse integration\n\n"
+        "🚢 **Sea Freight**:\n"
+        "- Full Container Load (FCL) and Less than Container Load (LCL)\n"
+        "- Customs clearance and documentation support\n"
+        "- Direct access to UAE ports via Jebel Ali, Khalifa, and Zayed Port\n\n"
+        "Our team handles end-to-end transport, consolidation, and global forwarding through DSV’s global network."
+    )),
+
+    # --- Chemical quotation ---
+    Rule("chemical_quotation_checklist", [
+        r"what.*(need|have).*collect.*chemical.*quote",
+        r"what.*(to|do).*collect.*chemical.*quotation",
+        r"build.*up.*chemical.*quote", r"build.*chemical.*quote",
+        r"make.*chemical.*quotation", r"prepare.*chemical.*quote",
+        r"chemical.*quote.*requirements", r"requirements.*chemical.*quote",
+        r"info.*for.*chemical.*quote", r"details.*for.*chemical.*quotation",
+        r"what.*required.*chemical.*quotation", r"quotation.*chemical.*details"
+    ], (
+        "To provide a quotation for **chemical storage**, please collect the following from the client:\n"
+        "1️⃣ **Product Name & Type**\n"
+        "2️⃣ **Hazard Class / Classification**\n"
+        "3️⃣ **Required Volume (CBM/SQM)**\n"
+        "4️⃣ **Storage Duration (contract period)**\n"
+        "5️⃣ **MSDS** – Material Safety Data Sheet\n"
+        "6️⃣ **Any special handling or packaging needs**"
+    )),
+    Rule("chemical_quotation_data", [r"store.*chemical|quotation.*chemical|data.*chemical|requirement.*chemical"], "To quote for chemical storage, we need:\n- Material name\n- Hazard class\n- CBM\n- Period\n- MSDS (Material Safety Data Sheet)."),
+    Rule("msds", [r"\bmsds\b|material safety data sheet|chemical data"], "Yes, MSDS (Material Safety Data Sheet) is mandatory for any chemical storage inquiry. It ensures safe handling and classification of the materials stored in DSV’s facilities."),
+    Rule("storage_quotation_checklist", [r"quote.*chemical.*warehouse", r"quote.*chemical storage", r"quote.*any storage", r"what.*need.*quote.*storage", r"build.*quote.*chemical"], (
+        "To build a quotation for storage (especially chemical), collect the following:\n"
+        "1️⃣ Type of material / hazard class\n"
+        "2️⃣ Volume (CBM or SQM)\n"
+        "3️⃣ Storage duration (contract period)\n"
+        "4️⃣ MSDS if chemical\n"
+        "5️⃣ Handling frequency (throughput)\n\n"
+        "Once ready, please fill the form on the left."
+    )),
+
+    # --- SQM↔CBM Helper ---
+    Rule("sqm_to_cbm", [
+        r"(how|what).*convert.*(sqm|sq\.?m).*cbm",
+        r"(convert|calculate|estimate).*cbm.*(from|using).*sqm",
+        r"(sqm|sq\.?m).*to.*cbm",
+        r"cbm.*(from|based on|calculated from).*sqm",
+        r"(client|customer).*only.*(sqm|sq\.?m)",
+        r"(only|just).*sqm.*not.*cbm",
+        r"no.*cbm.*(provided|available)",
+        r"given.*sqm.*want.*cbm",
+        r"client.*gave.*sqm.*how.*cbm",
+        r"how.*cbm.*(if|when).*client.*(gives|provides).*sqm",
+        r"i have.*sqm.*need.*cbm"
+    ], "If the client doesn’t provide CBM, you can estimate it using the rule: **1 SQM ≈ 1.8 CBM** for standard racked warehouse storage."),
+    Rule("quotation_requirements", [
+        r"(what.*collect.*client.*quotation)", r"(what.*info.*client.*quote)",
+        r"(quotation.*requirements)", r"(quotation.*information.*client)",
+        r"(details.*for.*quotation)", r"(build.*quotation.*info)",
+        r"(prepare.*quotation.*client)", r"(required.*info.*quote)"
+    ], (
+        "To build a proper 3PL storage quotation, please collect the following information from the client:\n"
+        "1️⃣ **Type of Commodity** – What items are being stored (FMCG, chemical, pharma, etc.)\n"
+        "2️⃣ **Contract Period** – Expected duration of the agreement (in months or years)\n"
+        "3️⃣ **Storage Volume** – In CBM/day, CBM/month, or CBM/year for warehousing; in SQM for open yard\n"
+        "4️⃣ **Throughput Volumes (IN/OUT)** – Daily or monthly volume in CBM to determine handling pattern and frequency\n\n"
+        "Once these details are available, you can proceed to fill the main form to generate a quotation."
+    )),
+    Rule("quotation_form", [r"proposal|quotation|offer|quote.*open yard|proposal.*open yard|send me.*quote|how to get quote|need.*quotation"], "To get a full quotation, please close this chat and fill the details in the main form on the left. The system will generate a downloadable document for you."),
+
+    # Compare ONLY requested PLs
+    Rule("pl_comparison", [r"\b(vs|versus|difference|different|compare|comparison|diff)\b"], _compare_pls),
+
+    # --- Service definitions ---
+    Rule("pl_2", [r"\bwhat is 2pl\b", r"\b2pl\b", r"second party logistics", r"2pl meaning"], (
+        "**2PL (Second Party Logistics)** means the customer rents or leases a warehouse or yard facility, but operates it entirely on their own.\n\n"
+        "- DSV provides only the **infrastructure** (space, utilities, security)\n"
+        "- The client uses their **own manpower, MHE, WMS, and processes**\n"
+        "- DSV does **not** get involved in the daily operations\n\n"
+        "This is commonly used by clients who want full control over their logistics operations, but need a compliant facility with strategic location."
+    )),
+    Rule("pl_3", [r"\bwhat is 3pl\b", r"\b3pl\b", r"third party logistics"], "3PL (Third Party Logistics) involves outsourcing logistics operations such as warehousing, transportation, picking/packing, and order fulfillment to a provider like DSV."),
+    Rule("pl_4", [r"\bwhat is 4pl\b", r"\b4pl\b", r"fourth party logistics"], "4PL (Fourth Party Logistics) is a fully integrated supply chain solution where DSV manages all logistics operations, partners, systems, and strategy on behalf of the client. DSV acts as a single point of contact and coordination."),
+    Rule("pl_3_5", [r"\bwhat is 3.5pl\b", r"\b3.5pl\b", r"three and half pl", r"3pl plus", r"middle of 3pl and 4pl"], "3.5PL is an emerging term referring to a hybrid between **3PL and 4PL**:\n- DSV provides operational execution like a 3PL\n- And partial strategic control like a 4PL\nIdeal for clients wanting control with partial outsourcing."),
+    Rule("pl_5", [r"\b5pl\b", r"\bfifth party logistics\b", r"what is 5pl", r"5pl meaning", r"explain 5pl"], (
+        "5PL (Fifth Party Logistics) refers to a provider that **manages the entire supply chain network** on behalf of the client, including multiple 3PL/4PL providers.\n\n"
+        "It focuses on **complete strategic orchestration** of logistics using data-driven platforms, AI, automation, and integrated digital ecosystems.\n\n"
+        "5PL is ideal for businesses needing full end-to-end digital control across multiple logistics layers, particularly in global e-commerce or high-volume industries."
+    )),
+    Rule("pl_6", [r"\b6pl\b", r"\bsixth party logistics\b", r"what is 6pl", r"explain 6pl", r"6pl meaning", r"define 6pl"], (
+        "**6PL (Sixth Party Logistics)** is an **emerging concept** in supply chain strategy.\n\n"
+        "It refers to a logistics model that integrates:\n"
+        "- AI-based decision making\n"
+        "- Big data analytics\n"
+        "- Autonomous systems\n"
+        "- Full digital orchestration across 3PL/4PL/5PL layers\n\n"
+        "📌 *It's not yet widely adopted but represents the future of smart, fully automated logistics.*"
+    )),
+    Rule("pl_1", [r"\b1pl\b", r"\bfirst party logistics\b", r"what is 1pl", r"explain 1pl", r"1pl meaning", r"define 1pl"], (
+        "**1PL (First Party Logistics)** refers to the **owner of the goods** who handles all logistics themselves.\n\n"
+        "This means the company manages:\n- Warehousing\n- Transportation\n- Inventory & dispatch\n\n"
+        "**No outsourcing** is involved — everything is done in-house by the product owner."
+    )),
+
+    # --- Transportation ---
+    Rule("fleet", [
+        r"\bfleet\b", r"dsv fleet", r"dsv transportation", r"truck fleet", r"transport fleet",
+        r"fleet info", r"fleet of dsv", r"tell me about fleet", r"fleet trucks", r"dsv.*fleet", r"fleet.*dsv"
+    ], (
+        "DSV operates a large fleet in the UAE including:\n\n"
+        "- 🚛 Flatbed trailers\n"
+        "- 📦 Box trucks\n"
+        "- 🚚 Double trailers\n"
+        "- ❄️ Reefer trucks (chiller/freezer)\n"
+        "- 🏗 Lowbeds\n"
+        "- 🪨 Tippers\n"
+        "- 🏙 Small city delivery trucks\n\n"
+        "Fleet vehicles support all types of transport including full truckload (FTL), LTL, and container movements."
+    )),
+    Rule("transport_terms", [
+        r"transport.*t.?&.?c", r"transportation.*terms", r"transport.*conditions", r"transport.*policy",
+        r"delivery terms", r"transport.*rules", r"transport.*regulations", r"transportation t and c",
+        r"terms and conditions.*transport", r"terms.*logistics", r"truck.*t.?&.?c"
+    ], (
+        "**📦 Full Transportation Terms & Conditions:**\n\n"
+        "🚛 **General Notes:**\n"
+        "- Cargo height must not exceed truck limits (side sticks/headboard)\n"
+        "- Permit-required locations (e.g., city limits) need 2–3 working days processing\n"
+        "- Short-distance trips require loading and delivery on the same day\n\n"
+        "📅 **Validity:**\n"
+        "- Quotation valid for **15 days** from issuance\n\n"
+        "💸 **Additional Fees:**\n"
+        "- VAT: 5%\n"
+        "- Environmental Fee: AED 10/trip/truck\n"
+        "- From Jan 2025: 0.15% of invoice value\n\n"
+        "📜 **Terms & Conditions:**\n"
+        "- On FOT-to-FOT basis (Free On Truck at both ends)\n"
+        "- Per trip per truck\n"
+        "- General cargo only\n"
+        "- Based on provided location — any changes require re-quote\n"
+        "- Valid only for stable, flat, non-sandy areas\n"
+        "- Subject to truck availability\n"
+        "- Based on standard UAE truck specs\n"
+        "- Loading/offloading under **customer scope**\n"
+        "- Sharjah/Ajman require Municipality permissions\n"
+        "- Detention: AED 150/hour after free period\n"
+        "- Backhaul (same-day): +60% / next-day: full rate\n"
+        "- Sundays/Holidays: trip rate +50%\n"
+        "- Force majeure applies to delays from weather, traffic, etc.\n"
+        "- Site details, maps, and contact must be provided 48 hours prior\n\n"
+        "✅ **Inclusions:**\n"
+        "- Fuel (Diesel)\n"
+        "- DSV equipment & personnel insurance\n\n"
+        "❌ **Exclusions (billed at actuals):**\n"
+        "- Loading, offloading, supervision\n"
+        "- Port charges, gate passes, tolls, permits\n"
+        "- Cargo insurance, customs, VGM, washing\n\n"
+        "❌ **Cancellation Charges:**\n"
+        "- 50% if cancelled **before** truck placement\n"
+        "- 100% if cancelled **after** truck placement\n"
+        "- Waived if cancelled **24 hours** in advance\n\n"
+        "Let me know if you'd like clarification on any specific point."
+    )),
+    Rule("truck_types", [r"truck types", r"trucks", r"transportation types", r"dsv trucks", r"transport.*available", r"types of transport", r"trucking services"], (
+        "DSV provides local and GCC transportation using:\n"
+        "- Flatbeds for general cargo\n"
+        "- Lowbeds for heavy equipment\n"
+        "- Tippers for construction bulk\n"
+        "- Box trucks for secure goods\n"
+        "- ❄️ Reefer trucks for temperature-sensitive cargo\n"
+        "- Double trailers for long-haul\n"
+        "- Vans and city trucks for last-mile delivery."
+    )),
+
+    # === Individual Truck Types ===
+    Rule("reefer_truck", [
+        r"reefer truck", r"reefer trucks", r"reefer truk", r"reefer trruck", r"reefer trrucks",
+        r"chiller truck", r"chiller trucks", r"cold truck", r"cold trucks",
+        r"refrigerated truck", r"refrigerated trucks"
+    ], (
+        "❄️ **Reefer Truck**: Temperature-controlled vehicle used to transport cold chain goods like food, pharmaceuticals, and chemicals.\n"
+        "DSV reefer trucks operate between +2°C to –22°C and are equipped with GPS and real-time temperature tracking."
+    )),
+    Rule("flatbed_truck", [r"flatbed", r"flatbed truck", r"what is flatbed", r"flatbed trailer"], (
+        "🚛 **Flatbed Truck**: An open platform truck ideal for transporting heavy, oversized, or palletized cargo.\n"
+        "Commonly used for containers, steel, and construction materials.\n"
+        "Max capacity: ~22–25 tons."
+    )),
+    Rule("lowbed_trailer", [r"lowbed", r"low bed", r"lowbed trailer", r"what is lowbed"], (
+        "🏗 **Lowbed Trailer**: Specialized truck used for transporting heavy equipment and oversized machinery.\n"
+        "Has a lower deck height for tall cargo. Capacity up to 60 tons.\n"
+        "Ideal for construction, infrastructure, and oil & gas projects."
+    )),
+    Rule("box_truck", [r"box truck", r"closed truck", r"curtainside truck", r"box type truck"], (
+        "📦 **Box Truck**: Enclosed truck used for transporting general cargo protected from weather.\n"
+        "Typically used for FMCG, electronics, retail, and secure goods.\n"
+        "Capacity: ~5–10 tons."
+    )),
+    Rule("double_trailer", [r"double trailer", r"articulated trailer", r"tandem trailer", r"double trailer truck"], (
+        "🚚 **Double Trailer**: Articulated truck with two trailers, used for long-distance, high-volume transport.\n"
+        "Can carry up to 50–60 tons total. Ideal for inter-emirate and GCC deliveries."
+    )),
+    Rule("tipper_truck", [r"tipper", r"tippers", r"tipper truck", r"dump truck"], (
+        "🪨 **Tipper Truck**: Used for transporting and unloading bulk materials like sand, gravel, or soil.\n"
+        "DSV tippers typically carry 15–20 tons and are commonly used in construction logistics."
+    )),
+    Rule("transportation", [r"\btransportation\b", r"tell me about transportation", r"transport services", r"what is transportation", r"dsv transportation"], (
+        "DSV offers full-service land transportation across the UAE and GCC. We operate a modern fleet including:\n"
+        "- 🚛 Flatbeds (up to 25 tons)\n"
+        "- 🏗 Lowbeds for heavy or oversized cargo\n"
+        "- 🪨 Tippers for bulk material (sand, gravel, etc.)\n"
+        "- 📦 Box trucks for protected cargo\n"
+        "- ❄️ Reefer trucks (chiller/freezer) for temperature-controlled delivery\n"
+        "- 🚚 Double trailers for high-volume long-haul moves\n"
+        "- 🏙 Small city trucks for last-mile distribution\n\n"
+        "All transport is coordinated by our OCC team in Abu Dhabi with real-time tracking, WMS integration, and documentation support."
+    )),
+    Rule("fot_to_fot", [r"fot to fot", r"f\.o\.t to f\.o\.t", r"fot basis", r"what is fot", r"fot meaning", r"fot to fot basis"], (
+        "**FOT to FOT basis** stands for *Free On Truck to Free On Truck*. It means:\n\n"
+        "- 🚚 Cargo is picked up from the origin **on a truck**\n"
+        "- 🚚 Delivered to the destination **on a truck**\n"
+        "- ❌ Loading/unloading at either end is **not included**\n\n"
+        "This term is commonly used in DSV transport quotes to define the scope of delivery responsibility."
+    )),
+    Rule("shipping_terms", [
+        r"\bltl\b", r"less than truckload", r"ltl shipment", r"ltl meaning", r"what is ltl",
+        r"\blcl\b", r"less than container load", r"lcl shipment", r"lcl meaning", r"what is lcl",
+        r"\bftl\b", r"full truckload", r"what is ftl", r"ftl meaning", r"explain ftl"
+    ], (
+        "**Here’s a breakdown of common shipping terms:**\n\n"
+        "🚛 **LTL (Less Than Truckload)**:\n"
+        "- Road transport when cargo doesn’t fill a full truck\n"
+        "- Shared with other shipments\n"
+        "- Cost-effective for small or medium-sized loads\n\n"
+        "🚢 **LCL (Less Than Container Load)**:\n"
+        "- Sea freight where cargo doesn’t fill a container\n"
+        "- Consolidated with other customers’ cargo\n"
+        "- Ideal for partial-volume international shipments\n\n"
+        "🚛 **FTL (Full Truckload)**:\n"
+        "- Entire truck is booked for one customer\n"
+        "- Faster and more secure\n"
+        "- Best for high-volume, urgent, or dedicated deliveries\n\n"
+        "DSV offers all three options depending on your cargo size, mode, and urgency."
+    )),
+
+    # --- UAE Emirates Distance + Travel Time ---
+    Rule("distance_abu_dhabi_dubai", [r"abu dhabi.*dubai|dubai.*abu dhabi"], "The distance between Abu Dhabi and Dubai is about **140 km**, and the travel time is approximately **2.5 hours**."),
+    Rule("distance_abu_dhabi_sharjah", [r"abu dhabi.*sharjah|sharjah.*abu dhabi"], "The distance between Abu Dhabi and Sharjah is about **160 km**, and the travel time is approximately **2.5 to 3 hours**."),
+    Rule("distance_abu_dhabi_ajman", [r"abu dhabi.*ajman|ajman.*abu dhabi"], "The distance between Abu Dhabi and Ajman is approximately **170 km**, with a travel time of about **2.5 to 3 hours**."),
+    Rule("distance_abu_dhabi_rak", [r"abu dhabi.*ras al khaimah|ras al khaimah.*abu dhabi|rak.*abu dhabi|abu dhabi.*rak"], "The road distance from Abu Dhabi to Ras Al Khaimah is about **240 km**, and the travel time is around **3 to 3.5 hours**."),
+    Rule("distance_abu_dhabi_fujairah", [r"abu dhabi.*fujairah|fujairah.*abu dhabi"], "Abu Dhabi to Fujairah is approximately **250 km**, with a travel time of about **3 to 3.5 hours**."),
+    Rule("distance_dubai_sharjah", [r"dubai.*sharjah|sharjah.*dubai"], "Dubai to Sharjah is around **30 km**, and the travel time is typically **30 to 45 minutes**."),
+    Rule("distance_dubai_ajman", [r"dubai.*ajman|ajman.*dubai"], "Dubai to Ajman is approximately **40 km**, and it takes around **60 to 90 minutes** by road."),
+    Rule("distance_dubai_rak", [r"dubai.*ras al khaimah|ras al khaimah.*dubai|dubai.*rak|rak.*dubai"], "The distance between Dubai and Ras Al Khaimah is around **120 km**, with a travel time of **2 to 2.5 hours**."),
+    Rule("distance_dubai_fujairah", [r"dubai.*fujairah|fujairah.*dubai"], "Dubai to Fujairah is approximately **130 km**, and the travel time is about **2.5 hours**."),
+    Rule("distance_sharjah_ajman", [r"sharjah.*ajman|ajman.*sharjah"], "Sharjah and Ajman are extremely close — only about **15 km**, with a travel time of **45 to 60 minutes**."),
+    Rule("distance_sharjah_fujairah", [r"sharjah.*fujairah|fujairah.*sharjah"], "Sharjah to Fujairah is roughly **110 km**, and takes about **2 hours** by road."),
+    Rule("distance_sharjah_rak", [r"sharjah.*ras al khaimah|ras al khaimah.*sharjah|sharjah.*rak|rak.*sharjah"], "Sharjah to Ras Al Khaimah is approximately **100 km**, and the travel time is around **2 to 2.5 hours**."),
+    Rule("truck_capacity", [
+        r"truck capacity", r"how many ton", r"truck tonnage", r"truck.*can carry", r"truck load",
+        r"flatbed.*ton", r"flatbed.*load", r"flatbed capacity",
+        r"double trailer.*ton", r"articulated.*capacity",
+        r"box truck.*ton", r"curtainside.*load", r"box truck capacity",
+        r"reefer.*ton", r".*capacity", r"chiller truck.*load",
+        r"city truck.*ton", r"1 ton truck", r"3 ton truck",
+        r"lowbed.*ton", r"lowbed.*capacity",
+        r"tipper.*ton", r"dump truck.*load", r"bulk truck.*ton"
+    ], (
+        "Here’s the typical tonnage each DSV truck type can carry:\n\n"
+        "🚛 **Flatbed Truck**: up to 22–25 tons (ideal for general cargo, pallets, containers)\n"
+        "🚚 **Double Trailer (Articulated)**: up to 50–60 tons combined (used for long-haul or inter-emirate)\n"
+        "📦 **Box Truck / Curtainside**: ~5–10 tons (weather-protected for packaged goods)\n"
+        "❄️ **Reefer Truck**: 3–12 tons depending on size (for temperature-sensitive cargo)\n"
+        "🏙 **City Truck (1–3 Ton)**: 1 to 3 tons (last-mile delivery within cities)\n"
+        "🏗 **Lowbed Trailer**: up to 60 tons (for heavy equipment and oversized machinery)\n"
+        "🪨 **Tipper / Dump Truck**: ~15–20 tons (for bulk cargo like sand, gravel, or construction material)"
+    )),
+    Rule("distance_mussafah", [r"(distance|how far|km).*mussafah.*(al markaz|markaz|hameem|hamim|ghayathi|ruwais|mirfa|madinat zayed|western region)"], (
+        "Approximate road distances from Mussafah:\n"
+        "- Al Markaz: **60 km**\n"
+        "- Hameem: **90 km**\n"
+        "- Madinat Zayed: **150 km**\n"
+        "- Mirfa: **140 km**\n"
+        "- Ghayathi: **240 km**\n"
+        "- Ruwais: **250 km**\n"
+        "\nLet me know if you need travel time or transport support too."
+    )),
+
+    # --- Environmental Fee ---
+    Rule("environmental_fee", [r"environmental fee", r"environment fee", r"0\.15%.*fee", r"green surcharge", r"eco fee"], "🚛 Environmental Fees:\n- AED 10.00 per trip/truck\n- Effective 1 Jan 2025: 0.15% of invoice value added as environmental surcharge."),
+
+    # --- Cancellation Charges ---
+    Rule("cancellation_charges", [r"cancellation charge", r"cancel.*trip", r"cancel.*transport", r"trip cancelled", r"transport cancellation policy"], "**Cancellation Charges:**\n- ❌ 50% if cancelled before truck placement\n- ❌ 100% if cancelled after truck placement\n- ✅ No charge if cancelled 24 hours in advance."),
+
+    # --- Validity ---
+    Rule("quotation_validity", [r"validity", r"quotation validity", r"how long.*quote", r"rate.*valid", r"validity of transport"], "📅 Transport quotation validity is **15 days** from the date of issue."),
+
+    # --- Loading / Offloading ---
+    Rule("loading_offloading", [r"loading.*included", r"offloading.*included", r"who loads", r"who unloads", r"customer.*loading", r"customer.*offloading"], "🚫 Loading and offloading are under **customer scope**. DSV provides trucks on an FOT-to-FOT basis only."),
+
+    # --- Backhaul / Backload ---
+    Rule("backhaul", [r"backhaul", r"backload", r"return trip", r"same day return", r"delivery back to origin"], "🔄 **Backhaul/Backload Charges:**\n- Same-day return to origin: **+60%** of trip charge\n- Next-day return: **100%** of trip charge\n- Separate location = separate trip rate."),
+
+    # --- Sharjah / Ajman Municipality ---
+    Rule("municipality_permits", [r"sharjah.*permission", r"ajman.*municipality", r"offload.*road", r"load.*outside", r"warehouse.*inside.*loading"], "⚠️ For Sharjah & Ajman:\n- Customer must arrange **Municipality loading/offloading permission**\n- Operations must happen **inside premises only** — activity on the road is not allowed and fines will be passed to the client."),
+
+    # --- Inclusions / Exclusions ---
+    Rule("transport_inclusions", [r"what.*included", r"included.*transport", r"transport.*inclusions"], "✅ **Inclusions:**\n- DSV Equipment Insurance\n- Personnel Insurance\n- Fuel (Diesel)"),
+    Rule("transport_exclusions", [r"what.*excluded", r"excluded.*transport", r"transport.*exclusions"], "❌ **Exclusions:**\n- Loading/Offloading/Supervision\n- Port handling, customs, tolls, permits, road taxes, gate passes, washing, cargo insurance, and third-party fees."),
+
+    # --- Force Majeure ---
+    Rule("force_majeure", [r"force majeure", r"weather condition", r"sandstorm", r"rain.*delay", r"high wind", r"delays due to weather"], "🌪️ **Force Majeure Clause:**\nDelays due to weather (sandstorms, rain, wind) or unforeseen events are considered normal working hours. Detention will apply beyond free hours. DSV reserves the right to claim costs if delays impact delivery."),
+
+    # --- Detention Charges ---
+    Rule("detention_charges", [r"detention", r"detention charges", r"wait time charges", r"extra time", r"delays at site", r"truck waiting"], "🕒 **Detention Charges:**\n- AED 150 per truck after 1 free hour of waiting at site."),
+
+    # --- DSV Abu Dhabi Facility Sizes ---
+    Rule("facility_sizes", [
+        r"plot size", r"abu dhabi total area", r"site size", r"facility size", r"total sqm", r"how big",
+        r"yard size", r"open yard area", r"size of open yard", r"open yard.*size", r"area of open yard"
+    ], "DSV Abu Dhabi's open yard spans 360,000 SQM across Mussafah and KIZAD. The total logistics plot is 481,000 SQM, including ~100,000 SQM of service roads and utilities, and a 21,000 SQM warehouse (21K)."),
+    Rule("sub_warehouses", [r"sub warehouse|m44|m45|al markaz|abu dhabi warehouse total|all warehouses"], "In addition to the main 21K warehouse, DSV operates sub-warehouses in Abu Dhabi: M44 (5,760 sqm), M45 (5,000 sqm), and Al Markaz (12,000 sqm). Combined with 21K, the total covered warehouse area in Abu Dhabi is approximately 44,000 sqm."),
+    Rule("quotation_terms", [r"terms and conditions|quotation policy|T&C|billing cycle|operation timing|payment terms|quotation validity"], "DSV quotations include the following terms: Monthly billing, final settlement before vacating, 15-day quotation validity, subject to space availability. The depot operates Monday–Friday 8:30 AM to 5:30 PM. Insurance is not included by default. An environmental fee of 0.15% is added to all invoices. Non-moving cargo over 3 months may incur extra storage tariff."),
+    Rule("safety_training", [r"safety training|warehouse training|fire drill|manual handling|staff safety|employee training|toolbox talk"], "DSV staff undergo regular training in fire safety, first aid, manual handling, emergency response, and site induction. We also conduct toolbox talks and refresher sessions to maintain safety awareness and operational excellence."),
+    Rule("adnoc", [r"adnoc|adnoc project|dsv.*adnoc|oil and gas project|dsv support.*adnoc|logistics for adnoc"], "DSV has an active relationship with ADNOC and its group companies, supporting logistics for Oil & Gas projects across Abu Dhabi. This includes warehousing of chemicals, fleet transport to remote sites, 3PL for EPC contractors, and marine logistics for ADNOC ISLP and offshore projects. All operations are QHSE compliant and meet ADNOC’s safety and performance standards."),
+
+    # FM-200 quick explainer
+    Rule("fm200", [r"\bfm\s*-?\s*200\b", r"\bfm200\b"], (
+        "🔒 **FM‑200 (HFC‑227ea)** is a clean‑agent fire suppression system used in sensitive areas (like RMS). "
+        "It extinguishes fires quickly by absorbing heat, leaves no residue, and is safe for documents and electronics when applied per design."
+    )),
+    Rule("summer_break", [r"summer break|midday break|working hours summer|12.*3.*break|uae heat ban|no work afternoon|hot season schedule"], "DSV complies with UAE summer working hour restrictions. From June 15 to September 15, all outdoor work (including open yard and transport loading) is paused daily between 12:30 PM and 3:30 PM. This ensures staff safety and follows MOHRE guidelines."),
+    Rule("examples", [
+        r"like what", r"such as", r"for example", r"what kind of help",
+        r"what.*can.*you.*help.*with",
+        r"what.*do.*you.*do",
+        r"what.*things.*you.*can.*do",
+        r"can.*you.*give.*example",
+        r"what.*services.*you.*offer",
+        r"what.*can.*u.*do",
+        r"what.*can.*u.*help",
+        r"what.*you.*provide",
+        r"^what\s*services\??$",
+        r"^services\??$",
+        r"\bwhat\s+services\b",
+        r"\bwhat\s*service\??$",
+        
+    ], (
+        "Sure! I can help you with:\n\n"
+        "📦 Storage rates (Standard, Chemical, Open Yard)\n"
+        "🚛 Transport & truck types (flatbeds, reefers, lowbeds...)\n"
+        "🧾 Value Added Services like packing, labeling, inventory\n"
+        "🏢 DSV warehouse layouts, temperature zones, and chambers\n"
+        "📍 UAE-wide transport routes & distances\n"
+        "📚 Relocation, asset management, and more\n\n"
+        "Ask me about anything related to DSV warehousing, logistics, or transport!"
+    )),
+    Rule("who_are_you", [
+        r"who are you", r"who r u", r"who.*you", r"who.*are.*you", r"what.*can.*you.*do",
+        r"what can u do", r"what can you help with", r"how can you help", r"can u help", r"what can u help me with",
+        r"how u help", r"your purpose", r"your role", r"what do u do", r"what.*can.*you.*answer",
+        r"what.*assist.*me.*with", r"what.*can.*u.*assist", r"how.*can.*u.*support", r"what.*you.*do", r"how.*u.*can.*help"
+    ], (
+        "I'm the DSV logistics assistant 🤖 here to help you with:\n\n"
+        "- 📦 Storage rates (Standard, Chemical, Open Yard)\n"
+        "- 🚛 Transportation options and truck types\n"
+        "- 🧾 Value Added Services (VAS)\n"
+        "- 🏢 Warehouse info: size, layout, chambers\n"
+        "- 🧊 Temperature zones, RMS, training\n"
+        "- 📍 Distances and service locations across the UAE\n\n"
+        "Ask me anything related to DSV warehousing, transport, or logistics!"
+    )),
+    Rule("facilities", [r"how many.*facility", r"how many.*facilities", r"dsv abu dhabi facilities", r"how many warehouse.*dsv"], (
+        "DSV Abu Dhabi operates multiple logistics facilities:\n\n"
+        "- 🏢 **21K Warehouse (Mussafah)** – 21,000 sqm\n"
+        "- 🏢 **M44** – 5,760 sqm\n"
+        "- 🏢 **M45** – 5,000 sqm\n"
+        "- 🏢 **Al Markaz (Hameem)** – 12,000 sqm\n"
+        "- 🏗 **Open Yard (Mussafah + KIZAD)** – 360,000 sqm\n\n"
+        "In total: **~44,000 sqm** of covered warehouse and **481,000 sqm** logistics site including service roads."
+    )),
+
+    # --- DSV Abu Dhabi Short Location ---
+    Rule("dsv_location", [
+        r"dsv location", r"dsv abu dhabi location", r"where is dsv", r"dsv address", r"main office location",
+        r"where is dsv abu dhabi", r"location of dsv", r"where.*dsv.*located", r"head office address"
+    ], (
+        "📍 DSV Abu Dhabi Location:\n"
+        "M-19, Mussafah Industrial Area, Abu Dhabi, UAE\n"
+        "📞 +971 2 555 2900\n"
+        "🗺️ <a href=\"https://goo.gl/maps/tnFcmydbvdJ9gGLy8\" target=\"_blank\" rel=\"noopener noreferrer\">Open on Google Maps</a>"
+    )),
+
+    # --- Friendly Chat ---
+    Rule("hello", [r"\bhello\b|\bhi\b|\bhey\b|good morning|good evening"], "Hello! I'm here to help with anything related to DSV logistics, transport, or warehousing."),
+    Rule("how_are_you", [r"how.?are.?you|how.?s.?it.?going|whats.?up"], "I'm doing great! How can I assist you with DSV services today?"),
+    Rule("thanks", [r"\bthank(s| you)?\b|thx|appreciate"], "You're very welcome! 😊"),
+]
+
+FALLBACK = "I didn’t catch that—could you share a bit more detail about your DSV storage, transport, or VAS question?"
+
+# --- Index ---
+
+# Most rules can only match if some literal text is in the message ("flat
+# rack", "kizad", "chamber"), so each rule is filed under the literals one of
+# which it needs and a message is only tried against the rules whose
+# literals it contains, still in table order. Rules with a pattern that needs
+# no literal at all are always tried.
+
+def _needs(items):
+    # Literals at least one of which any match of the parsed pattern
+    # contains, or None. Of the choices along a sequence the one with the
+    # longest shortest literal wins.
+    best, run = None, ""
+
+    def consider(choice):
+        nonlocal best
+        if choice and (best is None or min(map(len, choice)) > min(map(len, best))):
+            best = choice
+
+    for op, av in items:
+        if op is _sre.LITERAL:
+            run += chr(av)
+            continue
+        if op is _sre.AT:
+            continue  # zero width
+        consider({run} if run else None)
+        run = ""
+        if op is _sre.SUBPATTERN and not av[1] and not av[2]:
+            consider(_needs(av[3]))
+        elif op is _sre.BRANCH:
+            choices = [_needs(branch) for branch in av[1]]
+            if all(choices):
+                consider(set().union(*choices))
+        elif op in (_sre.MAX_REPEAT, _sre.MIN_REPEAT) and av[0] >= 1:
+            consider(_needs(av[2]))
+    consider({run} if run else None)
+    return best
+
+def _rule_literals(rule):
+    literals = set()
+    for pattern in rule.patterns:
+        needs = None if pattern.flags & re.IGNORECASE else _needs(_sre_parse.parse(pattern.pattern))
+        if not needs:
+            return None
+        literals |= needs
+    return literals
+
+_ALWAYS_TRIED = []
+_RULES_BY_LITERAL = {}
+for _position, _rule in enumerate(RULES):
+    _literals = _rule_literals(_rule)
+    if _literals is None:
+        _ALWAYS_TRIED.append(_position)
+    else:
+        for _literal in _literals:
+            _RULES_BY_LITERAL.setdefault(_literal, set()).add(_position)
+
+# Scanned with a lookahead at every position, which finds the longest literal
+# starting there; the shorter ones starting there are its prefixes, so their
+# rules are filed under it as well.
+_LITERAL_RE = re.compile("(?=(" + _trie_pattern(_RULES_BY_LITERAL) + "))")
+_RULES_FOR = {
+    literal: frozenset().union(*(
+        _RULES_BY_LITERAL.get(literal[:end], ()) for end in range(1, len(literal) + 1)
+    ))
+    for literal in _RULES_BY_LITERAL
+}
+
+def _candidates(message):
+    positions = set(_ALWAYS_TRIED)
+    for literal in set(_LITERAL_RE.findall(message)):
+        positions |= _RULES_FOR[literal]
+    return sorted(positions)
+
+COMPILE_MS = (time.perf_counter() - _compile_start) * 1000
+
+# --- Evaluation ---
+
+# Replies depend on this module, the rates code and the rates catalogue; a
+# change to any of them empties the reply cache and outdates its snapshot
+with open(__file__, "rb") as _f, open(rates.__file__, "rb") as _g:
+    _SOURCE_VERSION = hashlib.sha256(_f.read() + _g.read()).hexdigest()[:16]
+
+# Longer messages are rarely repeated and would only crowd the cache
+_MAX_CACHED_MESSAGE = 200
+
+_stats_lock = threading.Lock()
+_evaluations = 0
+_eval_seconds = 0.0
+_max_eval_seconds = 0.0
+_intents_tried = 0
+_max_intents_tried = 0
+
+def _evaluate(message):
+    # (intent, reply, number of rules tried)
+    candidates = _candidates(message)
+    for tried, position in enumerate(candidates, 1):
+        rule = RULES[position]
+        reply = rule.answer(message)
+        if reply is not None:
+            return rule.intent, reply, tried
+    return None, FALLBACK, len(candidates)
+
+def _replies_version():
+    return f"{_SOURCE_VERSION}-{rates.catalogue().version}"
+
+def _cached_evaluate(message):
+    if reply_cache is None or len(message) > _MAX_CACHED_MESSAGE:
+        return _evaluate(message)
+    reply_cache.check_version(_replies_version())
+    cached = reply_cache.get(message)
+    if cached is not None:
+        return cached[0], cached[1], 0
+    intent, reply, tried = _evaluate(message)
+    reply_cache.put(message, (intent, reply))
+    return intent, reply, tried
+
+def _save_snapshot(path, limit):
+    # At exit. Not from a process that answered no chat (the gunicorn
+    # master), which would overwrite the workers' snapshot with its own.
+    if reply_cache.hits + reply_cache.misses:
+        reply_cache.save(path, limit)
+
+def answer(raw):
+    # (intent, reply, seconds spent) for one chat message; intent is None
+    # for the fallback reply
+    global _evaluations, _eval_seconds, _max_eval_seconds, _intents_tried, _max_intents_tried
+    start = time.perf_counter()
+    first_line = next((ln.strip() for ln in raw.splitlines() if ln.strip()), "")
+    if _GREETING_RE.match(first_line) and len(first_line.split()) <= 3:
+        intent, reply, tried = "greeting", GREETING, 0
+    else:
+        # Collapse to one line for matching
+        text = " ".join(ln.strip() for ln in raw.splitlines() if ln.strip())
+        intent, reply, tried = _cached_evaluate(normalize(text))
+    elapsed = time.perf_counter() - start
+    with _stats_lock:
+        _evaluations += 1
+        _eval_seconds += elapsed
+        _max_eval_seconds = max(_max_eval_seconds, elapsed)
+        _intents_tried += tried
+        _max_intents_tried = max(_max_intents_tried, tried)
+    return intent, reply, elapsed
+
+def chat_reply(raw):
+    # Reply text for one chat message. Needs no request context, so the ASGI
+    # front end (asgi.py) answers chat straight from its event loop.
+    return answer(raw)[1]
+
+def server_timing(seconds):
+    return f"chat;dur={seconds * 1000:.3f}"
+
+def warm_up():
+    # The rules compile at import; this just runs the chain once end to end
+    _evaluate(normalize("warm up"))
+
+def stats():
+    with _stats_lock:
+        return {"chat": {
+            "rules": len(RULES),
+            "patterns": sum(len(rule.patterns) for rule in RULES) + len(_REWRITES),
+            "indexed_literals": len(_RULES_BY_LITERAL),
+            "always_tried": len(_ALWAYS_TRIED),
+            "compile_ms": round(COMPILE_MS, 1),
+            "evaluations": _evaluations,
+            "avg_eval_ms": round(_eval_seconds / _evaluations * 1000, 3) if _evaluations else None,
+            "max_eval_ms": round(_max_eval_seconds * 1000, 3) if _evaluations else None,
+            "avg_intents_tried": round(_intents_tried / _evaluations, 2) if _evaluations else None,
+            "max_intents_tried": _max_intents_tried,
+            "reply_cache": reply_cache.stats() if reply_cache else None,
+        }}
+
+@bp.cli.command("compare-normalizers")
+@click.option("--fuzz", type=int, default=20000, show_default=True, help="Random messages to add")
+@click.option("--seed", type=int, default=0, show_default=True)
+@click.option("--messages", type=click.File(encoding="utf-8"), help="Extra messages to check, one per line")
+def compare_normalizers(fuzz, seed, messages):
+    """Check the single-pass normalize() against the rewrites applied in order."""
+    samples = normalizer_samples(fuzz, seed)
+    if messages:
+        samples += [line.rstrip("\n") for line in messages]
+    failed = 0
+    for sample in samples:
+        expected, got = normalize_sequential(sample), normalize(sample)
+        if got != expected:
+            failed += 1
+            click.echo(f"DIFF   {sample!r}\n  in order:    {expected!r}\n  single pass: {got!r}")
+    click.echo(f"{len(samples) - failed} of {len(samples)} messages normalise the same")
+    if failed:
+        raise SystemExit(1)
+
+@bp.route("/chat", methods=["POST"])
+def chat():
+    data = request.get_json()
+    raw = data.get("message", "") if data else ""
+    raw = raw if isinstance(raw, str) else str(raw)
+    _, reply, elapsed = answer(raw)
+    response = jsonify({"reply": reply})
+    response.headers["Server-Timing"] = server_timing(elapsed)
+    return response
+
+@bp.route("/chat/batch", methods=["POST"])
+def chat_batch():
+    # A JSON list of messages (or {"messages": [...]}); each gets its reply,
+    # the intent that answered (null for the fallback) and the time it took,
+    # in order
+    messages = request.get_json(silent=True)
+    if isinstance(messages, dict):
+        messages = messages.get("messages")
+    if not isinstance(messages, list):
+        return jsonify({"error": "expected a JSON list of messages"}), 400
+    limit = current_app.config["CHAT_MAX_BATCH_MESSAGES"]
+    if len(messages) > limit:
+        return jsonify({"error": f"batch has {len(messages)} messages, the limit is {limit}"}), 400
+    for i, raw in enumerate(messages):
+        if not isinstance(raw, str):
+            return jsonify({"error": f"message {i} is not a string"}), 400
+    results = []
+    total = 0.0
+    for raw in messages:
+        intent, reply, elapsed = answer(raw)
+        total += elapsed
+        results.append({"reply": reply, "intent": intent, "eval_ms": round(elapsed * 1000, 3)})
+    response = jsonify({"results": results})
+    response.headers["Server-Timing"] = server_timing(total)
+    return response
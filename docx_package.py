@@ -0,0 +1,145 @@
+import collections
+import io
+import struct
+import zipfile
+import zlib
+
+# Minimal zip writer for .docx packages built from a cached template. Entries
+# the quote didn't touch are copied as their already-compressed bytes from the
+# template archive; only modified parts are serialised and deflated again.
+
+_LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+_CENTRAL_HEADER = struct.Struct("<4s4B4HL2L5H2L")
+_END_RECORD = struct.Struct("<4s4H2LH")
+_DOS_EPOCH = (0 << 9) | (1 << 5) | 1  # 1980-01-01, same as Word's own packages
+_UTF8_NAME = 0x800  # general purpose flag: the name is UTF-8, not cp437
+
+# A zip member ready to be written: compressed data plus the header fields
+Entry = collections.namedtuple("Entry", "method dostime dosdate crc data size")
+
+def stored(blob):
+    # For members that are already compressed, e.g. whole .docx files
+    return Entry(zipfile.ZIP_STORED, 0, _DOS_EPOCH, zlib.crc32(blob), blob, len(blob))
+
+def deflate(blob, level=6):
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    data = compressor.compress(blob) + compressor.flush()
+    return Entry(zipfile.ZIP_DEFLATED, 0, _DOS_EPOCH, zlib.crc32(blob), data, len(blob))
+
+class Archive:
+    def __init__(self, blob):
+        self.blob = blob
+        with zipfile.ZipFile(io.BytesIO(blob)) as zf:
+            self.entries = {info.filename: info for info in zf.infolist()}
+        # partname -> Part of the document parsed from this archive, filled in
+        # by the owner; a part is unmodified while it is still this very object
+        self.pristine = {}
+
+    def raw(self, name):
+        info = self.entries[name]
+        offset = info.header_offset
+        name_len, extra_len = struct.unpack("<HH", self.blob[offset + 26:offset + 30])
+        start = offset + 30 + name_len + extra_len
+        year, month, day, hour, minute, second = info.date_time
+        return Entry(
+            info.compress_type,
+            hour << 11 | minute << 5 | second // 2,
+            (year - 1980) << 9 | month << 5 | day,
+            info.CRC,
+            self.blob[start:start + info.compress_size],
+            info.file_size,
+        )
+
+class _Writer:
+    def __init__(self, out):
+        self.out = out
+        self.offset = 0
+        self.central = []
+
+    def add(self, name, entry):
+        encoded = name.encode("utf-8")
+        flags = 0 if name.isascii() else _UTF8_NAME
+        # Keep only the header fields for the central directory, not the data
+        self.central.append((encoded, flags, entry._replace(data=None), len(entry.data), self.offset))
+        header = _LOCAL_HEADER.pack(
+            b"PK\003\004", 20, 0, flags, entry.method, entry.dostime, entry.dosdate,
+            entry.crc, len(entry.data), entry.size, len(encoded), 0,
+        )
+        self.out.write(header)
+        self.out.write(encoded)
+        self.out.write(entry.data)
+        self.offset += len(header) + len(encoded) + len(entry.data)
+
+    def close(self):
+        start = self.offset
+        for encoded, flags, entry, compressed_size, offset in self.central:
+            header = _CENTRAL_HEADER.pack(
+                b"PK\001\002", 20, 0, 20, 0, flags, entry.method, entry.dostime, entry.dosdate,
+                entry.crc, compressed_size, entry.size, len(encoded), 0, 0, 0, 0, 0, offset,
+            )
+            self.out.write(header)
+            self.out.write(encoded)
+            self.offset += len(header) + len(encoded)
+        count = len(self.central)
+        self.out.write(_END_RECORD.pack(
+            b"PK\005\006", 0, 0, count, count, self.offset - start, start, 0
+        ))
+
+def can_passthrough(archive, package):
+    # Same set of parts as the template: content types and package rels still hold
+    names = {part.partname.membername for part in package.iter_parts()}
+    return names <= set(archive.entries) and all(
+        name in names
+        for name in archive.entries
+        if not name.endswith(".rels") and name != "[Content_Types].xml"
+    )
+
+def package_entries(archive, package):
+    # (name, Entry) for content copied or re-encoded as is, (name, part) for
+    # parts whose XML the caller has to serialise
+    yield "[Content_Types].xml", archive.raw("[Content_Types].xml")
+    yield "_rels/.rels", archive.raw("_rels/.rels")
+    for part in package.iter_parts():
+        name = part.partname.membername
+        rels_name = part.partname.rels_uri.membername
+        if archive.pristine.get(part.partname) is part:
+            yield name, archive.raw(name)
+            if rels_name in archive.entries:
+                yield rels_name, archive.raw(rels_name)
+            continue
+        yield name, part
+        if len(part.rels):
+            yield rels_name, deflate(part.rels.xml)
+
+def write_entries(entries, target):
+    if isinstance(target, (str, bytes)) or hasattr(target, "__fspath__"):
+        with open(target, "wb") as f:
+            return write_entries(entries, f)
+    writer = _Writer(target)
+    for name, entry in entries:
+        writer.add(name, entry)
+    writer.close()
+
+class _Chunks(list):
+    write = list.append
+
+def stream_entries(entries):
+    # write_entries as a generator of bytes, yielding after every member so
+    # only one member is held in memory at a time
+    chunks = _Chunks()
+    writer = _Writer(chunks)
+    for name, entry in entries:
+        writer.add(name, entry)
+        yield b"".join(chunks)
+        chunks.clear()
+    writer.close()
+    yield b"".join(chunks)
+
+def write(archive, package, target):
+    write_entries(
+        (
+            (name, item if isinstance(item, Entry) else deflate(item.blob))
+            for name, item in package_entries(archive, package)
+        ),
+        target,
+    )
@@ -0,0 +1,40 @@
+import gc
+import os
+
+# Production server: `gunicorn -c gunicorn.conf.py`. The app is imported and
+# warmed up once in the master, then forked into WEB_CONCURRENCY workers that
+# share the loaded templates copy-on-write. SIGTERM stops gracefully and
+# SIGHUP replaces the workers one by one (with preload, new code needs a
+# restart). /healthz and /readyz are the liveness and readiness checks.
+
+wsgi_app = "app:app"
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+preload_app = True
+workers = int(os.environ.get("WEB_CONCURRENCY", os.cpu_count() or 1))
+
+# Threaded workers: requests waiting for a render slot (QUOTE_MAX_RENDERS +
+# QUOTE_MAX_RENDER_QUEUE) hold a thread each, so keep spare threads for chat
+worker_class = "gthread"
+threads = int(os.environ.get(
+    "WEB_THREADS",
+    int(os.environ.get("QUOTE_MAX_RENDERS", 4)) + int(os.environ.get("QUOTE_MAX_RENDER_QUEUE", 16)) + 8,
+))
+
+timeout = int(os.environ.get("WEB_TIMEOUT", 60))
+graceful_timeout = int(os.environ.get("WEB_GRACEFUL_TIMEOUT", 30))
+keepalive = 5
+accesslog = "-"
+
+def when_ready(server):
+    from app import warm_up
+
+    server.log.info("Warmed up in %.0f ms", warm_up() * 1000)
+    # Keep the warm objects out of the collector's way so it doesn't touch
+    # (and un-share) their pages in the workers
+    gc.freeze()
+
+def post_worker_init(worker):
+    # No-op after the warm-up in the master; covers preload_app = False
+    from app import warm_up
+
+    warm_up()
@@ -0,0 +1,293 @@
+import json
+import logging
+import multiprocessing
+import os
+import signal
+import sqlite3
+import threading
+import time
+import uuid
+
+import batch
+
+# Quotation jobs: the web tier records the quote inputs in a SQLite file and
+# returns at once; `flask run-jobs` renders them in a pool of worker processes.
+# Jobs survive restarts, a job whose worker died or stopped sending heartbeats
+# goes back to the queue, and finished artefacts are deleted once their TTL
+# has passed.
+
+log = logging.getLogger(__name__)
+
+QUEUED, RUNNING, DONE, FAILED, EXPIRED = "queued", "running", "done", "failed", "expired"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    created REAL NOT NULL,
+    started REAL,
+    heartbeat REAL,
+    finished REAL,
+    expires REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    filename TEXT,
+    artefact TEXT,
+    size INTEGER,
+    render_ms REAL,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_status_created ON jobs (status, created);
+"""
+
+class JobStore:
+    def __init__(self, path, artefact_dir):
+        self.path = path
+        self.artefact_dir = artefact_dir
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        os.makedirs(artefact_dir, exist_ok=True)
+        with self._connect() as db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.executescript(_SCHEMA)
+            columns = {row["name"] for row in db.execute("PRAGMA table_info(jobs)")}
+            if "heartbeat" not in columns:  # created before heartbeats
+                db.execute("ALTER TABLE jobs ADD COLUMN heartbeat REAL")
+
+    def _connect(self):
+        # One short-lived connection per operation: safe across threads and
+        # forked workers alike
+        db = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        db.row_factory = sqlite3.Row
+        return _Closing(db)
+
+    def submit(self, payload):
+        job_id = uuid.uuid4().hex
+        with self._connect() as db:
+            db.execute(
+                "INSERT INTO jobs (id, status, payload, created) VALUES (?, ?, ?, ?)",
+                (job_id, QUEUED, json.dumps(payload, ensure_ascii=False), time.time()),
+            )
+        return job_id
+
+    def get(self, job_id):
+        with self._connect() as db:
+            row = db.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return dict(row) if row else None
+
+    def claim(self, worker):
+        # Oldest queued job, marked running in the same write transaction so
+        # two workers can never take the same one
+        with self._connect() as db:
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                row = db.execute(
+                    "SELECT * FROM jobs WHERE status = ? ORDER BY created LIMIT 1", (QUEUED,)
+                ).fetchone()
+                if row is None:
+                    return None
+                now = time.time()
+                db.execute(
+                    "UPDATE jobs SET status = ?, started = ?, heartbeat = ?, worker = ?, attempts = attempts + 1"
+                    " WHERE id = ?",
+                    (RUNNING, now, now, worker, row["id"]),
+                )
+            finally:
+                db.execute("COMMIT")
+        job = dict(row)
+        job.update(status=RUNNING, started=now, heartbeat=now, worker=worker, attempts=row["attempts"] + 1)
+        return job
+
+    def beat(self, job_id, worker):
+        # The worker is still rendering the job
+        with self._connect() as db:
+            db.execute(
+                "UPDATE jobs SET heartbeat = ? WHERE id = ? AND status = ? AND worker = ?",
+                (time.time(), job_id, RUNNING, worker),
+            )
+
+    def finish(self, job_id, filename, artefact, size, render_ms, ttl):
+        now = time.time()
+        with self._connect() as db:
+            db.execute(
+                "UPDATE jobs SET status = ?, finished = ?, expires = ?, filename = ?, artefact = ?,"
+                " size = ?, render_ms = ?, error = NULL WHERE id = ?",
+                (DONE, now, now + ttl, filename, artefact, size, render_ms, job_id),
+            )
+
+    def fail(self, job_id, error):
+        with self._connect() as db:
+            db.execute(
+                "UPDATE jobs SET status = ?, finished = ?, error = ? WHERE id = ?",
+                (FAILED, time.time(), error, job_id),
+            )
+
+    def _requeue(self, condition, params, max_attempts):
+        # Running jobs matching condition go back to the queue, or fail once
+        # they have had max_attempts
+        with self._connect() as db:
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                failed = db.execute(
+                    f"UPDATE jobs SET status = ?, finished = ?, error = ? "
+                    f"WHERE status = ? AND {condition} AND attempts >= ?",
+                    (FAILED, time.time(), "worker stopped responding", RUNNING, *params, max_attempts),
+                ).rowcount
+                requeued = db.execute(
+                    f"UPDATE jobs SET status = ?, started = NULL, heartbeat = NULL, worker = NULL"
+                    f" WHERE status = ? AND {condition}",
+                    (QUEUED, RUNNING, *params),
+                ).rowcount
+            finally:
+                db.execute("COMMIT")
+        return requeued, failed
+
+    def requeue_stale(self, stale_after, max_attempts):
+        # Running jobs without a heartbeat for stale_after seconds: the worker
+        # hung or its host went away. A long render keeps beating.
+        return self._requeue("COALESCE(heartbeat, started) < ?", (time.time() - stale_after,), max_attempts)
+
+    def requeue_worker(self, worker, max_attempts):
+        return self._requeue("worker = ?", (worker,), max_attempts)
+
+    def sweep(self, now=None):
+        # Delete artefacts past their TTL; the job row stays as "expired"
+        now = time.time() if now is None else now
+        with self._connect() as db:
+            rows = db.execute(
+                "SELECT id, artefact FROM jobs WHERE status = ? AND expires < ?", (DONE, now)
+            ).fetchall()
+            for row in rows:
+                if row["artefact"]:
+                    try:
+                        os.remove(row["artefact"])
+                    except FileNotFoundError:
+                        pass
+                db.execute(
+                    "UPDATE jobs SET status = ?, artefact = NULL WHERE id = ?", (EXPIRED, row["id"])
+                )
+        return len(rows)
+
+    def counts(self):
+        with self._connect() as db:
+            return dict(db.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall())
+
+class _Closing:
+    def __init__(self, db):
+        self.db = db
+
+    def __enter__(self):
+        return self.db
+
+    def __exit__(self, *exc):
+        self.db.close()
+
+def describe(job):
+    # Public view of a job row: no payload or server paths
+    view = {
+        "id": job["id"],
+        "status": job["status"],
+        "created": job["created"],
+        "attempts": job["attempts"],
+    }
+    if job["started"]:
+        view["queued_ms"] = round((job["started"] - job["created"]) * 1000, 1)
+    if job["finished"] and job["started"]:
+        view["run_ms"] = round((job["finished"] - job["started"]) * 1000, 1)
+    if job["render_ms"] is not None:
+        view["render_ms"] = round(job["render_ms"], 1)
+    if job["status"] in (DONE, EXPIRED):
+        view["filename"] = job["filename"]
+        view["expires"] = job["expires"]
+    if job["status"] == DONE:
+        view["size"] = job["size"]
+    if job["error"]:
+        view["error"] = job["error"]
+    return view
+
+# --- Workers ---
+
+def run_job(store, job, ttl):
+    payload = json.loads(job["payload"])
+    start = time.perf_counter()
+    try:
+        filename, blob, _ = batch.render_item(
+            payload["values"], payload["today"], payload["engine"], payload["passthrough"],
+        )
+    except (TypeError, ValueError) as e:
+        store.fail(job["id"], str(e))
+        return
+    except Exception as e:
+        # The traceback stays in the log: the error is shown to the client
+        log.exception("Job %s failed", job["id"])
+        store.fail(job["id"], f"render failed: {e}")
+        return
+    render_ms = (time.perf_counter() - start) * 1000
+    artefact = os.path.join(store.artefact_dir, f"{job['id']}.docx")
+    tmp = f"{artefact}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(blob)
+    os.replace(tmp, artefact)
+    store.finish(job["id"], filename, artefact, len(blob), render_ms, ttl)
+
+def worker_name(pid):
+    return f"{os.uname().nodename}:{pid}"
+
+def _keep_alive(store, job_id, worker, interval, done):
+    while not done.wait(interval):
+        store.beat(job_id, worker)
+
+def _worker(store_path, artefact_dir, ttl, poll_interval, heartbeat_interval):
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # the supervisor handles Ctrl-C
+    stopping = []
+    signal.signal(signal.SIGTERM, lambda *_: stopping.append(True))
+    store = JobStore(store_path, artefact_dir)
+    name = worker_name(os.getpid())
+    while not stopping:
+        job = store.claim(name)
+        if job is None:
+            time.sleep(poll_interval)
+            continue
+        done = threading.Event()
+        heartbeat = threading.Thread(
+            target=_keep_alive, args=(store, job["id"], name, heartbeat_interval, done), daemon=True,
+        )
+        heartbeat.start()
+        try:
+            run_job(store, job, ttl)
+        finally:
+            done.set()
+            heartbeat.join()
+
+def run_workers(store, processes, ttl, stale_after, max_attempts=3, poll_interval=0.5, echo=print):
+    # Supervisor: keeps `processes` workers alive, requeues jobs of dead
+    # workers and sweeps expired artefacts until interrupted
+    args = (store.path, store.artefact_dir, ttl, poll_interval, stale_after / 3)
+    workers = []
+    try:
+        while True:
+            for worker in workers:
+                if not worker.is_alive():
+                    # Whatever it was rendering goes straight back to the queue
+                    requeued, failed = store.requeue_worker(worker_name(worker.pid), max_attempts)
+                    echo(f"worker {worker.pid} exited ({worker.exitcode}), requeued {requeued} job(s)")
+            workers = [worker for worker in workers if worker.is_alive()]
+            while len(workers) < processes:
+                worker = multiprocessing.Process(target=_worker, args=args, daemon=True)
+                worker.start()
+                workers.append(worker)
+                echo(f"started worker {worker.pid}")
+            requeued, failed = store.requeue_stale(stale_after, max_attempts)
+            if requeued or failed:
+                echo(f"requeued {requeued} stale job(s), gave up on {failed}")
+            expired = store.sweep()
+            if expired:
+                echo(f"expired {expired} artefact(s)")
+            time.sleep(min(stale_after, ttl, 5))
+    except KeyboardInterrupt:
+        echo("stopping workers")
+    finally:
+        for worker in workers:
+            worker.terminate()  # SIGTERM: the current job finishes first
+        for worker in workers:
+            worker.join()
@@ -0,0 +1,192 @@
+import math
+
+import rates
+
+# Fee rules shared by the quotation documents and the JSON pricing API, with
+# the tariffs from the rate catalogue. Keep the arithmetic exactly as written:
+# the documents and the API must agree to the last fils.
+
+def _rate_unit(entry):
+    return f"{entry['unit']} / {entry['period'].upper()}"
+
+def rate_for(storage_type, cat=None):
+    # (rate, unit, rate unit, per year?, open yard?); unknown types price at 0
+    cat = cat or rates.catalogue()
+    entry = cat.storage_type(storage_type)
+    if entry is not None:
+        return (
+            entry["rate"], entry["unit"], _rate_unit(entry),
+            entry["period"] == "year", not entry.get("wms", True),
+        )
+    # Free-text types keep the old substring rules
+    lower = storage_type.lower()
+    is_open_yard = "open yard" in lower
+    for entry in cat.yearly():
+        if entry["short"].lower() in lower:
+            return entry["rate"], entry["unit"], _rate_unit(entry), True, is_open_yard
+    return 0, "CBM", "CBM / DAY", None, is_open_yard
+
+def compute(storage_type, volume, days, include_wms):
+    cat = rates.catalogue()
+    rate, unit, rate_unit, yearly, is_open_yard = rate_for(storage_type, cat)
+    if yearly is None:
+        storage_fee = 0
+    elif yearly:
+        storage_fee = volume * days * (rate / 365)
+    else:
+        storage_fee = volume * days * rate
+
+    storage_fee = round(storage_fee, 2)
+    months = max(1, days // 30)
+    wms_fee = 0 if is_open_yard or not include_wms else cat.wms_monthly_fee * months
+    total_fee = round(storage_fee + wms_fee, 2)
+    return {
+        "storage_type": storage_type,
+        "volume": volume,
+        "days": days,
+        "include_wms": include_wms,
+        "is_open_yard": is_open_yard,
+        "rate": rate,
+        "unit": unit,
+        "rate_unit": rate_unit,
+        "months": months,
+        "storage_fee": storage_fee,
+        "wms_fee": wms_fee,
+        "total_fee": total_fee,
+        "currency": cat.currency,
+    }
+
+def combine(quotes):
+    # Totals of a multi-line quotation, each line priced by compute()
+    return {
+        "storage_fee": round(sum(quote["storage_fee"] for quote in quotes), 2),
+        "wms_fee": sum(quote["wms_fee"] for quote in quotes),
+        "total_fee": round(sum(quote["total_fee"] for quote in quotes), 2),
+        "currency": quotes[0]["currency"] if quotes else rates.catalogue().currency,
+    }
+
+def parse(values):
+    # Same coercion as the quotation form; JSON callers may also send numbers
+    # and a boolean wms
+    storage_type = values.get("storage_type", "")
+    if not isinstance(storage_type, str):
+        raise ValueError("storage_type must be a string")
+    volume = values.get("volume", 0)
+    days = values.get("days", 0)
+    if isinstance(volume, bool) or isinstance(days, bool):
+        raise ValueError("volume and days must be numbers")
+    volume = float(volume)
+    if not math.isfinite(volume):
+        raise ValueError("volume must be a finite number")
+    if isinstance(days, float) and not days.is_integer():
+        raise ValueError("days must be a whole number")
+    days = int(days)
+    wms = values.get("wms", "No")
+    include_wms = wms is True or wms == "Yes"
+    return storage_type, volume, days, include_wms
+
+def unit_rate_text(quote):
+    return f"{quote['rate']:.2f} {quote['currency']} / {quote['rate_unit']}"
+
+def wms_status(quote):
+    if quote["is_open_yard"]:
+        return ""
+    return "INCLUDED" if quote["include_wms"] else "NOT INCLUDED"
+
+# --- What-if grid ---
+
+def axis(spec, integer=False, limit=None):
+    # A list of values, a comma separated string, or "start:stop:step" with
+    # stop included
+    if isinstance(spec, str):
+        if ":" in spec:
+            parts = spec.split(":")
+            if len(parts) != 3:
+                raise ValueError(f"expected start:stop:step, got {spec!r}")
+            spec = dict(zip(("start", "stop", "step"), parts))
+        else:
+            spec = [part for part in spec.split(",") if part.strip()]
+    cast = int if integer else float
+    if isinstance(spec, dict):
+        start, stop, step = (cast(spec[key]) for key in ("start", "stop", "step"))
+        if step <= 0 or stop < start:
+            raise ValueError("a range needs start <= stop and a positive step")
+        count = int((stop - start) / step + 1e-9) + 1
+        if limit is not None and count > limit:
+            raise ValueError(f"range has {count} values, more than {limit}")
+        values = [start + i * step for i in range(count)]
+    elif isinstance(spec, list):
+        if any(isinstance(value, bool) for value in spec):
+            raise ValueError("axis values must be numbers")
+        values = [cast(value) for value in spec]
+    else:
+        raise ValueError("expected a list or a start:stop:step range")
+    if not values:
+        raise ValueError("axis is empty")
+    if not integer and not all(math.isfinite(value) for value in values):
+        raise ValueError("axis values must be finite")
+    return values
+
+def wms_axis(spec):
+    # [False, True], "Yes,No", ["Yes"], ...
+    if isinstance(spec, str):
+        spec = [part.strip() for part in spec.split(",") if part.strip()]
+    if not isinstance(spec, list) or not spec:
+        raise ValueError("wms must be a non-empty list")
+    flags = []
+    for value in spec:
+        if value in (True, "Yes"):
+            flags.append(True)
+        elif value in (False, "No"):
+            flags.append(False)
+        else:
+            raise ValueError(f"wms values are Yes/No or true/false, got {value!r}")
+    return flags
+
+def _round2(np, x):
+    # Python's round() rounds the exact binary value; np.round rounds x * 100,
+    # whose own rounding error (under an ulp) can cross a half. Redo the few
+    # cells that close to one.
+    scaled = x * 100
+    near = np.floor(scaled)
+    np.subtract(scaled, near, out=near)
+    near -= 0.5
+    np.abs(near, out=near)
+    near = near <= 2 * np.abs(np.spacing(scaled))
+    out = np.rint(scaled, out=scaled)  # np.round(x, 2) without the extra copy
+    out /= 100
+    idx = np.nonzero(near)
+    out[idx] = [round(float(value), 2) for value in x[idx]]
+    return out
+
+def grid(storage_types, volumes, days, wms=(False, True)):
+    # Fee arrays shaped (storage type, wms, days, volume), cell for cell what
+    # compute() gives
+    import numpy as np
+
+    cat = rates.catalogue()
+    volumes = np.asarray(volumes, dtype=np.float64)
+    days = np.asarray(days, dtype=np.int64)
+    wms = np.asarray(wms, dtype=bool)
+    base = volumes[None, :] * days[:, None]  # volume * days, (days, volume)
+
+    storage_fee = np.empty((len(storage_types),) + base.shape)
+    open_yard = np.empty(len(storage_types), dtype=bool)
+    for i, storage_type in enumerate(storage_types):
+        rate, _, _, yearly, open_yard[i] = rate_for(storage_type, cat)
+        if yearly is None:
+            storage_fee[i] = 0
+        elif yearly:
+            storage_fee[i] = base * (rate / 365)
+        else:
+            storage_fee[i] = base * rate
+    storage_fee = _round2(np, storage_fee)
+
+    months = np.maximum(1, days // 30)
+    charged = wms[None, :] & ~open_yard[:, None]  # (storage type, wms)
+    wms_fee = np.where(charged[:, :, None], cat.wms_monthly_fee * months[None, None, :], 0)
+    shape = (len(storage_types), len(wms), len(days), len(volumes))
+    storage_fee = np.broadcast_to(storage_fee[:, None, :, :], shape)
+    wms_fee = np.broadcast_to(wms_fee[:, :, :, None], shape)
+    total_fee = _round2(np, storage_fee + wms_fee)
+    return {"storage_fee": storage_fee, "wms_fee": wms_fee, "total_fee": total_fee, "currency": cat.currency}
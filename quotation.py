@@ -0,0 +1,734 @@
+from docx import Document
+from docx.oxml.ns import nsmap, qn
+from docx.parts.document import DocumentPart
+from docx.parts.hdrftr import FooterPart, HeaderPart
+from docx.text.paragraph import Paragraph
+from docx.text.run import Run
+from lxml import etree
+import collections
+import copy
+import io
+import logging
+import os
+import re
+import threading
+import time
+import uuid
+import weakref
+import zipfile
+
+import docx_package
+import pricing
+import rates
+
+log = logging.getLogger(__name__)
+
+DOCX_MIMETYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+TEMPLATE_DIR = "templates"
+COMPILED_DIR = os.path.join(TEMPLATE_DIR, "compiled")
+
+# The <option>s offered by form.html
+STORAGE_TYPES = [
+    "AC",
+    "Non-AC",
+    "Open Shed",
+    "Chemicals AC",
+    "Chemicals Non-AC",
+    "Open Yard – KIZAD",
+    "Open Yard – Mussafah",
+]
+
+VAS_TAGS = ["VAS_STANDARD", "VAS_CHEMICAL", "VAS_OPENYARD"]
+
+PLACEHOLDER_RE = re.compile(r"\{\{[A-Z0-9_]+\}\}")
+_BLOCK_TAG_RE = re.compile(r"\[(/?)(VAS_[A-Z]+)\]")
+
+_VAS_TEMPLATES = {
+    "standard": ("Standard VAS.docx", "VAS_STANDARD"),
+    "chemical": ("Chemical VAS.docx", "VAS_CHEMICAL"),
+    "open_yard": ("Open Yard VAS.docx", "VAS_OPENYARD"),
+}
+
+def vas_group(storage_type):
+    # The catalogue entry that prices a storage type also picks its template
+    # and VAS block; free-text types keep the old substring rules, open yard
+    # first as in pricing.rate_for()
+    entry = rates.catalogue().storage_type(storage_type)
+    if entry is not None:
+        return entry["vas"]
+    if "open yard" in storage_type.lower():
+        return "open_yard"
+    elif "chemical" in storage_type.lower():
+        return "chemical"
+    return "standard"
+
+def template_path_for(storage_type):
+    return os.path.join(TEMPLATE_DIR, _VAS_TEMPLATES[vas_group(storage_type)][0])
+
+def kept_vas_tag(storage_type):
+    return _VAS_TEMPLATES[vas_group(storage_type)][1]
+
+def _variant_name(storage_type):
+    # "KIZAD", "open yard kizad", ... share the variant of "Open Yard – KIZAD"
+    entry = rates.catalogue().storage_type(storage_type)
+    return entry["name"] if entry is not None else storage_type
+
+# --- Parsed template cache ---
+# Each template is parsed once per process. Requests get a deep copy in which
+# only the parts we edit (the body, plus any header or footer holding
+# placeholders or block tags) are duplicated; images, styles, theme, numbering
+# etc. are shared read-only with the cached original.
+_template_cache = {}
+_template_lock = threading.Lock()
+_MUTABLE_PARTS = (DocumentPart, HeaderPart, FooterPart)
+# package -> docx_package.Archive it was parsed from, for passthrough saves
+_archives = weakref.WeakKeyDictionary()
+
+def _cached(template_path):
+    with _template_lock:
+        doc = _template_cache.get(template_path)
+        if doc is None:
+            with open(template_path, "rb") as f:
+                archive = docx_package.Archive(f.read())
+            doc = Document(io.BytesIO(archive.blob))
+            package = doc.part.package
+            archive.pristine = {part.partname: part for part in package.iter_parts()}
+            _archives[package] = archive
+            _template_cache[template_path] = doc
+    return doc
+
+def _is_mutable(part):
+    if isinstance(part, DocumentPart):
+        return True
+    if isinstance(part, (HeaderPart, FooterPart)):
+        text = "".join(part.element.itertext())
+        return "{{" in text or "[VAS_" in text or "[/VAS_" in text
+    return False
+
+# package -> its read-only parts; templates and variants never change once
+# cached, so this is worked out once per package rather than per clone
+_immutable_parts = weakref.WeakKeyDictionary()
+
+def clone(doc):
+    package = doc.part.package
+    immutable = _immutable_parts.get(package)
+    if immutable is None:
+        immutable = _immutable_parts[package] = [
+            part for part in package.iter_parts() if not _is_mutable(part)
+        ]
+    # A fresh memo each time: deepcopy records every copy it makes in it
+    copied = copy.deepcopy(doc, {id(part): part for part in immutable})
+    if package in _archives:
+        _archives[copied.part.package] = _archives[package]
+    return copied
+
+def load_template(template_path):
+    return clone(_cached(template_path))
+
+def _xml_roots(doc):
+    # Body, headers and footers: every part a placeholder can live in
+    return [
+        part.element
+        for part in doc.part.package.iter_parts()
+        if isinstance(part, _MUTABLE_PARTS)
+    ]
+
+# --- Placeholder replacement and block pruning (raw templates) ---
+# One pass over every paragraph of the body, headers and footers, nested
+# tables included. Placeholders are replaced even if Word split them across
+# runs; [TAG] ... [/TAG] blocks are removed together with everything between
+# the two tag paragraphs in the same container.
+def _substitute(text, mapping):
+    return PLACEHOLDER_RE.sub(lambda m: mapping.get(m.group(0), m.group(0)), text)
+
+def _replace_in_paragraph(paragraph, text, mapping):
+    new_text = _substitute(text, mapping)
+    if new_text != text:
+        runs = paragraph.runs
+        for run in runs:
+            run.text = ""
+        runs[0].text = new_text
+
+def _remove_range(start, end):
+    el = start
+    while el is not None:
+        nxt = el.getnext()
+        if el.tag != qn("w:sectPr"):
+            el.getparent().remove(el)
+        if el is end:
+            break
+        el = nxt
+
+def fill_and_prune(doc, mapping, drop_tags):
+    blocks = []
+    open_blocks = {}
+    for root in _xml_roots(doc):
+        for p in list(root.iter(qn("w:p"))):
+            paragraph = Paragraph(p, None)
+            text = paragraph.text
+            if "[" in text:
+                container = p.getparent()
+                for closing, tag in _BLOCK_TAG_RE.findall(text):
+                    if tag not in drop_tags:
+                        continue
+                    if not closing and (container, tag) not in open_blocks:
+                        open_blocks[container, tag] = p
+                    elif closing and (container, tag) in open_blocks:
+                        blocks.append((open_blocks.pop((container, tag)), p))
+                    elif closing:
+                        blocks.append((p, p))
+            if mapping and "{{" in text and paragraph.runs:
+                _replace_in_paragraph(paragraph, "".join(run.text for run in paragraph.runs), mapping)
+    # An unclosed block runs to the end of its container
+    for start in open_blocks.values():
+        blocks.append((start, None))
+    for start, end in blocks:
+        if start.getparent() is not None:
+            _remove_range(start, end)
+
+def prune_vas_blocks(doc, storage_type, mapping=None):
+    # Keep only the relevant VAS section
+    keep = kept_vas_tag(storage_type)
+    fill_and_prune(doc, mapping, {tag for tag in VAS_TAGS if tag != keep})
+
+# --- Ahead-of-time compiled variants ---
+# A compiled variant is a template already pruned for one storage type, with
+# every {{KEY}} merged into a single run, so a request only fills values in.
+_PLAIN_RUN_CHILDREN = {
+    qn("w:rPr"), qn("w:t"), qn("w:tab"), qn("w:br"), qn("w:cr"),
+    qn("w:noBreakHyphen"), qn("w:ptab"), qn("w:lastRenderedPageBreak"),
+}
+
+def _is_plain_run(run):
+    return all(child.tag in _PLAIN_RUN_CHILDREN for child in run._r)
+
+def _iter_paragraphs(doc):
+    for root in _xml_roots(doc):
+        for p in root.iter(qn("w:p")):
+            yield p
+
+def _merge_placeholder_runs(paragraph):
+    # Returns the problems found; on success each {{KEY}} ends up in one run
+    runs = paragraph.runs
+    texts = [run.text for run in runs]
+    full_text = "".join(texts)
+    problems = []
+    if full_text.count("{{") != len(PLACEHOLDER_RE.findall(full_text)):
+        problems.append(f"malformed or cross-paragraph placeholder in {full_text.strip()[:60]!r}")
+    starts = []
+    pos = 0
+    for text in texts:
+        starts.append(pos)
+        pos += len(text)
+
+    def run_at(offset):
+        i = len(starts) - 1
+        while starts[i] > offset:
+            i -= 1
+        return i
+
+    for m in reversed(list(PLACEHOLDER_RE.finditer(full_text))):
+        first, last = run_at(m.start()), run_at(m.end() - 1)
+        if first == last:
+            continue
+        involved = runs[first:last + 1]
+        if not all(_is_plain_run(run) for run in involved):
+            problems.append(f"{m.group(0)} is split across runs holding non-text content")
+            continue
+        texts[first] = texts[first][:m.start() - starts[first]] + m.group(0)
+        for i in range(first + 1, last):
+            texts[i] = ""
+        texts[last] = texts[last][m.end() - starts[last]:]
+        for i in range(first, last + 1):
+            if texts[i] or i == first:
+                runs[i].text = texts[i]
+            else:
+                runs[i]._r.getparent().remove(runs[i]._r)
+    if paragraph.text.count("{{") > full_text.count("{{"):
+        problems.append("placeholder outside a plain run (hyperlink or field)")
+    return problems
+
+def _check_block_tags(doc):
+    problems = []
+    open_tags = {}
+    for p in _iter_paragraphs(doc):
+        container = p.getparent()
+        text = "".join(t.text or "" for t in p.iter(qn("w:t")))
+        for closing, tag in _BLOCK_TAG_RE.findall(text):
+            key = (container, tag)
+            if not closing:
+                if key in open_tags:
+                    problems.append(f"[{tag}] opened twice before [/{tag}]")
+                open_tags[key] = tag
+            elif open_tags.pop(key, None) is None:
+                problems.append(f"[/{tag}] without a matching [{tag}] in the same container")
+    for tag in open_tags.values():
+        problems.append(f"[{tag}] is never closed")
+    return problems
+
+def compile_variant(storage_type):
+    doc = load_template(template_path_for(storage_type))
+    problems = _check_block_tags(doc)
+    for p in _iter_paragraphs(doc):
+        problems.extend(_merge_placeholder_runs(Paragraph(p, None)))
+    prune_vas_blocks(doc, storage_type)
+    return doc, problems
+
+_template_version = None
+
+def template_version():
+    # Changes whenever a source template is replaced, so cached quotes rendered
+    # from the old one are never served
+    global _template_version
+    if _template_version is None:
+        stats = sorted(
+            (name, st.st_size, st.st_mtime_ns)
+            for name in os.listdir(TEMPLATE_DIR)
+            if name.endswith(".docx")
+            for st in [os.stat(os.path.join(TEMPLATE_DIR, name))]
+        )
+        _template_version = repr(stats)
+    return _template_version
+
+def variant_filename(storage_type):
+    slug = re.sub(r"[^a-z0-9]+", "-", storage_type.lower()).strip("-")
+    return f"{slug}.docx"
+
+def compile_all(out_dir=COMPILED_DIR):
+    os.makedirs(out_dir, exist_ok=True)
+    report = {}
+    for storage_type in STORAGE_TYPES:
+        doc, problems = compile_variant(storage_type)
+        if not problems:
+            doc.save(os.path.join(out_dir, variant_filename(storage_type)))
+        report[storage_type] = problems
+    return report
+
+_variants = {}
+_variant_lock = threading.Lock()
+
+def load_compiled(compiled_dir=COMPILED_DIR):
+    # Pick up artefacts written by `flask compile-templates`; stale ones
+    # (older than their source template) are ignored.
+    loaded = []
+    for storage_type in STORAGE_TYPES:
+        path = os.path.join(compiled_dir, variant_filename(storage_type))
+        if not os.path.exists(path):
+            continue
+        if os.path.getmtime(path) < os.path.getmtime(template_path_for(storage_type)):
+            continue
+        with _variant_lock:
+            _variants[storage_type] = _cached(path)
+        loaded.append(storage_type)
+    return loaded
+
+def variant(storage_type):
+    # Compiled variant for a known storage type, compiled in memory when no
+    # artefact was loaded; None when the storage type is unknown or its
+    # template can't be compiled.
+    storage_type = _variant_name(storage_type)
+    if storage_type not in STORAGE_TYPES:
+        return None
+    with _variant_lock:
+        if storage_type not in _variants:
+            doc, problems = compile_variant(storage_type)
+            for problem in problems:
+                log.warning("%s template not compiled: %s", storage_type, problem)
+            _variants[storage_type] = None if problems else doc
+        return _variants[storage_type]
+
+def fill_variant(doc, mapping):
+    # Returns the filled runs with their template text, see Revision
+    return _fill_runs(_xml_roots(doc), mapping)
+
+def _fill_runs(roots, mapping):
+    # Placeholders of a compiled variant each sit whole in one run
+    runs = {}
+    for root in roots:
+        for t in root.iter(qn("w:t")):
+            if t.text and "{{" in t.text:
+                r = t.getparent()
+                runs[id(r)] = r
+    slots = []
+    for r in runs.values():
+        run = Run(r, None)
+        text = run.text
+        run.text = _substitute(text, mapping)
+        slots.append((r, text))
+    return slots
+
+def new_document(storage_type, mapping):
+    compiled = variant(storage_type)
+    if compiled is not None:
+        doc = clone(compiled)
+        fill_variant(doc, mapping)
+        return doc
+    doc = load_template(template_path_for(storage_type))
+    prune_vas_blocks(doc, storage_type, mapping)
+    return doc
+
+def save(doc, target, passthrough=True):
+    # Passthrough copies untouched template parts as already-compressed bytes
+    archive = _archives.get(doc.part.package)
+    if passthrough and archive is not None and docx_package.can_passthrough(archive, doc.part.package):
+        docx_package.write(archive, doc.part.package, target)
+    else:
+        doc.save(target)
+
+def persist(blob, directory, filename):
+    # Atomic write, so concurrent quotes for the same commodity never leave a
+    # half-written file behind
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, filename.replace("/", "_").replace("\\", "_"))
+    tmp = f"{path}.{uuid.uuid4().hex}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(blob)
+    os.replace(tmp, path)
+    return path
+
+def placeholders(quote, commodity, today_str):
+    # Template fields for a quote priced by pricing.compute()
+    currency = quote["currency"]
+    return {
+        "{{STORAGE_TYPE}}": quote["storage_type"],
+        "{{DAYS}}": str(quote["days"]),
+        "{{VOLUME}}": str(quote["volume"]),
+        "{{UNIT}}": quote["unit"],
+        "{{WMS_STATUS}}": pricing.wms_status(quote),
+        "{{UNIT_RATE}}": pricing.unit_rate_text(quote),
+        "{{STORAGE_FEE}}": f"{quote['storage_fee']:,.2f} {currency}",
+        "{{WMS_FEE}}": f"{quote['wms_fee']:,.2f} {currency}",
+        "{{TOTAL_FEE}}": f"{quote['total_fee']:,.2f} {currency}",
+        "{{TODAY_DATE}}": today_str,
+        "{{COMMODITY}}": commodity or "N/A",
+    }
+
+def download_name(commodity):
+    return f"Quotation_{commodity or 'quotation'}.docx"
+
+# --- Multi-line quotations ---
+# Several storage lines in one document: the summary paragraphs and fee rows
+# holding per-line placeholders are repeated once per line, every line's VAS
+# block is kept, and the WMS and total fees are summed. One template copy and
+# one save however many lines there are.
+LINE_PLACEHOLDERS = [
+    "{{STORAGE_TYPE}}", "{{DAYS}}", "{{VOLUME}}", "{{UNIT}}",
+    "{{WMS_STATUS}}", "{{UNIT_RATE}}", "{{STORAGE_FEE}}",
+]
+_ID_ATTRS = (qn("w14:paraId"), qn("w14:textId"))
+_WITH_IDS = etree.XPath(
+    "descendant-or-self::*[@w14:paraId or @w14:textId]", namespaces={"w14": nsmap["w14"]}
+)
+
+def _text(el):
+    return "".join(t.text or "" for t in el.iter(qn("w:t")))
+
+def _strip_ids(el):
+    # Copies must not repeat the paragraph ids of their originals
+    for node in _WITH_IDS(el):
+        for attr in _ID_ATTRS:
+            node.attrib.pop(attr, None)
+    return el
+
+def _vas_block(doc, tag):
+    # Body elements from the [TAG] paragraph to the [/TAG] one
+    block = []
+    for el in doc.element.body:
+        if el.tag == qn("w:sectPr"):
+            break
+        text = _text(el) if el.tag == qn("w:p") else ""
+        if not block and f"[{tag}]" not in text:
+            continue
+        block.append(el)
+        if f"[/{tag}]" in text:
+            break
+    return block
+
+def _line_units(doc):
+    # Runs of consecutive body paragraphs, and of consecutive table rows,
+    # that hold per-line placeholders
+    units = []
+    containers = [(doc.element.body, qn("w:p"))]
+    containers += [(tbl, qn("w:tr")) for tbl in doc.element.body.iter(qn("w:tbl"))]
+    for container, tag in containers:
+        unit = []
+        for el in container:
+            text = _text(el) if el.tag == tag else ""
+            if "{{" in text and any(key in text for key in LINE_PLACEHOLDERS):
+                unit.append(el)
+            elif unit:
+                units.append(unit)
+                unit = []
+        if unit:
+            units.append(unit)
+    return units
+
+def _fill_element(el, mapping, compiled):
+    if compiled:
+        _fill_runs([el], mapping)
+        return
+    for p in el.iter(qn("w:p")):
+        paragraph = Paragraph(p, None)
+        runs = paragraph.runs
+        if runs:
+            _replace_in_paragraph(paragraph, "".join(run.text for run in runs), mapping)
+
+def render_lines(quotes, totals, commodity, today_str, target, passthrough=True):
+    # quotes from pricing.compute(), one per line, totals from pricing.combine()
+    if not quotes:
+        raise ValueError("a quotation needs at least one storage line")
+    # An indoor template if any line is indoor, so the WMS row is there
+    base = next((q for q in quotes if not q["is_open_yard"]), quotes[0])["storage_type"]
+    base_tag = kept_vas_tag(base)
+    compiled = variant(base)
+    if compiled is not None:
+        doc = clone(compiled)
+    else:
+        doc = load_template(template_path_for(base))
+        fill_and_prune(doc, None, {tag for tag in VAS_TAGS if tag != base_tag})
+
+    # The other lines' VAS blocks follow the base one
+    block = _vas_block(doc, base_tag)
+    anchor = block[-1] if block else doc.element.body[-2]
+    kept = {base_tag}
+    for quote in quotes:
+        storage_type = quote["storage_type"]
+        tag = kept_vas_tag(storage_type)
+        if tag in kept:
+            continue
+        kept.add(tag)
+        source = variant(storage_type) or _cached(template_path_for(storage_type))
+        for el in _vas_block(source, tag):
+            el = _strip_ids(copy.deepcopy(el))
+            anchor.addnext(el)
+            anchor = el
+
+    base_open_yard = base_tag == "VAS_OPENYARD"
+    for unit in _line_units(doc):
+        groups = [unit]
+        for _ in quotes[1:]:
+            last = groups[-1][-1]
+            group = []
+            for el in unit:
+                el = _strip_ids(copy.deepcopy(el))
+                last.addnext(el)
+                last = el
+                group.append(el)
+            groups.append(group)
+        for quote, group in zip(quotes, groups):
+            mapping = placeholders(quote, commodity, today_str)
+            for el in group:
+                if quote["is_open_yard"] and not base_open_yard and "{{WMS_STATUS}}" in _text(el):
+                    el.getparent().remove(el)
+                    continue
+                _fill_element(el, mapping, compiled is not None)
+                if len(quotes) > 1 and el.tag == qn("w:tr"):
+                    # "Storage Fee – AC", "Storage Fee – Open Yard – KIZAD", ...
+                    texts = list(el.find(qn("w:tc")).iter(qn("w:t")))
+                    if texts:
+                        texts[-1].text = f"{texts[-1].text} – {quote['storage_type']}"
+
+    currency = totals["currency"]
+    mapping = {
+        "{{WMS_FEE}}": f"{totals['wms_fee']:,.2f} {currency}",
+        "{{TOTAL_FEE}}": f"{totals['total_fee']:,.2f} {currency}",
+        "{{TODAY_DATE}}": today_str,
+        "{{COMMODITY}}": commodity or "N/A",
+    }
+    if compiled is not None:
+        fill_variant(doc, mapping)
+    else:
+        fill_and_prune(doc, mapping, ())
+    save(doc, target, passthrough=passthrough)
+
+# --- Segment renderer ---
+# Alternative engine for compiled variants: each part holding placeholders is
+# serialised once and split into static byte segments around {{KEY}} slots.
+# A render joins the segments with XML-escaped values and zips the result,
+# without building any python-docx objects.
+_PLACEHOLDER_BYTES_RE = re.compile(rb"(\{\{[A-Z0-9_]+\}\})")
+_INVALID_XML_CHARS_RE = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+_segment_templates = {}
+
+def _xml_text(value):
+    # Same result as python-docx's run.text setter: tabs and line breaks
+    # become w:tab / w:br siblings of the surrounding w:t
+    if _INVALID_XML_CHARS_RE.search(value):
+        raise ValueError("All strings must be XML compatible")
+    value = value.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;")
+    value = value.replace("\r\n", "\n").replace("\r", "\n")
+    value = value.replace("\t", '</w:t><w:tab/><w:t xml:space="preserve">')
+    value = value.replace("\n", '</w:t><w:br/><w:t xml:space="preserve">')
+    return value.encode("utf-8")
+
+class SegmentTemplate:
+    def __init__(self, doc):
+        package = doc.part.package
+        # The body and any header or footer with placeholders are split even
+        # when unchanged from the archive, as they are in a variant read from
+        # disk
+        mutable = {part.partname.membername: part for part in package.iter_parts() if _is_mutable(part)}
+        self.entries = []
+        for name, item in docx_package.package_entries(_archives[package], package):
+            if isinstance(item, docx_package.Entry):
+                if name not in mutable:
+                    self.entries.append((name, item))
+                    continue
+                item = mutable[name]
+            pieces = _PLACEHOLDER_BYTES_RE.split(item.blob)
+            if len(pieces) == 1:
+                self.entries.append((name, docx_package.deflate(pieces[0])))
+            else:
+                self.entries.append((name, pieces))
+
+    def _render_entries(self, mapping):
+        for name, item in self.entries:
+            if isinstance(item, docx_package.Entry):
+                yield name, item
+                continue
+            pieces = list(item)
+            for i in range(1, len(pieces), 2):
+                key = pieces[i].decode("ascii")
+                if key in mapping:
+                    pieces[i] = _xml_text(mapping[key])
+            yield name, docx_package.deflate(b"".join(pieces))
+
+    def render(self, mapping, target):
+        docx_package.write_entries(self._render_entries(mapping), target)
+
+def segment_template(storage_type):
+    storage_type = _variant_name(storage_type)
+    compiled = variant(storage_type)
+    if compiled is None:
+        return None
+    with _variant_lock:
+        if storage_type not in _segment_templates:
+            _segment_templates[storage_type] = SegmentTemplate(compiled)
+        return _segment_templates[storage_type]
+
+ENGINES = ("docx", "segments")
+
+def render(storage_type, mapping, target, engine="docx", passthrough=True):
+    # The segment engine only covers compiled variants; anything else goes
+    # through python-docx
+    segments = segment_template(storage_type) if engine == "segments" else None
+    if segments is not None:
+        segments.render(mapping, target)
+        return "segments"
+    save(new_document(storage_type, mapping), target, passthrough=passthrough)
+    return "docx"
+
+def document_text(source):
+    # Paragraph texts of body, headers and footers, for comparing engines
+    doc = Document(source)
+    return [Paragraph(p, None).text for p in _iter_paragraphs(doc)]
+
+_TEXT_PART_RE = re.compile(r"word/(document|header\d*|footer\d*)\.xml")
+
+def unfilled_placeholders(blob):
+    # {{KEY}} placeholders still in the body, headers or footers of a
+    # rendered .docx, for checking output
+    found = set()
+    with zipfile.ZipFile(io.BytesIO(blob)) as z:
+        for name in z.namelist():
+            if _TEXT_PART_RE.fullmatch(name):
+                found.update(key.decode("ascii") for key in _PLACEHOLDER_BYTES_RE.findall(z.read(name)))
+    return sorted(found)
+
+def compare_engines(storage_type, mapping):
+    outputs = {}
+    for engine in ENGINES:
+        buffer = io.BytesIO()
+        render(storage_type, mapping, buffer, engine=engine)
+        buffer.seek(0)
+        outputs[engine] = document_text(buffer)
+    return outputs["docx"] == outputs["segments"], outputs
+
+# --- Quotation revisions ---
+# A quote rendered from a compiled variant remembers which runs each
+# placeholder landed in. A revision of the same storage type then rewrites
+# only the runs whose values changed and saves again. A quote served from
+# the quote cache gets a revision too, whose document is only built if it is
+# ever revised.
+class Revision:
+    def __init__(self, storage_type, doc, slots, mapping):
+        # doc and slots are None until a cached quote is first revised
+        self.storage_type = storage_type
+        self.doc = doc
+        self.slots = slots
+        self.mapping = dict(mapping)
+        self.lock = threading.Lock()
+
+    def patch(self, mapping):
+        changed = {
+            key for key in set(mapping) | set(self.mapping)
+            if mapping.get(key) != self.mapping.get(key)
+        }
+        if changed:
+            for r, text in self.slots:
+                if changed.intersection(PLACEHOLDER_RE.findall(text)):
+                    Run(r, None).text = _substitute(text, mapping)
+        self.mapping = dict(mapping)
+        return changed
+
+class RevisionStore:
+    # Short-lived, size-bounded map of quote id -> Revision
+    def __init__(self, max_entries=64, ttl=900):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._items = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, revision):
+        quote_id = uuid.uuid4().hex
+        with self._lock:
+            self._items[quote_id] = (revision, time.monotonic())
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+        return quote_id
+
+    def get(self, quote_id):
+        with self._lock:
+            item = self._items.pop(quote_id, None)
+            if item is None or time.monotonic() - item[1] > self.ttl:
+                return None
+            self._items[quote_id] = (item[0], time.monotonic())
+            return item[0]
+
+def render_revision(store, storage_type, mapping, target, quote_id=None, passthrough=True):
+    # Returns (quote_id, patched); quote_id is None when the storage type has
+    # no compiled variant and the quote can't be revised incrementally
+    revision = store.get(quote_id) if quote_id else None
+    if revision is not None and revision.storage_type == storage_type:
+        with revision.lock:
+            if revision.doc is None:
+                revision.doc = clone(variant(storage_type))
+                revision.slots = fill_variant(revision.doc, revision.mapping)
+            revision.patch(mapping)
+            save(revision.doc, target, passthrough=passthrough)
+        return quote_id, True
+    compiled = variant(storage_type)
+    if compiled is None:
+        save(new_document(storage_type, mapping), target, passthrough=passthrough)
+        return None, False
+    doc = clone(compiled)
+    revision = Revision(storage_type, doc, fill_variant(doc, mapping), mapping)
+    with revision.lock:
+        save(doc, target, passthrough=passthrough)
+    return store.put(revision), False
+
+def track_revision(store, storage_type, mapping, quote_id=None):
+    # The quote id render_revision would have returned, for a quote served
+    # without rendering; the document is built if the quote is revised
+    revision = store.get(quote_id) if quote_id else None
+    if revision is not None and revision.storage_type == storage_type:
+        with revision.lock:
+            if revision.doc is None:
+                revision.mapping = dict(mapping)
+            else:
+                revision.patch(mapping)
+        return quote_id
+    if variant(storage_type) is None:
+        return None
+    return store.put(Revision(storage_type, None, None, mapping))
@@ -0,0 +1,103 @@
+import hashlib
+import json
+import os
+import threading
+import uuid
+
+# Content-addressed cache of rendered quotations on disk. Files are named by
+# the hash of the quote inputs, written atomically, and evicted least recently
+# used first (by mtime) once the directory grows past max_bytes. The size is
+# measured from the directory itself at each eviction, so workers sharing it
+# keep it under one limit; a file another worker evicted is just a miss.
+
+class QuoteCache:
+    def __init__(self, directory, max_bytes):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = 0  # as of the last scan
+        self._bytes = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            self._evict()
+
+    @staticmethod
+    def key(*inputs):
+        return hashlib.sha256(json.dumps(inputs, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.docx")
+
+    def get(self, key):
+        try:
+            with open(self._path(key), "rb") as f:
+                blob = f.read()
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        try:
+            # mtime is the LRU order, shared by every worker and kept across restarts
+            os.utime(self._path(key))
+        except FileNotFoundError:
+            pass
+        return blob
+
+    def put(self, key, blob):
+        if len(blob) > self.max_bytes:
+            return
+        tmp = os.path.join(self.directory, f".{key}.{uuid.uuid4().hex}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(blob)
+        os.replace(tmp, self._path(key))
+        with self._lock:
+            self._evict()
+
+    def _scan(self):
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if not entry.name.endswith(".docx"):
+                    continue
+                try:
+                    st = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((st.st_mtime, entry.path, st.st_size))
+        entries.sort()
+        return entries
+
+    def _evict(self):
+        entries = self._scan()
+        total = sum(size for _, _, size in entries)
+        evicted = 0
+        for _, path, size in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                self.evictions += 1
+            except FileNotFoundError:
+                pass  # another worker got there first
+            total -= size
+            evicted += 1
+        self._entries = len(entries) - evicted
+        self._bytes = total
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": self._entries,
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
@@ -0,0 +1,427 @@
+from flask import Blueprint, current_app, jsonify, render_template, request, send_file, url_for
+import click
+import csv
+import importlib.util
+import io
+import os
+from datetime import datetime
+
+import admission
+import batch
+import jobs
+import pricing
+import quotation
+import rates
+from quote_cache import QuoteCache
+
+# The quotation side: the form, document rendering, batches, jobs and the
+# pricing API, with the template CLI commands. Served unless APP_PROFILE=chat.
+
+bp = Blueprint("quotes", __name__, cli_group=None)
+
+revisions = None
+quote_cache = None
+job_store = None
+render_gate = None
+
+@bp.record_once
+def _setup(state):
+    global revisions, quote_cache, job_store, render_gate
+    config = state.app.config
+    revisions = quotation.RevisionStore(max_entries=config["REVISION_MAX_ENTRIES"], ttl=config["REVISION_TTL"])
+    quote_cache = (
+        QuoteCache(config["QUOTE_CACHE_DIR"], config["QUOTE_CACHE_MAX_BYTES"])
+        if config["QUOTE_CACHE_MAX_BYTES"] > 0 else None
+    )
+    job_store = jobs.JobStore(config["JOBS_DB"], config["JOBS_DIR"])
+    render_gate = admission.RenderGate(
+        config["MAX_RENDERS"], config["MAX_RENDER_QUEUE"], config["RENDER_QUEUE_TIMEOUT"],
+    )
+
+# Ready-to-fill templates written by `flask compile-templates`
+quotation.load_compiled()
+
+def warm_up():
+    # Compiled variants and segments, and one render per storage type
+    quotation.template_version()
+    today_str = datetime.today().strftime("%d %b %Y")
+    for storage_type in quotation.STORAGE_TYPES:
+        placeholders = quotation.placeholders(pricing.compute(storage_type, 1.0, 30, True), "", today_str)
+        for engine in quotation.ENGINES:
+            quotation.render(storage_type, placeholders, io.BytesIO(), engine=engine)
+
+def stats():
+    return {
+        "quote_cache": quote_cache.stats() if quote_cache is not None else None,
+        "jobs": job_store.counts(),
+        "renders": render_gate.stats(),
+    }
+
+@bp.cli.command("compile-templates")
+def compile_templates():
+    """Prune and pre-merge one template per storage type into templates/compiled."""
+    report = quotation.compile_all()
+    failed = False
+    for storage_type, problems in report.items():
+        if problems:
+            failed = True
+            click.echo(f"FAILED {storage_type}")
+            for problem in problems:
+                click.echo(f"  - {problem}")
+        else:
+            click.echo(f"ok     {storage_type} -> {quotation.variant_filename(storage_type)}")
+    if failed:
+        raise SystemExit(1)
+
+@bp.cli.command("optimize-templates")
+@click.option("--dpi", default=220, show_default=True, help="Resolution kept at the displayed image size.")
+@click.option("--quality", default=85, show_default=True, help="JPEG quality for recompressed images.")
+@click.option("--output-dir", default=None, help="Write here instead of replacing the templates.")
+@click.option("--dry-run", is_flag=True, help="Only report the savings.")
+def optimize_templates(dpi, quality, output_dir, dry_run):
+    """Recompress template images to their displayed size and drop unused parts."""
+    import template_media
+
+    if importlib.util.find_spec("PIL") is None:
+        raise click.ClickException("optimize-templates needs Pillow: pip install Pillow")
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    total = 0
+    for name in sorted(os.listdir(quotation.TEMPLATE_DIR)):
+        if not name.endswith(".docx"):
+            continue
+        source = os.path.join(quotation.TEMPLATE_DIR, name)
+        target = None if dry_run else os.path.join(output_dir or quotation.TEMPLATE_DIR, name)
+        result = template_media.optimize(source, target, dpi=dpi, quality=quality)
+        saved = result["before"] - result["after"]
+        total += saved
+        click.echo(f"{name}: {result['before']:,} -> {result['after']:,} bytes (saved {saved:,})")
+        for dropped in result["dropped"]:
+            click.echo(f"  dropped {dropped}")
+    click.echo(f"total saved: {total:,} bytes")
+    if not dry_run and not output_dir:
+        click.echo("Run `flask --app app compile-templates` to rebuild the compiled variants.")
+
+@bp.cli.command("compare-engines")
+def compare_engines():
+    """Render every storage type with both engines and diff the document text."""
+    mapping = {
+        key: f"{key[2:-2].title()} & <{i}>\tx"
+        for i, key in enumerate([
+            "{{STORAGE_TYPE}}", "{{DAYS}}", "{{VOLUME}}", "{{UNIT}}", "{{WMS_STATUS}}",
+            "{{UNIT_RATE}}", "{{STORAGE_FEE}}", "{{WMS_FEE}}", "{{TOTAL_FEE}}",
+            "{{TODAY_DATE}}", "{{COMMODITY}}",
+        ])
+    }
+    failed = False
+    for storage_type in quotation.STORAGE_TYPES:
+        same, outputs = quotation.compare_engines(storage_type, mapping)
+        click.echo(f"{'same' if same else 'DIFF'}   {storage_type}")
+        if not same:
+            failed = True
+            for a, b in zip(outputs["docx"], outputs["segments"]):
+                if a != b:
+                    click.echo(f"  docx:     {a!r}\n  segments: {b!r}")
+    if failed:
+        raise SystemExit(1)
+
+@bp.cli.command("run-jobs")
+@click.option("--processes", type=int, default=None, help="Worker processes  [default: JOBS_WORKERS]")
+def run_jobs(processes):
+    """Render queued quotation jobs until interrupted."""
+    processes = processes or current_app.config["JOBS_WORKERS"]
+    click.echo(f"rendering jobs from {current_app.config['JOBS_DB']} with {processes} worker(s)")
+    jobs.run_workers(
+        job_store, processes, ttl=current_app.config["JOBS_TTL"],
+        stale_after=current_app.config["JOBS_STALE_AFTER"], echo=click.echo,
+    )
+
+@bp.route("/")
+def index():
+    return render_template("form.html")
+
+@bp.errorhandler(admission.Overloaded)
+def overloaded(e):
+    response = jsonify({"error": f"too many quotations in progress: {e.reason}", "retry_after": e.retry_after})
+    response.status_code = 503
+    response.headers["Retry-After"] = str(e.retry_after)
+    return response
+
+def _engine():
+    engine = request.args.get("engine", current_app.config["RENDER_ENGINE"])
+    return engine if engine in quotation.ENGINES else current_app.config["RENDER_ENGINE"]
+
+@bp.route("/generate", methods=["GET", "POST"])
+def generate():
+    storage_type = request.values.get("storage_type", "")
+    volume = float(request.values.get("volume", 0))
+    days = int(request.values.get("days", 0))
+    include_wms = request.values.get("wms", "No") == "Yes"
+    commodity = request.values.get("commodity", "").strip()
+    today_str = datetime.today().strftime("%d %b %Y")
+
+    quote = pricing.compute(storage_type, volume, days, include_wms)
+    placeholders = quotation.placeholders(quote, commodity, today_str)
+    filename = quotation.download_name(commodity)
+    engine = _engine()
+    passthrough = current_app.config["SAVE_MODE"] == "passthrough"
+
+    cache_key = None
+    if quote_cache is not None:
+        cache_key = QuoteCache.key(
+            storage_type, volume, days, include_wms, commodity, today_str,
+            engine, quotation.template_version(), rates.catalogue().version,
+        )
+        if request.method == "GET" and request.if_none_match.contains(cache_key):
+            response = current_app.response_class(status=304)
+            response.set_etag(cache_key)
+            return response
+
+    quote_id = request.values.get("quote_id")
+    revision = "cached"
+    blob = quote_cache.get(cache_key) if cache_key else None
+    if blob is None:
+        buffer = io.BytesIO()
+        with render_gate.slot():
+            if engine == "docx":
+                # Revisions of a quote only patch the values that changed
+                quote_id, patched = quotation.render_revision(
+                    revisions, storage_type, placeholders, buffer,
+                    quote_id=quote_id, passthrough=passthrough,
+                )
+                revision = "patched" if patched else "rendered"
+            else:
+                quote_id = None
+                quotation.render(storage_type, placeholders, buffer, engine=engine, passthrough=passthrough)
+        blob = buffer.getvalue()
+        if cache_key:
+            quote_cache.put(cache_key, blob)
+    elif engine == "docx":
+        # Still a quote the client can revise
+        quote_id = quotation.track_revision(revisions, storage_type, placeholders, quote_id)
+    else:
+        quote_id = None
+
+    if current_app.config["PERSIST_DIR"]:
+        quotation.persist(blob, current_app.config["PERSIST_DIR"], filename)
+    response = send_file(
+        io.BytesIO(blob), as_attachment=True, download_name=filename,
+        mimetype=quotation.DOCX_MIMETYPE, etag=cache_key or False,
+    )
+    if quote_id:
+        response.headers["X-Quote-Id"] = quote_id
+        response.headers["X-Quote-Revision"] = revision
+    return response
+
+@bp.route("/generate/lines", methods=["POST"])
+def generate_lines():
+    # Several storage lines in one document: JSON {"lines": [...], "commodity": ...}
+    # or the form fields repeated once per line
+    data = request.get_json(silent=True) if request.is_json else None
+    if isinstance(data, dict):
+        lines = data.get("lines")
+        commodity = data.get("commodity") or ""
+    else:
+        fields = ["storage_type", "volume", "days", "wms"]
+        columns = [request.values.getlist(field) for field in fields]
+        lines = [dict(zip(fields, row)) for row in zip(*columns)]
+        commodity = request.values.get("commodity", "")
+    if not isinstance(lines, list) or not lines or not isinstance(commodity, str):
+        return jsonify({"error": "expected one or more storage lines and a commodity"}), 400
+    if len(lines) > current_app.config["MAX_QUOTE_LINES"]:
+        return jsonify({"error": f"at most {current_app.config['MAX_QUOTE_LINES']} storage lines per quotation"}), 400
+    try:
+        quotes = [batch.price_item(line)[0] for line in lines]
+    except (TypeError, ValueError) as e:
+        return jsonify({"error": str(e)}), 400
+    commodity = commodity.strip()
+    totals = pricing.combine(quotes)
+    today_str = datetime.today().strftime("%d %b %Y")
+    filename = quotation.download_name(commodity)
+
+    cache_key = None
+    blob = None
+    if quote_cache is not None:
+        cache_key = QuoteCache.key(
+            "lines", [[q["storage_type"], q["volume"], q["days"], q["include_wms"]] for q in quotes],
+            commodity, today_str, quotation.template_version(), rates.catalogue().version,
+        )
+        blob = quote_cache.get(cache_key)
+    if blob is None:
+        buffer = io.BytesIO()
+        with render_gate.slot():
+            quotation.render_lines(
+                quotes, totals, commodity, today_str, buffer,
+                passthrough=current_app.config["SAVE_MODE"] == "passthrough",
+            )
+        blob = buffer.getvalue()
+        if cache_key:
+            quote_cache.put(cache_key, blob)
+
+    if current_app.config["PERSIST_DIR"]:
+        quotation.persist(blob, current_app.config["PERSIST_DIR"], filename)
+    response = send_file(
+        io.BytesIO(blob), as_attachment=True, download_name=filename,
+        mimetype=quotation.DOCX_MIMETYPE, etag=cache_key or False,
+    )
+    response.headers["X-Quote-Total"] = f"{totals['total_fee']:.2f} {totals['currency']}"
+    return response
+
+@bp.route("/generate/batch", methods=["POST"])
+def generate_batch():
+    # A JSON list of form values (or {"quotes": [...]}), a text/csv body or an
+    # uploaded CSV file; the ZIP streams back while the quotes render
+    if "file" in request.files:
+        items = batch.read_csv(request.files["file"].read().decode("utf-8", "replace"))
+    elif request.mimetype == "text/csv":
+        items = batch.read_csv(request.get_data(as_text=True))
+    else:
+        items = request.get_json(silent=True)
+        if isinstance(items, dict):
+            items = items.get("quotes")
+    if not isinstance(items, list):
+        return jsonify({"error": "expected a JSON list of quotes or a CSV with columns " + ", ".join(batch.FIELDS)}), 400
+    limit = current_app.config["MAX_BATCH_ITEMS"]
+    if len(items) > limit:
+        return jsonify({"error": f"batch has {len(items)} quotes, the limit is {limit}"}), 400
+
+    today_str = datetime.today().strftime("%d %b %Y")
+    chunks = batch.stream_zip(
+        items, today_str, engine=_engine(), passthrough=current_app.config["SAVE_MODE"] == "passthrough",
+    )
+    # The quotes render one after another, so the whole stream takes one slot
+    return current_app.response_class(
+        render_gate.hold(chunks), mimetype="application/zip",
+        headers={"Content-Disposition": "attachment; filename=quotations.zip"},
+    )
+
+@bp.route("/jobs", methods=["POST"])
+def submit_job():
+    # Same fields as /generate; returns at once with where to poll
+    values = request.get_json(silent=True) if request.is_json else None
+    if values is None:
+        values = request.values.to_dict()
+    try:
+        batch.price_item(values)
+    except (TypeError, ValueError) as e:
+        return jsonify({"error": str(e)}), 400
+    job_id = job_store.submit({
+        "values": values,
+        "today": datetime.today().strftime("%d %b %Y"),
+        "engine": _engine(),
+        "passthrough": current_app.config["SAVE_MODE"] == "passthrough",
+    })
+    response = jsonify({
+        "id": job_id,
+        "status": jobs.QUEUED,
+        "status_url": url_for(".job_status", job_id=job_id),
+        "download_url": url_for(".job_download", job_id=job_id),
+    })
+    response.status_code = 202
+    response.headers["Location"] = url_for(".job_status", job_id=job_id)
+    return response
+
+@bp.route("/jobs/<job_id>")
+def job_status(job_id):
+    job = job_store.get(job_id)
+    if job is None:
+        return jsonify({"error": "no such job"}), 404
+    return jsonify(jobs.describe(job))
+
+@bp.route("/jobs/<job_id>/download")
+def job_download(job_id):
+    job = job_store.get(job_id)
+    if job is None:
+        return jsonify({"error": "no such job"}), 404
+    if job["status"] == jobs.EXPIRED:
+        return jsonify(jobs.describe(job)), 410
+    if job["status"] != jobs.DONE:
+        return jsonify(jobs.describe(job)), 409
+    return send_file(
+        os.path.abspath(job["artefact"]), as_attachment=True, download_name=job["filename"],
+        mimetype=quotation.DOCX_MIMETYPE,
+    )
+
+@bp.route("/api/quote", methods=["GET", "POST"])
+def api_quote():
+    # Fees only, same rules as /generate without rendering a document. A JSON
+    # list prices many enquiries in one call.
+    data = request.get_json(silent=True) if request.is_json else None
+    if data is None:
+        data = request.values
+    many = isinstance(data, list)
+    results = []
+    for i, values in enumerate(data if many else [data]):
+        try:
+            if not hasattr(values, "get"):
+                raise ValueError("expected an object")
+            quote = pricing.compute(*pricing.parse(values))
+        except (TypeError, ValueError) as e:
+            error = {"error": str(e)}
+            if many:
+                error["index"] = i
+            return jsonify(error), 400
+        quote["unit_rate"] = pricing.unit_rate_text(quote)
+        results.append(quote)
+    return jsonify(results if many else results[0])
+
+@bp.route("/api/quote/grid", methods=["GET", "POST"])
+def api_quote_grid():
+    # Every combination of storage type x WMS x days x volume priced in one
+    # array operation; ?format=csv streams one row per cell instead
+    data = request.get_json(silent=True) if request.is_json else None
+    if data is None:
+        data = request.values
+    if not hasattr(data, "get"):
+        return jsonify({"error": "expected an object"}), 400
+    limit = current_app.config["MAX_GRID_CELLS"]
+    try:
+        storage_types = data.get("storage_types", list(quotation.STORAGE_TYPES))
+        if isinstance(storage_types, str):
+            storage_types = [part.strip() for part in storage_types.split(",") if part.strip()]
+        if not storage_types or not all(isinstance(t, str) for t in storage_types):
+            raise ValueError("storage_types must be a non-empty list of names")
+        if "volumes" not in data or "days" not in data:
+            raise ValueError("volumes and days are required")
+        volumes = pricing.axis(data["volumes"], limit=limit)
+        days = pricing.axis(data["days"], integer=True, limit=limit)
+        wms = pricing.wms_axis(data.get("wms", [False, True]))
+    except (KeyError, TypeError, ValueError) as e:
+        return jsonify({"error": str(e)}), 400
+    cells = len(storage_types) * len(wms) * len(days) * len(volumes)
+    if cells > limit:
+        return jsonify({"error": f"grid has {cells} cells, the limit is {limit}"}), 400
+
+    fees = pricing.grid(storage_types, volumes, days, wms)
+    if (data.get("format") or request.args.get("format")) == "csv":
+        def rows():
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(["storage_type", "wms", "days", "volume", "storage_fee", "wms_fee", "total_fee"])
+            for t, storage_type in enumerate(storage_types):
+                for w, include_wms in enumerate(wms):
+                    for d, day in enumerate(days):
+                        writer.writerows(zip(
+                            [storage_type] * len(volumes), ["Yes" if include_wms else "No"] * len(volumes),
+                            [day] * len(volumes), volumes,
+                            fees["storage_fee"][t, w, d].tolist(), fees["wms_fee"][t, w, d].tolist(),
+                            fees["total_fee"][t, w, d].tolist(),
+                        ))
+                        yield buffer.getvalue()
+                        buffer.seek(0)
+                        buffer.truncate()
+
+        return current_app.response_class(
+            rows(), mimetype="text/csv",
+            headers={"Content-Disposition": "attachment; filename=quote_grid.csv"},
+        )
+    return jsonify({
+        "storage_types": storage_types,
+        "wms": wms,
+        "days": days,
+        "volumes": volumes,
+        "currency": fees["currency"],
+        "storage_fee": fees["storage_fee"].tolist(),
+        "wms_fee": fees["wms_fee"].tolist(),
+        "total_fee": fees["total_fee"].tolist(),
+    })
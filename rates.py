@@ -0,0 +1,145 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+
+# Storage and VAS tariffs, kept in rates.json and shared by the quote pricing
+# and the chat replies. The file is checked for changes at most once per
+# CHECK_INTERVAL, so editing it updates every worker without a redeploy; a
+# file that fails to load leaves the previous catalogue in place.
+
+RATES_PATH = os.environ.get(
+    "QUOTE_RATES_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "rates.json")
+)
+CHECK_INTERVAL = 1.0
+
+log = logging.getLogger(__name__)
+
+_NAME_SEPARATORS_RE = re.compile(r"[\s\-–—_/]+")
+
+def normalise(name):
+    # "Open Yard – KIZAD", "open yard kizad" and "Open-Yard KIZAD" are one key
+    return _NAME_SEPARATORS_RE.sub(" ", name.lower()).strip()
+
+class Catalogue:
+    def __init__(self, data, version):
+        self.version = version
+        self.currency = data["currency"]
+        self.wms_monthly_fee = data["wms_monthly_fee"]
+        self.storage = data["storage"]
+        self.vas = data["vas"]
+        self.by_name = {}
+        for entry in self.storage:
+            for name in [entry["name"], entry["label"], entry["short"]] + entry.get("aliases", []):
+                self.by_name.setdefault(normalise(name), entry)
+        # Rendered chat replies, dropped with the catalogue on reload
+        self.replies = {}
+
+    def storage_type(self, name):
+        return self.by_name.get(normalise(name))
+
+    def yearly(self):
+        return [entry for entry in self.storage if entry["period"] == "year"]
+
+_current = None
+_stamp = None
+_checked = 0.0
+_lock = threading.Lock()
+
+def _load(path):
+    with open(path, "rb") as f:
+        blob = f.read()
+    return Catalogue(json.loads(blob), hashlib.sha256(blob).hexdigest()[:16])
+
+def reload(force=False):
+    global _current, _stamp, _checked
+    with _lock:
+        _checked = time.monotonic()
+        st = os.stat(RATES_PATH)
+        stamp = (st.st_mtime_ns, st.st_size)
+        if not force and _current is not None and stamp == _stamp:
+            return _current
+        try:
+            _current = _load(RATES_PATH)
+        except (OSError, ValueError, KeyError, TypeError):
+            if _current is None:
+                raise
+            log.exception("Keeping the previous rates: %s failed to load", RATES_PATH)
+        _stamp = stamp
+        return _current
+
+def catalogue():
+    if _current is None or time.monotonic() - _checked >= CHECK_INTERVAL:
+        try:
+            return reload()
+        except OSError:
+            if _current is None:
+                raise
+            log.exception("Keeping the previous rates: %s is unreadable", RATES_PATH)
+    return _current
+
+# --- Chat replies ---
+
+_GROUPS = {
+    "standard": ("📦", "Standard"),
+    "chemical": ("🧪", "Chemical"),
+    "open_yard": ("🏗", "Open Yard"),
+}
+_VAS_ICONS = {"standard": "🟦", "chemical": "🧪", "open_yard": "🏗"}
+
+def _storage_rate(cat, entry):
+    return f"{entry['rate']:,} {cat.currency}/{entry['unit']}/{entry['period']}"
+
+def _vas_lines(cat, group):
+    return [f"- {line['name']}: {line['rate']:,} {cat.currency}/{line['per']}" for line in cat.vas[group]]
+
+def _storage_overview(cat):
+    parts = ["**Here are the current DSV Abu Dhabi storage rates:**\n"]
+    for group, (icon, title) in _GROUPS.items():
+        entries = [entry for entry in cat.storage if entry["group"] == group]
+        parts.append(f"**{icon} {title} Storage:**")
+        parts.extend(f"- {entry['short']}: {_storage_rate(cat, entry)}" for entry in entries)
+        parts.append("")
+    parts.append("*WMS fee applies to indoor storage unless excluded. For a full quotation, fill out the form.*")
+    return "\n".join(parts)
+
+def _storage(cat, name):
+    entry = cat.storage_type(name)
+    if entry.get("wms", True):
+        title = _GROUPS[entry["vas"]][1]
+        return f"{entry['label']} storage is {_storage_rate(cat, entry)}. {title} VAS applies."
+    return f"{entry['label']} storage is **{_storage_rate(cat, entry)}**. WMS is excluded."
+
+def _open_yard_site(cat, name):
+    entry = cat.storage_type(name)
+    return f"- 📍 **{entry['short']} Open Yard**: {_storage_rate(cat, entry)}\n"
+
+def _vas_overview(cat):
+    sections = []
+    for group, (icon, title) in _GROUPS.items():
+        sections.append("\n".join([f"**{icon} {title} VAS:**"] + _vas_lines(cat, group)))
+    return "\n\n".join(sections)
+
+def _vas(cat, group, heading=False):
+    title = _GROUPS[group][1]
+    first = f"{_VAS_ICONS[group]} **{title} VAS includes:**" if heading else f"{title} VAS includes:"
+    return "\n".join([first] + _vas_lines(cat, group))
+
+_RENDERERS = {
+    "storage_overview": _storage_overview,
+    "storage": _storage,
+    "open_yard_site": _open_yard_site,
+    "vas_overview": _vas_overview,
+    "vas": _vas,
+}
+
+def reply(name, *args):
+    cat = catalogue()
+    key = (name,) + args
+    text = cat.replies.get(key)
+    if text is None:
+        text = cat.replies[key] = _RENDERERS[name](cat, *args)
+    return text
@@ -0,0 +1,129 @@
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+import click
+import json
+import os
+import time
+
+import batch
+import quotation
+import rates
+
+# Bulk quotation runs (month-end re-quoting, tenders) outside the web app:
+# quote inputs from a JSONL or CSV file, rendered like /generate by a process
+# pool using every core, one .docx per quote plus manifest.json.
+#
+#   python render_bulk.py quotes.csv --output-dir generated/bulk
+
+_engine = "docx"
+_passthrough = True
+_warm_seconds = None
+
+def _warm(engine, passthrough):
+    # Pool initializer: load the rates and every compiled variant up front so
+    # the first quotes of each worker don't pay for it
+    global _engine, _passthrough, _warm_seconds
+    start = time.perf_counter()
+    _engine, _passthrough = engine, passthrough
+    rates.catalogue()
+    quotation.load_compiled()
+    for storage_type in quotation.STORAGE_TYPES:
+        if engine == "segments":
+            quotation.segment_template(storage_type)
+        else:
+            quotation.variant(storage_type)
+    _warm_seconds = time.perf_counter() - start
+
+def _render(task):
+    global _warm_seconds
+    index, values, path, today_str = task
+    result = {"index": index, "price": 0.0, "render": 0.0, "write": 0.0, "warm": _warm_seconds}
+    _warm_seconds = None  # reported once per worker
+    try:
+        start = time.perf_counter()
+        quote, commodity = batch.price_item(values)
+        priced = time.perf_counter()
+        blob = batch.render_quote(quote, commodity, today_str, _engine, _passthrough)
+        rendered = time.perf_counter()
+        with open(path, "wb") as f:
+            f.write(blob)
+        written = time.perf_counter()
+    except Exception as e:
+        result["error"] = str(e) or type(e).__name__
+        return result
+    result.update(
+        file=os.path.basename(path), total_fee=quote["total_fee"],
+        price=priced - start, render=rendered - priced, write=written - rendered,
+    )
+    return result
+
+def read_items(path):
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    if path.lower().endswith(".csv"):
+        return batch.read_csv(text)
+    return batch.read_jsonl(text)
+
+@click.command()
+@click.argument("input_path", type=click.Path(exists=True, dir_okay=False))
+@click.option("--output-dir", default=os.path.join("generated", "bulk"), show_default=True)
+@click.option("--workers", type=int, default=None, help="Processes to use  [default: all cores]")
+@click.option("--engine", type=click.Choice(quotation.ENGINES), default="docx", show_default=True)
+@click.option("--save-mode", type=click.Choice(["passthrough", "docx"]), default="passthrough", show_default=True)
+@click.option("--date", "today_str", default=None, help="Quote date as printed, e.g. '01 Jan 2026'  [default: today]")
+def main(input_path, output_dir, workers, engine, save_mode, today_str):
+    """Render one quotation per line of a JSONL or CSV file across all cores."""
+    workers = workers or os.cpu_count() or 1
+    today_str = today_str or datetime.today().strftime("%d %b %Y")
+    started = time.perf_counter()
+
+    items = read_items(input_path)
+    os.makedirs(output_dir, exist_ok=True)
+    seen = {"manifest.json"}
+    tasks = []
+    for index, values in enumerate(items):
+        commodity = values.get("commodity") if isinstance(values, dict) else None
+        name = quotation.download_name(commodity.strip() if isinstance(commodity, str) else "")
+        tasks.append((index, values, os.path.join(output_dir, batch.member_name(name, seen)), today_str))
+    read = time.perf_counter() - started
+
+    rendering = time.perf_counter()
+    with ProcessPoolExecutor(workers, initializer=_warm, initargs=(engine, save_mode == "passthrough")) as pool:
+        chunksize = max(1, len(tasks) // (workers * 8))
+        results = list(pool.map(_render, tasks, chunksize=chunksize))
+    wall = time.perf_counter() - rendering
+
+    failed = [result for result in results if "error" in result]
+    with open(os.path.join(output_dir, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump({
+            "date": today_str,
+            "engine": engine,
+            "count": len(results),
+            "rendered": len(results) - len(failed),
+            "failed": len(failed),
+            "items": [
+                {key: result[key] for key in ("index", "file", "total_fee", "error") if key in result}
+                for result in results
+            ],
+        }, f, ensure_ascii=False, indent=2)
+
+    done = len(results) - len(failed)
+    click.echo(
+        f"rendered {done}/{len(results)} quotes into {output_dir} in {wall:.2f} s "
+        f"with {workers} worker{'s' if workers != 1 else ''}: {done / wall if wall else 0:.1f} quotes/s"
+    )
+    warm = [result["warm"] for result in results if result["warm"] is not None]
+    click.echo(f"  read     {read * 1000:9.1f} ms")
+    click.echo(f"  warm-up  {max(warm, default=0) * 1000:9.1f} ms  slowest worker")
+    for phase in ("price", "render", "write"):
+        spent = sum(result[phase] for result in results)
+        per_quote = spent / done * 1000 if done else 0
+        click.echo(f"  {phase:<8} {spent * 1000:9.1f} ms  {per_quote:.2f} ms/quote, summed over workers")
+    click.echo(f"  total    {(time.perf_counter() - started) * 1000:9.1f} ms")
+    for result in failed:
+        click.echo(f"FAILED item {result['index']}: {result['error']}", err=True)
+    if failed:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
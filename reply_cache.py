@@ -0,0 +1,93 @@
+import collections
+import json
+import os
+import threading
+import uuid
+
+# In-memory LRU cache of chat replies, keyed by the normalised message. The
+# cache carries a version (of the rules and the rates behind the replies)
+# and empties itself when that changes. The most recently used entries can
+# be written to a snapshot file and read back by the next process, so a
+# restart doesn't start cold; a snapshot of another version is ignored.
+
+class ReplyCache:
+    def __init__(self, max_entries, version):
+        self.max_entries = max_entries
+        self.version = version
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.purges = 0
+        self._entries = collections.OrderedDict()  # key -> value, oldest first
+        self._lock = threading.Lock()
+
+    def check_version(self, version):
+        if version != self.version:
+            self.purge(version)
+
+    def purge(self, version=None):
+        with self._lock:
+            dropped = len(self._entries)
+            self._entries.clear()
+            self.purges += 1
+            if version is not None:
+                self.version = version
+            return dropped
+
+    def get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def save(self, path, limit):
+        # The `limit` most recently used entries, newest first
+        with self._lock:
+            entries = [[key, intent, reply] for key, (intent, reply) in reversed(self._entries.items())][:limit]
+            version = self.version
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = f"{path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": version, "entries": entries}, f, ensure_ascii=False)
+        os.replace(tmp, path)
+        return len(entries)
+
+    def load(self, path):
+        # A missing, unreadable or outdated snapshot just means a cold start
+        try:
+            with open(path, encoding="utf-8") as f:
+                snapshot = json.load(f)
+            if snapshot["version"] != self.version:
+                return 0
+            entries = [(key, intent, reply) for key, intent, reply in snapshot["entries"][:self.max_entries]]
+        except (OSError, ValueError, KeyError, TypeError):
+            return 0
+        with self._lock:
+            for key, intent, reply in reversed(entries):
+                self._entries.setdefault(key, (intent, reply))
+        return len(entries)
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "purges": self.purges,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
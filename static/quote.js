@@ -0,0 +1,47 @@
+// Live fee estimate under the quotation form, priced by /api/quote with the
+// same rules as the generated document
+document.addEventListener('DOMContentLoaded', () => {
+  const form = document.querySelector('.quote-card form');
+  const out = document.getElementById('live-total');
+  if (!form || !out) return;
+
+  let timer = null;
+  let seq = 0;
+
+  function money(n) {
+    return n.toLocaleString('en-US', { minimumFractionDigits: 2, maximumFractionDigits: 2 });
+  }
+
+  function refresh() {
+    const body = {
+      storage_type: form.storage_type.value,
+      volume: form.volume.value,
+      days: form.days.value,
+      wms: form.wms.value
+    };
+    if (!body.storage_type || body.volume === '' || body.days === '') {
+      out.textContent = '';
+      return;
+    }
+    const mine = ++seq;
+    fetch(form.dataset.priceUrl, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify(body)
+    })
+      .then(res => res.ok ? res.json() : null)
+      .then(q => {
+        if (mine !== seq) return; // a newer request is on its way
+        out.textContent = q
+          ? `Storage ${money(q.storage_fee)} + WMS ${money(q.wms_fee)} = ${money(q.total_fee)} ${q.currency}`
+          : '';
+      })
+      .catch(() => { if (mine === seq) out.textContent = ''; });
+  }
+
+  form.addEventListener('input', () => {
+    clearTimeout(timer);
+    timer = setTimeout(refresh, 250);
+  });
+  form.addEventListener('change', refresh);
+});
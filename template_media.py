@@ -0,0 +1,161 @@
+from lxml import etree
+import io
+import os
+import posixpath
+import zipfile
+
+# Template preparation: recompress embedded images at the size they are
+# displayed, drop media and parts nothing refers to, and rewrite the .docx.
+# Needs Pillow, which the web app itself doesn't.
+
+NS = {
+    "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
+    "wp": "http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing",
+    "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
+    "rel": "http://schemas.openxmlformats.org/package/2006/relationships",
+    "ct": "http://schemas.openxmlformats.org/package/2006/content-types",
+}
+_R_ATTRS = [f"{{{NS['r']}}}{name}" for name in ("embed", "id", "link", "pict")]
+_IMAGE_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/image"
+EMU_PER_INCH = 914400
+
+def _rels_name(name):
+    folder, base = posixpath.split(name)
+    return posixpath.join(folder, "_rels", base + ".rels")
+
+def _rels(zf, name):
+    # rId -> (target member name, is external, relationship type)
+    rels_name = _rels_name(name)
+    if rels_name not in zf.namelist():
+        return {}
+    folder = posixpath.dirname(name)
+    out = {}
+    for rel in etree.fromstring(zf.read(rels_name)).iterfind("rel:Relationship", NS):
+        external = rel.get("TargetMode") == "External"
+        target = rel.get("Target")
+        if not external:
+            target = posixpath.normpath(posixpath.join(folder, target)).lstrip("/")
+        out[rel.get("Id")] = (target, external, rel.get("Type"))
+    return out
+
+def _display_inches(blip):
+    # Displayed width/height of the drawing holding this a:blip, widened by
+    # any cropping so the visible region keeps its resolution
+    holder = next(blip.iterancestors(f"{{{NS['wp']}}}inline", f"{{{NS['wp']}}}anchor"), None)
+    if holder is None:
+        return None
+    extent = holder.find("wp:extent", NS)
+    if extent is None:
+        return None
+    width = int(extent.get("cx")) / EMU_PER_INCH
+    height = int(extent.get("cy")) / EMU_PER_INCH
+    crop = blip.getparent().find("a:srcRect", NS)
+    if crop is not None:
+        keep_x = 1 - (int(crop.get("l", 0)) + int(crop.get("r", 0))) / 100000
+        keep_y = 1 - (int(crop.get("t", 0)) + int(crop.get("b", 0))) / 100000
+        width /= max(keep_x, 0.01)
+        height /= max(keep_y, 0.01)
+    return width, height
+
+def _walk(zf):
+    # Every part reachable from the package relationships, with the rIds each
+    # XML part actually uses and the display size of each referenced image
+    reachable = set()
+    used_rels = {}
+    sizes = {}
+    pending = [target for target, external, _ in _rels(zf, "").values() if not external]
+    while pending:
+        name = pending.pop()
+        if name in reachable or name not in zf.namelist():
+            continue
+        reachable.add(name)
+        rels = _rels(zf, name)
+        if not rels:
+            continue
+        # Only image relationships can be unused; styles, theme, settings etc.
+        # are implied by the part type rather than referenced by an r:id
+        used = {rid for rid, rel in rels.items() if rel[2] != _IMAGE_REL}
+        if name.endswith(".xml"):
+            root = etree.fromstring(zf.read(name))
+            for el in root.iter():
+                for attr in _R_ATTRS:
+                    rid = el.get(attr)
+                    if rid in rels:
+                        used.add(rid)
+            for blip in root.iterfind(".//a:blip", NS):
+                rid = blip.get(f"{{{NS['r']}}}embed")
+                size = _display_inches(blip)
+                if rid in rels and size:
+                    target = rels[rid][0]
+                    old = sizes.get(target, (0, 0))
+                    sizes[target] = (max(old[0], size[0]), max(old[1], size[1]))
+        else:
+            used = set(rels)
+        used_rels[name] = used
+        pending.extend(rels[rid][0] for rid in used if not rels[rid][1])
+    return reachable, used_rels, sizes
+
+def _recompress(blob, size, dpi, quality):
+    from PIL import Image
+
+    image = Image.open(io.BytesIO(blob))
+    fmt = image.format
+    if fmt not in ("JPEG", "PNG"):
+        return blob
+    if size:
+        target = (round(size[0] * dpi), round(size[1] * dpi))
+        if image.width > target[0] and image.height > target[1]:
+            scale = max(target[0] / image.width, target[1] / image.height)
+            image = image.resize(
+                (max(1, round(image.width * scale)), max(1, round(image.height * scale))),
+                Image.LANCZOS,
+            )
+    out = io.BytesIO()
+    if fmt == "JPEG":
+        image.save(out, "JPEG", quality=quality, optimize=True, progressive=True)
+    else:
+        image.save(out, "PNG", optimize=True)
+    return out.getvalue() if out.tell() < len(blob) else blob
+
+def optimize(source, target, dpi=220, quality=85):
+    with open(source, "rb") as f:
+        original = f.read()
+    zin = zipfile.ZipFile(io.BytesIO(original))
+    reachable, used_rels, sizes = _walk(zin)
+    keep = set(reachable) | {"[Content_Types].xml", "_rels/.rels"}
+    keep |= {_rels_name(name) for name in used_rels}
+    dropped = [name for name in zin.namelist() if name not in keep]
+
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as zout:
+        for info in zin.infolist():
+            name = info.filename
+            if name in dropped:
+                continue
+            blob = zin.read(name)
+            if name == "[Content_Types].xml":
+                types = etree.fromstring(blob)
+                for override in types.findall("ct:Override", NS):
+                    if override.get("PartName").lstrip("/") not in keep:
+                        types.remove(override)
+                blob = etree.tostring(types, xml_declaration=True, encoding="UTF-8", standalone=True)
+            elif name.endswith(".rels") and name != "_rels/.rels":
+                owner = posixpath.join(posixpath.dirname(posixpath.dirname(name)), posixpath.basename(name)[:-5])
+                rels = etree.fromstring(blob)
+                for rel in rels.findall("rel:Relationship", NS):
+                    if rel.get("Id") not in used_rels.get(owner, ()):
+                        rels.remove(rel)
+                blob = etree.tostring(rels, xml_declaration=True, encoding="UTF-8", standalone=True)
+            elif name.startswith("word/media/"):
+                blob = _recompress(blob, sizes.get(name), dpi, quality)
+            compress = zipfile.ZIP_STORED if name.startswith("word/media/") else zipfile.ZIP_DEFLATED
+            zout.writestr(zipfile.ZipInfo(name, info.date_time), blob, compress_type=compress)
+    result = out.getvalue()
+    if len(result) >= len(original):
+        result = original
+    if target is not None and not (result is original and os.path.abspath(target) == os.path.abspath(source)):
+        tmp = f"{target}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(result)
+        os.replace(tmp, target)
+    return {"before": len(original), "after": len(result), "dropped": dropped}
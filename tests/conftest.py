@@ -0,0 +1,38 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+# The app reads its paths relative to the repository root and writes its
+# caches, jobs and snapshots under generated/; tests get a scratch directory
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+_scratch = tempfile.mkdtemp(prefix="quotation-tests-")
+os.environ.setdefault("QUOTE_CACHE_DIR", os.path.join(_scratch, "cache"))
+os.environ.setdefault("QUOTE_JOBS_DB", os.path.join(_scratch, "jobs.sqlite3"))
+os.environ.setdefault("QUOTE_JOBS_DIR", os.path.join(_scratch, "jobs"))
+os.environ.setdefault("CHAT_CACHE_SNAPSHOT", "")
+
+import quotation  # noqa: E402
+
+@pytest.fixture
+def fresh_variants(monkeypatch):
+    monkeypatch.setattr(quotation, "_variants", {})
+    monkeypatch.setattr(quotation, "_segment_templates", {})
+
+@pytest.fixture
+def variants_from_disk(fresh_variants, tmp_path):
+    # As in production: `flask compile-templates`, then load_compiled() at import
+    compiled_dir = str(tmp_path / "compiled")
+    report = quotation.compile_all(compiled_dir)
+    assert not any(report.values()), report
+    assert quotation.load_compiled(compiled_dir) == quotation.STORAGE_TYPES
+
+@pytest.fixture
+def client():
+    from app import app
+
+    return app.test_client()
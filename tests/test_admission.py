@@ -0,0 +1,56 @@
+import threading
+import time
+
+import pytest
+
+from admission import Overloaded, RenderGate
+
+def waiter(gate, results):
+    def run():
+        try:
+            gate.acquire()
+        except Overloaded as e:
+            results.append(e.reason)
+        else:
+            results.append("admitted")
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread
+
+def test_queue_full_is_rejected():
+    gate = RenderGate(limit=1, max_queue=0, timeout=1)
+    gate.acquire()
+    with pytest.raises(Overloaded, match="queue is full"):
+        gate.acquire()
+    assert gate.stats()["rejected"] == 1
+
+def test_waiter_gets_released_slot():
+    gate = RenderGate(limit=1, max_queue=1, timeout=5)
+    gate.acquire()
+    results = []
+    thread = waiter(gate, results)
+    while not gate.queued:
+        time.sleep(0.01)
+    gate.release()
+    thread.join(5)
+    assert results == ["admitted"]
+    assert gate.stats()["in_flight"] == 1
+
+def test_timed_out_waiter_passes_on_its_wakeup(monkeypatch):
+    gate = RenderGate(limit=1, max_queue=2, timeout=0.05)
+    gate.acquire()
+    notified = []
+    notify = gate._cond.notify
+    monkeypatch.setattr(gate._cond, "notify", lambda *args: notified.append(1) or notify(*args))
+    with pytest.raises(Overloaded, match="timed out"):
+        gate.acquire()
+    assert notified == [1]
+    assert gate.stats()["timed_out"] == 1 and gate.stats()["queued"] == 0
+
+def test_slot_is_released_on_error():
+    gate = RenderGate(limit=1, max_queue=0, timeout=1)
+    with pytest.raises(RuntimeError):
+        with gate.slot():
+            raise RuntimeError
+    with gate.slot():
+        assert gate.stats()["in_flight"] == 1
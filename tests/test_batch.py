@@ -0,0 +1,36 @@
+import io
+import json
+import zipfile
+
+import pytest
+
+import batch
+import quotation
+
+ITEMS = [
+    {"storage_type": storage_type, "volume": str(100 + i), "days": "30", "wms": "Yes", "commodity": f"Goods {i}"}
+    for i, storage_type in enumerate(quotation.STORAGE_TYPES)
+]
+
+def read_zip(blob):
+    with zipfile.ZipFile(io.BytesIO(blob)) as z:
+        manifest = json.loads(z.read("manifest.json"))
+        documents = {name: z.read(name) for name in z.namelist() if name != "manifest.json"}
+    return manifest, documents
+
+@pytest.mark.parametrize("engine", quotation.ENGINES)
+def test_batch_zip(variants_from_disk, client, engine):
+    response = client.post(f"/generate/batch?engine={engine}", json=ITEMS + [{"storage_type": "AC", "volume": "lots"}])
+    assert response.status_code == 200
+    manifest, documents = read_zip(response.data)
+    assert manifest["engine"] == engine
+    assert manifest["rendered"] == len(ITEMS) and manifest["failed"] == 1
+    assert len(documents) == len(ITEMS)
+    for name, blob in documents.items():
+        assert quotation.unfilled_placeholders(blob) == [], name
+
+def test_unfilled_placeholders_fail_the_item(monkeypatch):
+    monkeypatch.setattr(quotation, "placeholders", lambda quote, commodity, today_str: {})
+    manifest, documents = read_zip(b"".join(batch.stream_zip(ITEMS[:1], "01 Jan 2026", engine="segments")))
+    assert documents == {}
+    assert manifest["items"][0]["error"].startswith("placeholders left unfilled: {{")
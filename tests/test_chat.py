@@ -0,0 +1,65 @@
+import random
+
+import pytest
+
+import chat
+
+@pytest.mark.parametrize("message, expected", [
+    ("wms system", "warehouse management system"),
+    ("temp zone", "temperature zone"),
+    ("reefer truck", "refrigerated truck"),
+    ("reefer trucks", "reefer truck"),
+    ("20feet container", "20 ft container"),
+    ("how r u?", "how are you"),
+    ("howru", "how are you"),
+    ("how r units charged?", "how are units charged"),
+    ("how r unloading charges calculated", "how are unloading charges calculated"),
+    ("how r urgent deliveries handled", "how are urgent deliveries handled"),
+    ("w/h  ru", "whow are you"),
+    ("T&C", "terms and conditions"),
+])
+def test_normalize(message, expected):
+    assert chat.normalize(message) == expected
+    assert chat.normalize_sequential(message) == expected
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_single_pass_matches_rewrites_in_order(seed):
+    for sample in chat.normalizer_samples(20000, seed):
+        assert chat.normalize(sample) == chat.normalize_sequential(sample), sample
+
+def index_samples(count, seed):
+    # Every indexed literal on its own, then random runs of literals, words
+    # and separators, normalised as a message would be
+    literals = sorted(chat._RULES_BY_LITERAL)
+    words = ["storage", "rate", "ac", "the", "what", "is", "for", "per", "chamber", "3", "?"]
+    rng = random.Random(seed)
+    samples = list(literals)
+    for _ in range(count):
+        tokens = [rng.choice(rng.choice([literals, words])) for _ in range(rng.randint(1, 5))]
+        samples.append(chat.normalize(rng.choice([" ", "", "  "]).join(tokens)))
+    return samples
+
+@pytest.mark.parametrize("seed", [0, 1])
+def test_index_finds_the_rule_a_full_walk_finds(seed):
+    for message in index_samples(5000, seed):
+        candidates = set(chat._candidates(message))
+        expected = None, chat.FALLBACK
+        for position, rule in enumerate(chat.RULES):
+            reply = rule.answer(message)
+            if reply is not None:
+                expected = rule.intent, reply
+                break
+        assert expected[0] is None or position in candidates, message
+        assert chat._evaluate(message)[:2] == expected, message
+
+def test_chat_batch(client):
+    response = client.post("/chat/batch", json={"messages": ["hi", "ac storage rate"]})
+    assert response.status_code == 200
+    results = response.get_json()["results"]
+    assert len(results) == 2 and all(result["reply"] for result in results)
+
+@pytest.mark.parametrize("item", [None, 5, ["hi"], {"message": "hi"}, True])
+def test_chat_batch_rejects_non_string_messages(client, item):
+    response = client.post("/chat/batch", json=["hi", item])
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "message 1 is not a string"}
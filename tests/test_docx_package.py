@@ -0,0 +1,60 @@
+import io
+import zipfile
+
+from lxml import etree
+import pytest
+
+import docx_package
+import quotation
+from test_quotation import MAPPING
+
+def members(blob):
+    with zipfile.ZipFile(io.BytesIO(blob)) as z:
+        assert z.testzip() is None
+        return {info.filename: z.read(info) for info in z.infolist()}
+
+def canonical(blob):
+    # Untouched parts keep the template's own XML declaration and line breaks,
+    # and python-docx writes content types and relationships in its own order
+    parts = {}
+    for name, data in members(blob).items():
+        if name.endswith((".xml", ".rels")):
+            root = etree.fromstring(data)
+            if name == "[Content_Types].xml" or name.endswith(".rels"):
+                data = sorted(etree.tostring(child, method="c14n") for child in root)
+            else:
+                data = etree.tostring(root, method="c14n")
+        parts[name] = data
+    return parts
+
+def save(storage_type, passthrough):
+    buffer = io.BytesIO()
+    quotation.save(quotation.new_document(storage_type, MAPPING), buffer, passthrough=passthrough)
+    return buffer.getvalue()
+
+@pytest.mark.parametrize("storage_type", quotation.STORAGE_TYPES)
+def test_passthrough_matches_python_docx(fresh_variants, storage_type):
+    passthrough, plain = save(storage_type, True), save(storage_type, False)
+    assert canonical(passthrough) == canonical(plain)
+
+def test_untouched_parts_are_copied_compressed(fresh_variants):
+    blob = save("AC", True)
+    archive = quotation._archives.get(quotation.variant("AC").part.package)
+    with zipfile.ZipFile(io.BytesIO(blob)) as z:
+        for info in z.infolist():
+            if info.filename.startswith("word/media/"):
+                raw = archive.raw(info.filename)
+                assert (info.compress_type, info.CRC, info.compress_size) == (raw.method, raw.crc, len(raw.data))
+
+def test_stream_entries_matches_write_entries():
+    entries = [
+        ("a.xml", docx_package.deflate(b"<a>" + b"x" * 1000 + b"</a>")),
+        ("b.docx", docx_package.stored(b"PK not really")),
+        ("dir/ü.txt", docx_package.deflate(b"")),
+    ]
+    buffer = io.BytesIO()
+    docx_package.write_entries(entries, buffer)
+    assert b"".join(docx_package.stream_entries(entries)) == buffer.getvalue()
+    assert members(buffer.getvalue()) == {
+        "a.xml": b"<a>" + b"x" * 1000 + b"</a>", "b.docx": b"PK not really", "dir/ü.txt": b"",
+    }
@@ -0,0 +1,78 @@
+import sqlite3
+import threading
+import time
+
+import pytest
+
+import batch
+import jobs
+import quotation
+
+VALUES = {"storage_type": "AC", "volume": "120", "days": "30", "wms": "Yes", "commodity": "Goods"}
+
+@pytest.fixture
+def store(tmp_path):
+    return jobs.JobStore(str(tmp_path / "jobs.sqlite3"), str(tmp_path / "artefacts"))
+
+def submit(store, engine="docx"):
+    return store.submit({"values": VALUES, "today": "01 Jan 2026", "engine": engine, "passthrough": True})
+
+@pytest.mark.parametrize("engine", quotation.ENGINES)
+def test_run_job(variants_from_disk, store, engine):
+    job_id = submit(store, engine)
+    job = store.claim("w1")
+    assert job["id"] == job_id and job["attempts"] == 1
+    assert store.claim("w2") is None
+    jobs.run_job(store, job, ttl=60)
+    job = store.get(job_id)
+    assert job["status"] == jobs.DONE
+    with open(job["artefact"], "rb") as f:
+        assert quotation.unfilled_placeholders(f.read()) == []
+    view = jobs.describe(job)
+    assert view["filename"] == "Quotation_Goods.docx"
+    assert "artefact" not in view and "payload" not in view
+
+def test_failed_job_hides_the_traceback(store, monkeypatch):
+    def render_item(*args):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(batch, "render_item", render_item)
+    job_id = submit(store)
+    jobs.run_job(store, store.claim("w1"), ttl=60)
+    view = jobs.describe(store.get(job_id))
+    assert view["status"] == jobs.FAILED
+    assert view["error"] == "render failed: boom"
+
+def test_requeue_stale_spares_jobs_with_a_heartbeat(store):
+    busy, hung = submit(store), submit(store)
+    store.claim("w1")
+    store.claim("w2")
+    with sqlite3.connect(store.path) as db:
+        db.execute("UPDATE jobs SET started = ?, heartbeat = ?", (time.time() - 600, time.time() - 600))
+    store.beat(busy, "w1")
+    assert store.requeue_stale(stale_after=300, max_attempts=3) == (1, 0)
+    assert store.get(busy)["status"] == jobs.RUNNING
+    assert store.get(hung)["status"] == jobs.QUEUED
+    # A worker whose job was taken away doesn't claim it back by beating
+    store.beat(hung, "w2")
+    assert store.get(hung)["heartbeat"] is None
+
+def test_keep_alive_beats_until_done(store):
+    job_id = submit(store)
+    store.claim("w1")
+    done = threading.Event()
+    thread = threading.Thread(target=jobs._keep_alive, args=(store, job_id, "w1", 0.01, done))
+    thread.start()
+    first = store.get(job_id)["heartbeat"]
+    time.sleep(0.1)
+    done.set()
+    thread.join()
+    assert store.get(job_id)["heartbeat"] > first
+
+def test_old_database_gains_the_heartbeat_column(tmp_path):
+    path = str(tmp_path / "old.sqlite3")
+    with sqlite3.connect(path) as db:
+        db.executescript(jobs._SCHEMA.replace("    heartbeat REAL,\n", ""))
+    store = jobs.JobStore(path, str(tmp_path / "artefacts"))
+    submit(store)
+    assert store.claim("w1")["heartbeat"] is not None
@@ -0,0 +1,105 @@
+import io
+import zipfile
+
+import docx
+import pytest
+
+import quotation
+
+# Every value different, with characters that need escaping or become
+# w:tab / w:br elements
+MAPPING = {
+    key: f"{key[2:-2].title()} & <{i}>\tx\ny"
+    for i, key in enumerate([
+        "{{STORAGE_TYPE}}", "{{DAYS}}", "{{VOLUME}}", "{{UNIT}}", "{{WMS_STATUS}}",
+        "{{UNIT_RATE}}", "{{STORAGE_FEE}}", "{{WMS_FEE}}", "{{TOTAL_FEE}}",
+        "{{TODAY_DATE}}", "{{COMMODITY}}",
+    ])
+}
+
+def document_xml(blob):
+    with zipfile.ZipFile(io.BytesIO(blob)) as z:
+        return {
+            name: z.read(name).decode("utf-8")
+            for name in z.namelist()
+            if name.startswith("word/") and name.endswith(".xml")
+        }
+
+def paragraphs(blob):
+    return [p.text for p in docx.Document(io.BytesIO(blob)).paragraphs]
+
+def render(storage_type, engine):
+    buffer = io.BytesIO()
+    assert quotation.render(storage_type, MAPPING, buffer, engine=engine) == engine
+    return buffer.getvalue()
+
+def render_mapping(storage_type, mapping, engine):
+    buffer = io.BytesIO()
+    quotation.render(storage_type, mapping, buffer, engine=engine)
+    return buffer.getvalue()
+
+@pytest.mark.parametrize("storage_type", quotation.STORAGE_TYPES)
+def test_engines_agree_on_variants_loaded_from_disk(variants_from_disk, storage_type):
+    same, outputs = quotation.compare_engines(storage_type, MAPPING)
+    assert same
+    assert not any("{{" in text for text in outputs["segments"])
+
+@pytest.mark.parametrize("storage_type", quotation.STORAGE_TYPES)
+def test_engines_agree_on_variants_compiled_in_memory(fresh_variants, storage_type):
+    same, outputs = quotation.compare_engines(storage_type, MAPPING)
+    assert same
+    assert not any("{{" in text for text in outputs["segments"])
+
+@pytest.mark.parametrize("engine", quotation.ENGINES)
+def test_no_placeholders_left_in_output(variants_from_disk, engine):
+    for storage_type in quotation.STORAGE_TYPES:
+        for name, xml in document_xml(render(storage_type, engine)).items():
+            assert "{{" not in xml, (storage_type, name)
+
+def test_unfilled_placeholders(variants_from_disk):
+    assert quotation.unfilled_placeholders(render("AC", "segments")) == []
+    buffer = io.BytesIO()
+    partial = {key: value for key, value in MAPPING.items() if key != "{{TODAY_DATE}}"}
+    quotation.render("AC", partial, buffer, engine="segments")
+    assert quotation.unfilled_placeholders(buffer.getvalue()) == ["{{TODAY_DATE}}"]
+
+QUOTE = {"storage_type": "AC", "volume": "100", "days": "30", "wms": "Yes", "commodity": "Tyres"}
+
+def test_cache_hit_can_still_be_revised(variants_from_disk, client):
+    first = client.post("/generate?engine=docx", data=dict(QUOTE, commodity="Revisable tyres"))
+    assert first.headers["X-Quote-Revision"] in ("rendered", "cached")
+    again = client.post("/generate?engine=docx", data=dict(QUOTE, commodity="Revisable tyres"))
+    assert again.headers["X-Quote-Revision"] == "cached"
+    assert again.data == first.data
+    quote_id = again.headers["X-Quote-Id"]
+
+    revised = client.post("/generate?engine=docx", data=dict(QUOTE, commodity="Revisable tyres", volume="250", quote_id=quote_id))
+    assert revised.headers["X-Quote-Id"] == quote_id
+    assert revised.headers["X-Quote-Revision"] == "patched"
+    text = "".join(document_xml(revised.data).values())
+    assert "250" in text and "{{" not in text
+
+    # Reads the same as the revised quote requested from scratch
+    fresh = client.post("/generate?engine=docx", data=dict(QUOTE, commodity="Revisable tyres", volume="250"))
+    assert paragraphs(revised.data) == paragraphs(fresh.data)
+
+@pytest.mark.parametrize("name, canonical", [
+    ("KIZAD", "Open Yard – KIZAD"),
+    ("mussafah open yard", "Open Yard – Mussafah"),
+    ("Chemical AC", "Chemicals AC"),
+    ("Standard Non-AC", "Non-AC"),
+])
+def test_catalogue_names_render_their_entry_template(fresh_variants, name, canonical):
+    # The template and VAS block come from the catalogue entry that prices it
+    assert quotation.template_path_for(name) == quotation.template_path_for(canonical)
+    assert quotation.kept_vas_tag(name) == quotation.kept_vas_tag(canonical)
+    mapping = dict(MAPPING, **{"{{STORAGE_TYPE}}": name})
+    expected = paragraphs(render_mapping(canonical, mapping, "docx"))
+    for engine in quotation.ENGINES:
+        assert paragraphs(render_mapping(name, mapping, engine)) == expected
+
+def test_free_text_types_keep_substring_rules():
+    assert quotation.kept_vas_tag("bonded chemical store") == "VAS_CHEMICAL"
+    assert quotation.kept_vas_tag("open yard (chemical)") == "VAS_OPENYARD"
+    assert quotation.template_path_for("open yard (chemical)").endswith("Open Yard VAS.docx")
+    assert quotation.kept_vas_tag("cold room") == "VAS_STANDARD"
@@ -0,0 +1,47 @@
+import os
+
+from quote_cache import QuoteCache
+
+def age(cache, key, seconds):
+    path = cache._path(key)
+    st = os.stat(path)
+    os.utime(path, (st.st_atime, st.st_mtime - seconds))
+
+def test_get_put(tmp_path):
+    cache = QuoteCache(str(tmp_path), 100)
+    key = QuoteCache.key("AC", 100.0, 30)
+    assert cache.get(key) is None
+    cache.put(key, b"x" * 10)
+    assert cache.get(key) == b"x" * 10
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = QuoteCache(str(tmp_path), 30)
+    for i, key in enumerate("abc"):
+        cache.put(key, b"x" * 10)
+        age(cache, key, 100 - i)
+    cache.get("a")  # now the most recently used
+    cache.put("d", b"x" * 10)
+    assert cache.get("b") is None
+    assert all(cache.get(key) is not None for key in "acd")
+    assert cache.stats()["bytes"] == 30
+
+def test_workers_sharing_a_directory_keep_one_limit(tmp_path):
+    workers = [QuoteCache(str(tmp_path), 50) for _ in range(3)]
+    for i in range(12):
+        workers[i % 3].put(f"key{i}", b"x" * 10)
+        age(workers[0], f"key{i}", 100 - i)
+    total = sum(os.path.getsize(tmp_path / name) for name in os.listdir(tmp_path))
+    assert total <= 50
+    assert set(os.listdir(tmp_path)) == {f"key{i}.docx" for i in range(7, 12)}
+
+def test_existing_directory_is_trimmed_on_start(tmp_path):
+    QuoteCache(str(tmp_path), 100).put("old", b"x" * 80)
+    cache = QuoteCache(str(tmp_path), 50)
+    assert cache.get("old") is None
+    assert cache.stats()["evictions"] == 1
+
+def test_oversized_quote_is_not_cached(tmp_path):
+    cache = QuoteCache(str(tmp_path), 5)
+    cache.put("big", b"x" * 10)
+    assert cache.get("big") is None
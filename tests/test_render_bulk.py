@@ -0,0 +1,34 @@
+import csv
+import json
+import os
+
+from click.testing import CliRunner
+import pytest
+
+import quotation
+import render_bulk
+
+@pytest.mark.parametrize("engine", quotation.ENGINES)
+def test_bulk_render(variants_from_disk, tmp_path, engine):
+    input_path = tmp_path / "quotes.csv"
+    with open(input_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["storage_type", "volume", "days", "wms", "commodity"])
+        for i, storage_type in enumerate(quotation.STORAGE_TYPES):
+            writer.writerow([storage_type, 100 + i, 30, "Yes", f"Goods {i}"])
+    output_dir = tmp_path / "out"
+    result = CliRunner().invoke(render_bulk.main, [
+        str(input_path), "--output-dir", str(output_dir), "--workers", "1", "--engine", engine,
+    ])
+    assert result.exit_code == 0, result.output
+    with open(output_dir / "manifest.json", encoding="utf-8") as f:
+        manifest = json.load(f)
+    assert manifest["rendered"] == len(quotation.STORAGE_TYPES)
+    for item in manifest["items"]:
+        with open(os.path.join(output_dir, item["file"]), "rb") as f:
+            assert quotation.unfilled_placeholders(f.read()) == []
+
+def test_bulk_render_fails_on_unfilled_placeholders(monkeypatch):
+    monkeypatch.setattr(quotation, "placeholders", lambda quote, commodity, today_str: {})
+    result = render_bulk._render((0, {"storage_type": "AC", "volume": "10", "days": "30"}, os.devnull, "01 Jan 2026"))
+    assert result["error"].startswith("placeholders left unfilled: {{")
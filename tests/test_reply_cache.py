@@ -0,0 +1,72 @@
+import json
+
+import pytest
+
+import chat
+from reply_cache import ReplyCache
+
+def test_evicts_least_recently_used():
+    cache = ReplyCache(2, "v1")
+    cache.put("a", ("ia", "A"))
+    cache.put("b", ("ib", "B"))
+    assert cache.get("a") == ("ia", "A")  # now the most recently used
+    cache.put("c", ("ic", "C"))
+    assert cache.get("b") is None
+    assert cache.get("a") and cache.get("c")
+    assert cache.stats()["evictions"] == 1
+
+def test_new_version_purges():
+    cache = ReplyCache(4, "v1")
+    cache.put("a", ("ia", "A"))
+    cache.check_version("v1")
+    assert cache.get("a")
+    cache.check_version("v2")
+    assert cache.get("a") is None
+    assert cache.version == "v2" and cache.stats()["purges"] == 1
+
+def test_snapshot_round_trip(tmp_path):
+    path = str(tmp_path / "snapshot" / "chat.json")
+    cache = ReplyCache(8, "v1")
+    for key in "abcd":
+        cache.put(key, (f"i{key}", key.upper()))
+    cache.get("a")
+    assert cache.save(path, 3) == 3  # a, d, c: most recently used first
+    restored = ReplyCache(2, "v1")
+    assert restored.load(path) == 2
+    assert restored.get("b") is None and restored.get("c") is None
+    assert restored.get("a") == ("ia", "A") and restored.get("d") == ("id", "D")
+    restored.put("e", ("ie", "E"))
+    assert restored.get("a") is None  # restored in their old order, a oldest
+
+@pytest.mark.parametrize("content", ['{"version": "v0", "entries": [["a", "ia", "A"]]}', "not json", '{"entries": []}', '{"version": "v1", "entries": [1]}'])
+def test_unusable_snapshot_is_a_cold_start(tmp_path, content):
+    path = tmp_path / "chat.json"
+    path.write_text(content, encoding="utf-8")
+    cache = ReplyCache(8, "v1")
+    assert cache.load(str(path)) == 0
+    assert cache.stats()["entries"] == 0
+    assert ReplyCache(8, "v1").load(str(tmp_path / "missing.json")) == 0
+
+def test_cached_replies_match_evaluation(monkeypatch):
+    cache = ReplyCache(64, chat._replies_version())
+    monkeypatch.setattr(chat, "reply_cache", cache)
+    messages = ["ac storage rate", "what is wms", "kizad open yard", "asdfgh", "ac storage rate"]
+    for message in messages:
+        assert chat._cached_evaluate(message)[:2] == chat._evaluate(message)[:2]
+    assert cache.stats()["hits"] == 1
+
+def test_rates_change_empties_the_cache(monkeypatch):
+    cache = ReplyCache(64, chat._replies_version())
+    monkeypatch.setattr(chat, "reply_cache", cache)
+    chat._cached_evaluate("ac storage rate")
+    monkeypatch.setattr(chat, "_replies_version", lambda: "edited")
+    chat._cached_evaluate("ac storage rate")
+    assert cache.stats()["purges"] == 1 and cache.stats()["hits"] == 0
+
+def test_snapshot_file_format(tmp_path):
+    cache = ReplyCache(8, "v1")
+    cache.put("a", (None, "fallback"))
+    cache.save(str(tmp_path / "chat.json"), 10)
+    assert json.loads((tmp_path / "chat.json").read_text(encoding="utf-8")) == {
+        "version": "v1", "entries": [["a", None, "fallback"]],
+    }
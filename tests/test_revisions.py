@@ -0,0 +1,71 @@
+import io
+
+import pytest
+
+import quotation
+from test_quotation import MAPPING, document_xml
+
+def render_revision(store, storage_type, mapping, quote_id=None):
+    buffer = io.BytesIO()
+    quote_id, patched = quotation.render_revision(store, storage_type, mapping, buffer, quote_id=quote_id)
+    return quote_id, patched, buffer.getvalue()
+
+def fresh(storage_type, mapping):
+    buffer = io.BytesIO()
+    quotation.render(storage_type, mapping, buffer, engine="docx")
+    return document_xml(buffer.getvalue())
+
+def test_store_evicts_least_recently_used():
+    store = quotation.RevisionStore(max_entries=2)
+    a, b = store.put("a"), store.put("b")
+    assert store.get(a) == "a"  # now the most recently used
+    c = store.put("c")
+    assert store.get(b) is None
+    assert (store.get(a), store.get(c)) == ("a", "c")
+
+def test_store_expires(monkeypatch):
+    store = quotation.RevisionStore(ttl=10)
+    now = [1000.0]
+    monkeypatch.setattr(quotation.time, "monotonic", lambda: now[0])
+    quote_id = store.put("a")
+    now[0] += 5
+    assert store.get(quote_id) == "a"  # and touched
+    now[0] += 9
+    assert store.get(quote_id) == "a"
+    now[0] += 11
+    assert store.get(quote_id) is None
+
+@pytest.mark.parametrize("storage_type", ["AC", "Open Yard – KIZAD"])
+def test_patched_revision_reads_like_a_fresh_render(fresh_variants, storage_type):
+    store = quotation.RevisionStore()
+    quote_id, patched, _ = render_revision(store, storage_type, MAPPING)
+    assert quote_id and not patched
+    for key, value in [("{{VOLUME}}", "250"), ("{{COMMODITY}}", "Tyres & <rims>"), ("{{TOTAL_FEE}}", "")]:
+        mapping = dict(MAPPING, **{key: value})
+        same_id, patched, blob = render_revision(store, storage_type, mapping, quote_id)
+        assert (same_id, patched) == (quote_id, True)
+        assert document_xml(blob) == fresh(storage_type, mapping)
+
+def test_other_storage_type_starts_a_new_quote(fresh_variants):
+    store = quotation.RevisionStore()
+    quote_id, _, _ = render_revision(store, "AC", MAPPING)
+    other_id, patched, blob = render_revision(store, "Non-AC", MAPPING, quote_id)
+    assert other_id != quote_id and not patched
+    assert document_xml(blob) == fresh("Non-AC", MAPPING)
+
+def test_unknown_id_or_type_renders_in_full(fresh_variants):
+    store = quotation.RevisionStore()
+    quote_id, patched, blob = render_revision(store, "AC", MAPPING, "no-such-quote")
+    assert quote_id != "no-such-quote" and not patched
+    assert render_revision(store, "cold room", MAPPING)[:2] == (None, False)
+
+def test_tracked_quote_is_built_when_revised(fresh_variants):
+    store = quotation.RevisionStore()
+    quote_id = quotation.track_revision(store, "AC", MAPPING)
+    assert store.get(quote_id).doc is None
+    mapping = dict(MAPPING, **{"{{DAYS}}": "90"})
+    assert quotation.track_revision(store, "AC", mapping, quote_id) == quote_id
+    revised = dict(mapping, **{"{{VOLUME}}": "7"})
+    _, patched, blob = render_revision(store, "AC", revised, quote_id)
+    assert patched
+    assert document_xml(blob) == fresh("AC", revised)